@@ -3,7 +3,7 @@
 
 This script demonstrates:
 1. Create a notebook
-2. Add multiple sources of different types
+2. Add multiple sources of different types concurrently
 3. Handle errors gracefully
 4. Report import status
 
@@ -53,38 +53,47 @@ async def main():
 
         results = {"success": [], "failed": []}
 
+        def record(label: str, name: str, outcome) -> None:
+            if isinstance(outcome, BaseException):
+                results["failed"].append(f"{label}: {name} - {outcome}")
+                print(f"  - Failed: {name}")
+            else:
+                results["success"].append(f"{label}: {outcome.title}")
+                print(f"  + {outcome.title}")
+
+        # Each batch is submitted with asyncio.gather so the requests overlap
+        # on the client's connection pool instead of waiting on each other.
+        # return_exceptions=True keeps one bad source from aborting the batch.
+
         # 2. Import URLs
         print("Importing URLs...")
-        for url in SOURCES["urls"]:
-            try:
-                source = await client.sources.add_url(nb.id, url)
-                results["success"].append(f"URL: {source.title}")
-                print(f"  + {source.title}")
-            except Exception as e:
-                results["failed"].append(f"URL: {url} - {e}")
-                print(f"  - Failed: {url}")
+        outcomes = await asyncio.gather(
+            *(client.sources.add_url(nb.id, url) for url in SOURCES["urls"]),
+            return_exceptions=True,
+        )
+        for url, outcome in zip(SOURCES["urls"], outcomes, strict=True):
+            record("URL", url, outcome)
 
         # 3. Import YouTube videos (add_url auto-detects YouTube)
         print("\nImporting YouTube videos...")
-        for url in SOURCES["youtube"]:
-            try:
-                source = await client.sources.add_url(nb.id, url)
-                results["success"].append(f"YouTube: {source.title}")
-                print(f"  + {source.title}")
-            except Exception as e:
-                results["failed"].append(f"YouTube: {url} - {e}")
-                print(f"  - Failed: {url}")
+        outcomes = await asyncio.gather(
+            *(client.sources.add_url(nb.id, url) for url in SOURCES["youtube"]),
+            return_exceptions=True,
+        )
+        for url, outcome in zip(SOURCES["youtube"], outcomes, strict=True):
+            record("YouTube", url, outcome)
 
         # 4. Import text content
         print("\nImporting text content...")
-        for item in SOURCES["text"]:
-            try:
-                source = await client.sources.add_text(nb.id, item["title"], item["content"])
-                results["success"].append(f"Text: {source.title}")
-                print(f"  + {source.title}")
-            except Exception as e:
-                results["failed"].append(f"Text: {item['title']} - {e}")
-                print(f"  - Failed: {item['title']}")
+        outcomes = await asyncio.gather(
+            *(
+                client.sources.add_text(nb.id, item["title"], item["content"])
+                for item in SOURCES["text"]
+            ),
+            return_exceptions=True,
+        )
+        for item, outcome in zip(SOURCES["text"], outcomes, strict=True):
+            record("Text", item["title"], outcome)
 
         # 5. Report results
         print("\n" + "=" * 40)
@@ -28,19 +28,21 @@ async def main():
         notebook = await client.notebooks.create("Video Demo Notebook")
         print(f"Created notebook: {notebook.id}")
 
-        # Add sources for video content
+        # Add sources for video content. The uploads don't depend on each
+        # other, so start them all at once instead of one after another.
         print("\nAdding sources...")
         urls = [
             "https://en.wikipedia.org/wiki/Quantum_computing",
+            "https://en.wikipedia.org/wiki/Qubit",
         ]
 
-        for url in urls:
-            source = await client.sources.add_url(notebook.id, url)
+        sources = await asyncio.gather(*(client.sources.add_url(notebook.id, url) for url in urls))
+        for url, source in zip(urls, sources, strict=True):
             print(f"  Added: {source.title or url}")
 
-        # Wait for source processing
+        # Wait for processing; continues as soon as the last source is ready
         print("\nWaiting for source processing...")
-        await asyncio.sleep(5)
+        await client.sources.wait_for_sources(notebook.id, [s.id for s in sources])
 
         # Step 2: Generate the video overview
         # Video generation options:
@@ -34,91 +34,177 @@ except PackageNotFoundError:
         __version__,
     )
 
-# Public API: Authentication
-from .auth import DEFAULT_STORAGE_PATH, AuthTokens
-
-# Public API: Client
-from .client import NotebookLMClient
-
-# Public API: Exceptions (centralized in exceptions.py)
-from .exceptions import (
-    # Domain: Artifacts
-    ArtifactDownloadError,
-    ArtifactError,
-    ArtifactNotFoundError,
-    ArtifactNotReadyError,
-    ArtifactParseError,
-    # RPC Protocol
-    AuthError,
-    # Domain: Chat
-    ChatError,
-    ClientError,
-    # Validation/Config
-    ConfigurationError,
-    DecodingError,
-    # Network
-    NetworkError,
-    # Domain: Notebooks
-    NotebookError,
-    # Base
-    NotebookLMError,
-    NotebookNotFoundError,
-    RateLimitError,
-    RPCError,
-    RPCTimeoutError,
-    ServerError,
-    # Domain: Sources
-    SourceAddError,
-    SourceError,
-    SourceNotFoundError,
-    SourceProcessingError,
-    SourceTimeoutError,
-    UnknownRPCMethodError,
-    ValidationError,
-)
-
-# Public API: Types and dataclasses
-from .types import (
-    Artifact,
-    ArtifactType,
-    AskResult,
-    AudioFormat,
-    AudioLength,
-    ChatGoal,
-    ChatMode,
-    ChatReference,
-    ChatResponseLength,
-    ConversationTurn,
-    DriveMimeType,
-    ExportType,
-    GenerationStatus,
-    InfographicDetail,
-    InfographicOrientation,
-    Note,
-    Notebook,
-    NotebookDescription,
-    QuizDifficulty,
-    QuizQuantity,
-    ReportFormat,
-    ReportSuggestion,
-    ShareAccess,
-    SharedUser,
-    SharePermission,
-    ShareStatus,
-    ShareViewLevel,
-    SlideDeckFormat,
-    SlideDeckLength,
-    Source,
-    SourceFulltext,
-    SourceStatus,
-    SourceType,
-    # Enums for configuration
-    SuggestedTopic,
-    # Warnings
-    UnknownTypeWarning,
-    VideoFormat,
-    VideoStyle,
-)
+# Public API names are resolved lazily (PEP 562) so that importing a
+# submodule such as notebooklm.paths or notebooklm.auth doesn't pay for the
+# whole client/types import graph. Type checkers see the eager imports below.
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    # Public API: Authentication
+    from .auth import DEFAULT_STORAGE_PATH, AuthTokens
+
+    # Public API: Client
+    from .client import NotebookLMClient
+
+    # Public API: Exceptions (centralized in exceptions.py)
+    from .exceptions import (
+        # Domain: Artifacts
+        ArtifactDownloadError,
+        ArtifactError,
+        ArtifactNotFoundError,
+        ArtifactNotReadyError,
+        ArtifactParseError,
+        # RPC Protocol
+        AuthError,
+        # Domain: Chat
+        ChatError,
+        ClientError,
+        # Validation/Config
+        ConfigurationError,
+        DecodingError,
+        # Network
+        NetworkError,
+        # Domain: Notebooks
+        NotebookError,
+        # Base
+        NotebookLMError,
+        NotebookNotFoundError,
+        RateLimitError,
+        RPCError,
+        RPCTimeoutError,
+        ServerError,
+        # Domain: Sources
+        SourceAddError,
+        SourceError,
+        SourceNotFoundError,
+        SourceProcessingError,
+        SourceTimeoutError,
+        UnknownRPCMethodError,
+        ValidationError,
+    )
+
+    # Public API: Types and dataclasses
+    from .types import (
+        Artifact,
+        ArtifactType,
+        AskResult,
+        AudioFormat,
+        AudioLength,
+        ChatGoal,
+        ChatMode,
+        ChatReference,
+        ChatResponseLength,
+        ConversationTurn,
+        DriveMimeType,
+        ExportType,
+        GenerationStatus,
+        InfographicDetail,
+        InfographicOrientation,
+        Note,
+        Notebook,
+        NotebookDescription,
+        QuizDifficulty,
+        QuizQuantity,
+        ReportFormat,
+        ReportSuggestion,
+        ShareAccess,
+        SharedUser,
+        SharePermission,
+        ShareStatus,
+        ShareViewLevel,
+        SlideDeckFormat,
+        SlideDeckLength,
+        Source,
+        SourceFulltext,
+        SourceStatus,
+        SourceType,
+        # Enums for configuration
+        SuggestedTopic,
+        # Warnings
+        UnknownTypeWarning,
+        VideoFormat,
+        VideoStyle,
+    )
+
+# Public name -> module it is imported from on first access. Must match the
+# TYPE_CHECKING imports above and __all__ below (enforced by a unit test).
+_LAZY_MODULES: dict[str, str] = {
+    "DEFAULT_STORAGE_PATH": ".auth",
+    "AuthTokens": ".auth",
+    "NotebookLMClient": ".client",
+    **dict.fromkeys(
+        (
+            "ArtifactDownloadError",
+            "ArtifactError",
+            "ArtifactNotFoundError",
+            "ArtifactNotReadyError",
+            "ArtifactParseError",
+            "AuthError",
+            "ChatError",
+            "ClientError",
+            "ConfigurationError",
+            "DecodingError",
+            "NetworkError",
+            "NotebookError",
+            "NotebookLMError",
+            "NotebookNotFoundError",
+            "RateLimitError",
+            "RPCError",
+            "RPCTimeoutError",
+            "ServerError",
+            "SourceAddError",
+            "SourceError",
+            "SourceNotFoundError",
+            "SourceProcessingError",
+            "SourceTimeoutError",
+            "UnknownRPCMethodError",
+            "ValidationError",
+        ),
+        ".exceptions",
+    ),
+    **dict.fromkeys(
+        (
+            "Artifact",
+            "ArtifactType",
+            "AskResult",
+            "AudioFormat",
+            "AudioLength",
+            "ChatGoal",
+            "ChatMode",
+            "ChatReference",
+            "ChatResponseLength",
+            "ConversationTurn",
+            "DriveMimeType",
+            "ExportType",
+            "GenerationStatus",
+            "InfographicDetail",
+            "InfographicOrientation",
+            "Note",
+            "Notebook",
+            "NotebookDescription",
+            "QuizDifficulty",
+            "QuizQuantity",
+            "ReportFormat",
+            "ReportSuggestion",
+            "ShareAccess",
+            "SharedUser",
+            "SharePermission",
+            "ShareStatus",
+            "ShareViewLevel",
+            "SlideDeckFormat",
+            "SlideDeckLength",
+            "Source",
+            "SourceFulltext",
+            "SourceStatus",
+            "SourceType",
+            "SuggestedTopic",
+            "UnknownTypeWarning",
+            "VideoFormat",
+            "VideoStyle",
+        ),
+        ".types",
+    ),
+}
 
 __all__ = [
     "__version__",
@@ -205,13 +291,21 @@ __all__ = [
 
 
 def __getattr__(name: str):
-    """Emit deprecation warnings for deprecated module-level names.
+    """Resolve public names on first access and handle deprecated names.
 
-    This allows us to provide backward-compatible imports with warnings.
-    Uses globals() caching to avoid duplicate warnings on repeated access.
+    Public API names are imported from their defining module on first use.
+    Deprecated names emit a warning to provide backward-compatible imports.
+    Uses globals() caching so each name is resolved (and warned about) once.
     """
+    import importlib
     import warnings
 
+    module_name = _LAZY_MODULES.get(name)
+    if module_name is not None:
+        value = getattr(importlib.import_module(module_name, __name__), name)
+        globals()[name] = value
+        return value
+
     if name == "StudioContentType":
         from .rpc.types import ArtifactTypeCode
 
@@ -225,3 +319,8 @@ def __getattr__(name: str):
         return ArtifactTypeCode
 
     raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__() -> list[str]:
+    """Include lazily resolved public names in dir(notebooklm)."""
+    return sorted(set(globals()) | set(_LAZY_MODULES))
@@ -12,6 +12,7 @@ import html
 import json
 import logging
 import re
+import time
 from pathlib import Path
 from typing import TYPE_CHECKING, Any
 
@@ -259,18 +260,30 @@ class ArtifactsAPI:
         logger.debug("Listing artifacts in notebook %s", notebook_id)
         artifacts: list[Artifact] = []
 
-        # Fetch studio artifacts (audio, video, reports, etc.)
-        params = [[2], notebook_id, 'NOT artifact.status = "ARTIFACT_STATUS_SUGGESTED"']
-        result = await self._core.rpc_call(
-            RPCMethod.LIST_ARTIFACTS,
-            params,
-            source_path=f"/notebook/{notebook_id}",
-            allow_null=True,
-        )
-
-        artifacts_data: list[Any] = []
-        if result and isinstance(result, list) and len(result) > 0:
-            artifacts_data = result[0] if isinstance(result[0], list) else result
+        # Fetch studio artifacts (audio, video, reports, etc.) and, unless
+        # filtering to another type, mind maps from the notes system in parallel.
+        # Mind maps are only ever persisted as notes, so a mind-map-only listing
+        # skips the studio call.
+        artifacts_data: builtins.list[Any] = []
+        mind_maps: builtins.list[Any] = []
+        if artifact_type == ArtifactType.MIND_MAP:
+            mind_maps = await self._list_mind_maps_or_empty(notebook_id)
+        elif artifact_type is None:
+            # Let both calls finish before raising so no request is left in flight
+            studio_result: builtins.list[Any] | BaseException
+            mind_maps_result: builtins.list[Any] | BaseException
+            studio_result, mind_maps_result = await asyncio.gather(
+                self._list_raw(notebook_id),
+                self._list_mind_maps_or_empty(notebook_id),
+                return_exceptions=True,
+            )
+            if isinstance(studio_result, BaseException):
+                raise studio_result
+            if isinstance(mind_maps_result, BaseException):
+                raise mind_maps_result
+            artifacts_data, mind_maps = studio_result, mind_maps_result
+        else:
+            artifacts_data = await self._list_raw(notebook_id)
 
         for art_data in artifacts_data:
             if isinstance(art_data, list) and len(art_data) > 0:
@@ -278,23 +291,25 @@ class ArtifactsAPI:
                 if artifact_type is None or artifact.kind == artifact_type:
                     artifacts.append(artifact)
 
-        # Fetch mind maps from notes system (if not filtering to non-mind-map type)
-        if artifact_type is None or artifact_type == ArtifactType.MIND_MAP:
-            try:
-                mind_maps = await self._notes.list_mind_maps(notebook_id)
-                for mm_data in mind_maps:
-                    mind_map_artifact = Artifact.from_mind_map(mm_data)
-                    if mind_map_artifact is not None:  # None means deleted (status=2)
-                        if artifact_type is None or mind_map_artifact.kind == artifact_type:
-                            artifacts.append(mind_map_artifact)
-            except (RPCError, httpx.HTTPError) as e:
-                # Network/API errors - log and continue with studio artifacts
-                # This ensures users can see their audio/video/reports even if
-                # the mind maps endpoint is temporarily unavailable
-                logger.warning("Failed to fetch mind maps: %s", e)
+        for mm_data in mind_maps:
+            mind_map_artifact = Artifact.from_mind_map(mm_data)
+            if mind_map_artifact is not None:  # None means deleted (status=2)
+                if artifact_type is None or mind_map_artifact.kind == artifact_type:
+                    artifacts.append(mind_map_artifact)
 
         return artifacts
 
+    async def _list_mind_maps_or_empty(self, notebook_id: str) -> builtins.list[Any]:
+        """List mind maps, returning [] if the notes endpoint fails."""
+        try:
+            return await self._notes.list_mind_maps(notebook_id)
+        except (RPCError, httpx.HTTPError) as e:
+            # Network/API errors - log and continue with studio artifacts
+            # This ensures users can see their audio/video/reports even if
+            # the mind maps endpoint is temporarily unavailable
+            logger.warning("Failed to fetch mind maps: %s", e)
+            return []
+
     async def get(self, notebook_id: str, artifact_id: str) -> Artifact | None:
         """Get a specific artifact by ID.
 
@@ -1585,31 +1600,59 @@ class ArtifactsAPI:
         Returns:
             GenerationStatus with current status.
         """
+        statuses = await self.poll_statuses(notebook_id, [task_id])
+        return statuses[task_id]
+
+    async def poll_statuses(
+        self, notebook_id: str, task_ids: builtins.list[str]
+    ) -> dict[str, GenerationStatus]:
+        """Poll the status of several generation tasks at once.
+
+        All tasks are looked up in a single artifact listing, so polling N
+        tasks costs one RPC rather than N.
+
+        Args:
+            notebook_id: The notebook ID.
+            task_ids: The task/artifact IDs to check.
+
+        Returns:
+            Dict mapping each task ID to its GenerationStatus, in the order given.
+            Tasks not found in the notebook are reported as "pending".
+        """
         # List all artifacts and find by ID (no poll-by-ID RPC exists)
         artifacts_data = await self._list_raw(notebook_id)
+        wanted = set(task_ids)
+        found: dict[str, GenerationStatus] = {}
         for art in artifacts_data:
-            if len(art) > 0 and art[0] == task_id:
-                status_code = art[4] if len(art) > 4 else 0
-                artifact_type = art[2] if len(art) > 2 else 0
-
-                # For media artifacts, verify URL availability before reporting completion.
-                # The API may set status=COMPLETED before media URLs are populated.
-                if status_code == ArtifactStatus.COMPLETED:
-                    if not self._is_media_ready(art, artifact_type):
-                        type_name = self._get_artifact_type_name(artifact_type)
-                        logger.debug(
-                            "Artifact %s (type=%s) status=COMPLETED but media not ready, "
-                            "continuing poll",
-                            task_id,
-                            type_name,
-                        )
-                        # Downgrade to PROCESSING to continue polling
-                        status_code = ArtifactStatus.PROCESSING
+            if len(art) > 0 and isinstance(art[0], str) and art[0] in wanted:
+                found.setdefault(art[0], self._status_from_raw(art))
 
-                status = artifact_status_to_str(status_code)
-                return GenerationStatus(task_id=task_id, status=status)
+        return {
+            task_id: found.get(task_id) or GenerationStatus(task_id=task_id, status="pending")
+            for task_id in task_ids
+        }
 
-        return GenerationStatus(task_id=task_id, status="pending")
+    def _status_from_raw(self, art: builtins.list[Any]) -> GenerationStatus:
+        """Build a GenerationStatus from one raw LIST_ARTIFACTS entry."""
+        task_id = art[0]
+        status_code = art[4] if len(art) > 4 else 0
+        artifact_type = art[2] if len(art) > 2 else 0
+
+        # For media artifacts, verify URL availability before reporting completion.
+        # The API may set status=COMPLETED before media URLs are populated.
+        if status_code == ArtifactStatus.COMPLETED:
+            if not self._is_media_ready(art, artifact_type):
+                type_name = self._get_artifact_type_name(artifact_type)
+                logger.debug(
+                    "Artifact %s (type=%s) status=COMPLETED but media not ready, continuing poll",
+                    task_id,
+                    type_name,
+                )
+                # Downgrade to PROCESSING to continue polling
+                status_code = ArtifactStatus.PROCESSING
+
+        status = artifact_status_to_str(status_code)
+        return GenerationStatus(task_id=task_id, status=status)
 
     async def wait_for_completion(
         self,
@@ -1957,44 +2000,40 @@ class ArtifactsAPI:
         # Use temp file to avoid leaving corrupted partial files on failure
         temp_file = output_file.with_suffix(output_file.suffix + ".tmp")
 
-        # Load cookies with domain info for cross-domain redirect handling
-        cookies = load_httpx_cookies()
-
-        # Use granular timeouts: 10s to connect, 30s per chunk read/write
-        # This allows large files to download without timeout while still
-        # detecting network failures quickly
-        timeout = httpx.Timeout(connect=10.0, read=30.0, write=30.0, pool=30.0)
+        # Reuse one connection pool across downloads (e.g. download --all)
+        client = self._core.get_download_client()
 
+        start = time.monotonic()
         try:
-            # Nested context managers required: client.stream() returns an async
-            # context manager that must run within the client's scope
-            async with httpx.AsyncClient(  # noqa: SIM117
-                cookies=cookies,
-                follow_redirects=True,
-                timeout=timeout,
-            ) as client:
-                async with client.stream("GET", url) as response:
-                    response.raise_for_status()
-
-                    content_type = response.headers.get("content-type", "")
-                    if "text/html" in content_type:
-                        raise ArtifactDownloadError(
-                            "media",
-                            details="Download failed: received HTML instead of media file. "
-                            "Authentication may have expired. Run 'notebooklm login'.",
-                        )
+            async with client.stream("GET", url) as response:
+                response.raise_for_status()
+
+                content_type = response.headers.get("content-type", "")
+                if "text/html" in content_type:
+                    raise ArtifactDownloadError(
+                        "media",
+                        details="Download failed: received HTML instead of media file. "
+                        "Authentication may have expired. Run 'notebooklm login'.",
+                    )
 
-                    # Stream to file in chunks to handle large files efficiently
-                    total_bytes = 0
-                    with open(temp_file, "wb") as f:
-                        async for chunk in response.aiter_bytes(chunk_size=65536):
-                            f.write(chunk)
-                            total_bytes += len(chunk)
-
-                    # Only move to final location on success
-                    temp_file.rename(output_file)
-                    logger.debug("Downloaded %s (%d bytes)", url[:60], total_bytes)
-                    return output_path
+                # Stream to file in chunks to handle large files efficiently
+                total_bytes = 0
+                with open(temp_file, "wb") as f:
+                    async for chunk in response.aiter_bytes(chunk_size=65536):
+                        f.write(chunk)
+                        total_bytes += len(chunk)
+
+                # Only move to final location on success
+                temp_file.rename(output_file)
+                elapsed = time.monotonic() - start
+                logger.debug(
+                    "Downloaded %s (%d bytes, %.3fs, %.1f MB/s)",
+                    url[:60],
+                    total_bytes,
+                    elapsed,
+                    total_bytes / 1e6 / elapsed if elapsed else 0.0,
+                )
+                return output_path
         except Exception:
             # Clean up partial temp file on any failure
             temp_file.unlink(missing_ok=True)
@@ -1,6 +1,7 @@
 """Core infrastructure for NotebookLM API client."""
 
 import asyncio
+import importlib.util
 import logging
 import time
 from collections import OrderedDict
@@ -10,7 +11,7 @@ from urllib.parse import urlencode
 
 import httpx
 
-from .auth import AuthTokens
+from .auth import AuthTokens, load_httpx_cookies
 from .rpc import (
     BATCHEXECUTE_URL,
     AuthError,
@@ -35,6 +36,22 @@ MAX_CONVERSATION_CACHE_SIZE = 100
 DEFAULT_TIMEOUT = 30.0
 DEFAULT_CONNECT_TIMEOUT = 10.0  # Connection establishment timeout
 
+# Idle connections are kept for this long. httpx's 5s default would drop the
+# connection between polls in wait_for_completion and similar loops, forcing a
+# fresh TCP+TLS handshake on every poll.
+KEEPALIVE_EXPIRY = 60.0
+MAX_KEEPALIVE_CONNECTIONS = 4
+# Retries for failed connection attempts only (never for sent requests)
+CONNECT_RETRIES = 1
+
+# HTTP/2 (one multiplexed connection for concurrent RPCs) needs the optional
+# h2 package, installed with the ``fast`` extra
+HTTP2_AVAILABLE = importlib.util.find_spec("h2") is not None
+
+# Media downloads stream large files: fail fast on connect, but time out per
+# chunk rather than for the whole transfer
+DOWNLOAD_TIMEOUT = httpx.Timeout(connect=10.0, read=30.0, write=30.0, pool=30.0)
+
 # Auth error detection patterns (case-insensitive)
 AUTH_ERROR_PATTERNS = (
     "authentication",
@@ -116,6 +133,7 @@ class ClientCore:
         self._refresh_lock: asyncio.Lock | None = asyncio.Lock() if refresh_callback else None
         self._refresh_task: asyncio.Task[AuthTokens] | None = None
         self._http_client: httpx.AsyncClient | None = None
+        self._download_client: httpx.AsyncClient | None = None
         # Request ID counter for chat API (must be unique per request)
         self._reqid_counter: int = 100000
         # OrderedDict for FIFO eviction when cache exceeds MAX_CONVERSATION_CACHE_SIZE
@@ -135,12 +153,21 @@ class ClientCore:
                 write=self._timeout,
                 pool=self._timeout,
             )
+            transport = httpx.AsyncHTTPTransport(
+                http2=HTTP2_AVAILABLE,
+                limits=httpx.Limits(
+                    max_keepalive_connections=MAX_KEEPALIVE_CONNECTIONS,
+                    keepalive_expiry=KEEPALIVE_EXPIRY,
+                ),
+                retries=CONNECT_RETRIES,
+            )
             self._http_client = httpx.AsyncClient(
                 headers={
                     "Content-Type": "application/x-www-form-urlencoded;charset=UTF-8",
                     "Cookie": self.auth.cookie_header,
                 },
                 timeout=timeout,
+                transport=transport,
             )
 
     async def close(self) -> None:
@@ -151,6 +178,35 @@ class ClientCore:
         if self._http_client:
             await self._http_client.aclose()
             self._http_client = None
+        if self._download_client:
+            await self._download_client.aclose()
+            self._download_client = None
+
+    def get_download_client(self) -> httpx.AsyncClient:
+        """Get the HTTP client for media downloads, creating it on first use.
+
+        Downloads follow redirects to Google's content domains, so this client
+        carries the domain-scoped cookies from storage instead of the flat
+        Cookie header used for RPC calls. It is shared by every download made
+        through this core and closed together with it.
+
+        Cookies are loaded from storage once, when the client is created, so a
+        long-lived client keeps using them even if storage is updated later
+        (e.g. by `notebooklm login` in another shell). Open a new client to
+        pick up replaced cookies.
+
+        Raises:
+            RuntimeError: If client is not initialized or already closed.
+        """
+        if not self.is_open:
+            raise RuntimeError("Client not initialized. Use 'async with' context.")
+        if self._download_client is None:
+            self._download_client = httpx.AsyncClient(
+                cookies=load_httpx_cookies(),
+                follow_redirects=True,
+                timeout=DOWNLOAD_TIMEOUT,
+            )
+        return self._download_client
 
     @property
     def is_open(self) -> bool:
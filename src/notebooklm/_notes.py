@@ -286,16 +286,16 @@ class NotesAPI:
         title = ""
 
         if len(item) > 1:
-            if isinstance(item[1], str):
-                # Old format: [note_id, content]
-                content = item[1]
-            elif isinstance(item[1], list):
+            if isinstance(item[1], list):
                 # New format: [note_id, [note_id, content, metadata, None, title]]
                 inner = item[1]
                 if len(inner) > 1 and isinstance(inner[1], str):
                     content = inner[1]
                 if len(inner) > 4 and isinstance(inner[4], str):
                     title = inner[4]
+            elif isinstance(item[1], str):
+                # Old format: [note_id, content]
+                content = item[1]
 
         return Note(
             id=str(note_id),
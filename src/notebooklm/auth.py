@@ -404,6 +404,24 @@ def extract_session_id_from_html(html: str, final_url: str = "") -> str:
     return match.group(1)
 
 
+def _read_storage_file(path: Path) -> dict[str, Any]:
+    """Read and parse a storage state file.
+
+    Opens the file directly instead of checking exists() first, saving a
+    stat call on every CLI invocation.
+
+    Raises:
+        FileNotFoundError: If the storage file doesn't exist.
+    """
+    try:
+        raw = path.read_bytes()
+    except FileNotFoundError:
+        raise FileNotFoundError(
+            f"Storage file not found: {path}\nRun 'notebooklm login' to authenticate first."
+        ) from None
+    return json.loads(raw)
+
+
 def _load_storage_state(path: Path | None = None) -> dict[str, Any]:
     """Load Playwright storage state from file or environment variable.
 
@@ -427,11 +445,7 @@ def _load_storage_state(path: Path | None = None) -> dict[str, Any]:
     """
     # 1. Explicit path takes precedence (from --storage CLI flag)
     if path:
-        if not path.exists():
-            raise FileNotFoundError(
-                f"Storage file not found: {path}\nRun 'notebooklm login' to authenticate first."
-            )
-        return json.loads(path.read_text(encoding="utf-8"))
+        return _read_storage_file(path)
 
     # 2. Check for inline JSON env var (CI-friendly, no file writes needed)
     # Note: Use 'in' check instead of walrus to catch empty string case
@@ -459,14 +473,7 @@ def _load_storage_state(path: Path | None = None) -> dict[str, Any]:
         return storage_state
 
     # 3. Fall back to file (respects NOTEBOOKLM_HOME)
-    storage_path = get_storage_path()
-
-    if not storage_path.exists():
-        raise FileNotFoundError(
-            f"Storage file not found: {storage_path}\nRun 'notebooklm login' to authenticate first."
-        )
-
-    return json.loads(storage_path.read_text(encoding="utf-8"))
+    return _read_storage_file(get_storage_path())
 
 
 def load_auth_from_storage(path: Path | None = None) -> dict[str, str]:
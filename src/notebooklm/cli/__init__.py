@@ -27,12 +27,15 @@ from .helpers import (
     CONTEXT_FILE,
     clear_context,
     cli_name_to_artifact_type,
+    confirm_action,
     # Console
     console,
+    format_timestamp,
     get_artifact_type_display,
     get_auth_tokens,
     # Auth
     get_client,
+    get_context,
     get_current_conversation,
     get_current_notebook,
     get_source_type_display,
@@ -42,9 +45,13 @@ from .helpers import (
     json_error_response,
     # Output
     json_output_response,
+    load_auth_tokens,
     require_notebook,
+    resolve_artifact,
     resolve_artifact_id,
+    resolve_artifact_ids,
     resolve_notebook_id,
+    resolve_source,
     resolve_source_id,
     # Async
     run_async,
@@ -100,9 +107,11 @@ __all__ = [
     # Auth
     "get_client",
     "get_auth_tokens",
+    "load_auth_tokens",
     # Context
     "CONTEXT_FILE",
     "BROWSER_PROFILE_DIR",
+    "get_context",
     "get_current_notebook",
     "set_current_notebook",
     "clear_context",
@@ -110,11 +119,16 @@ __all__ = [
     "set_current_conversation",
     "require_notebook",
     "resolve_notebook_id",
+    "resolve_source",
     "resolve_source_id",
+    "resolve_artifact",
     "resolve_artifact_id",
+    "resolve_artifact_ids",
     # Errors
     "handle_error",
     "handle_auth_error",
+    # Prompts
+    "confirm_action",
     # Decorators
     "with_client",
     # Option Decorators
@@ -133,4 +147,5 @@ __all__ = [
     "cli_name_to_artifact_type",
     "get_artifact_type_display",
     "get_source_type_display",
+    "format_timestamp",
 ]
@@ -11,24 +11,49 @@ Commands:
     suggestions Get AI-suggested report topics
 """
 
+import asyncio
 import json
 
 import click
 from rich.table import Table
 
-from ..client import NotebookLMClient
 from ..rpc import ExportType
+from ..types import ArtifactType
 from .helpers import (
     cli_name_to_artifact_type,
+    confirm_action,
     console,
+    format_timestamp,
     get_artifact_type_display,
     json_output_response,
     require_notebook,
+    resolve_artifact,
     resolve_artifact_id,
+    resolve_artifact_ids,
     resolve_notebook_id,
     with_client,
 )
 
+# `artifact list --type` names, converted with cli_name_to_artifact_type()
+_ARTIFACT_TYPE_CHOICE = click.Choice(
+    [
+        "all",
+        "audio",
+        "video",
+        "slide-deck",
+        "quiz",
+        "flashcard",
+        "infographic",
+        "data-table",
+        "mind-map",
+        "report",
+    ]
+)
+
+
+# Maximum concurrent delete calls for `artifact delete`
+DELETE_CONCURRENCY = 4
+
 
 @click.group()
 def artifact():
@@ -63,20 +88,7 @@ def artifact():
 @click.option(
     "--type",
     "artifact_type",
-    type=click.Choice(
-        [
-            "all",
-            "audio",
-            "video",
-            "slide-deck",
-            "quiz",
-            "flashcard",
-            "infographic",
-            "data-table",
-            "mind-map",
-            "report",
-        ]
-    ),
+    type=_ARTIFACT_TYPE_CHOICE,
     default="all",
     help="Filter by type",
 )
@@ -88,13 +100,17 @@ def artifact_list(ctx, notebook_id, artifact_type, json_output, client_auth):
     type_filter = cli_name_to_artifact_type(artifact_type)
 
     async def _run():
+        from ..client import NotebookLMClient
+
         async with NotebookLMClient(client_auth) as client:
             nb_id_resolved = await resolve_notebook_id(client, nb_id)
             # artifacts.list() already includes mind maps from notes system
-            artifacts = await client.artifacts.list(nb_id_resolved, artifact_type=type_filter)
-
             if json_output:
-                nb = await client.notebooks.get(nb_id_resolved)
+                # The title lookup is independent of the artifact list; fetch both at once
+                artifacts, nb = await asyncio.gather(
+                    client.artifacts.list(nb_id_resolved, artifact_type=type_filter),
+                    client.notebooks.get(nb_id_resolved),
+                )
                 data = {
                     "notebook_id": nb_id_resolved,
                     "notebook_title": nb.title if nb else None,
@@ -116,6 +132,8 @@ def artifact_list(ctx, notebook_id, artifact_type, json_output, client_auth):
                 json_output_response(data)
                 return
 
+            with console.status("Fetching artifacts..."):
+                artifacts = await client.artifacts.list(nb_id_resolved, artifact_type=type_filter)
             if not artifacts:
                 console.print(f"[yellow]No {artifact_type} artifacts found[/yellow]")
                 return
@@ -129,7 +147,7 @@ def artifact_list(ctx, notebook_id, artifact_type, json_output, client_auth):
 
             for art in artifacts:
                 type_display = get_artifact_type_display(art)
-                created = art.created_at.strftime("%Y-%m-%d %H:%M") if art.created_at else "-"
+                created = format_timestamp(art.created_at)
                 table.add_row(art.id, art.title, type_display, created, art.status_str)
 
             console.print(table)
@@ -155,19 +173,18 @@ def artifact_get(ctx, artifact_id, notebook_id, client_auth):
     nb_id = require_notebook(notebook_id)
 
     async def _run():
+        from ..client import NotebookLMClient
+
         async with NotebookLMClient(client_auth) as client:
             nb_id_resolved = await resolve_notebook_id(client, nb_id)
-            resolved_id = await resolve_artifact_id(client, nb_id_resolved, artifact_id)
-            art = await client.artifacts.get(nb_id_resolved, resolved_id)
+            art = await resolve_artifact(client, nb_id_resolved, artifact_id)
             if art:
                 console.print(f"[bold cyan]Artifact:[/bold cyan] {art.id}")
                 console.print(f"[bold]Title:[/bold] {art.title}")
                 console.print(f"[bold]Type:[/bold] {get_artifact_type_display(art)}")
                 console.print(f"[bold]Status:[/bold] {art.status_str}")
                 if art.created_at:
-                    console.print(
-                        f"[bold]Created:[/bold] {art.created_at.strftime('%Y-%m-%d %H:%M')}"
-                    )
+                    console.print(f"[bold]Created:[/bold] {format_timestamp(art.created_at)}")
             else:
                 console.print("[yellow]Artifact not found[/yellow]")
 
@@ -193,27 +210,30 @@ def artifact_rename(ctx, artifact_id, new_title, notebook_id, client_auth):
     nb_id = require_notebook(notebook_id)
 
     async def _run():
+        from ..client import NotebookLMClient
+
         async with NotebookLMClient(client_auth) as client:
             nb_id_resolved = await resolve_notebook_id(client, nb_id)
-            resolved_id = await resolve_artifact_id(client, nb_id_resolved, artifact_id)
+            # The artifact list includes mind maps, so one lookup covers both
+            art = await resolve_artifact(client, nb_id_resolved, artifact_id)
+            if art is None:
+                raise click.ClickException(f"Artifact not found: {artifact_id}")
 
-            # Check if this is a mind map (stored with notes, not artifacts)
-            mind_maps = await client.notes.list_mind_maps(nb_id_resolved)
-            for mm in mind_maps:
-                if mm[0] == resolved_id:
-                    raise click.ClickException("Mind maps cannot be renamed")
+            # Mind maps are stored with notes, not artifacts
+            if art.kind == ArtifactType.MIND_MAP:
+                raise click.ClickException("Mind maps cannot be renamed")
 
-            await client.artifacts.rename(nb_id_resolved, resolved_id, new_title)
+            await client.artifacts.rename(nb_id_resolved, art.id, new_title)
             # The rename API returns None; if no exception was raised, the operation succeeded.
             # We display the requested new_title as confirmation.
-            console.print(f"[green]Renamed artifact:[/green] {resolved_id}")
+            console.print(f"[green]Renamed artifact:[/green] {art.id}")
             console.print(f"[bold]New title:[/bold] {new_title}")
 
     return _run()
 
 
 @artifact.command("delete")
-@click.argument("artifact_id")
+@click.argument("artifact_ids", nargs=-1, required=True)
 @click.option(
     "-n",
     "--notebook",
@@ -223,34 +243,77 @@ def artifact_rename(ctx, artifact_id, new_title, notebook_id, client_auth):
 )
 @click.option("--yes", "-y", is_flag=True, help="Skip confirmation")
 @with_client
-def artifact_delete(ctx, artifact_id, notebook_id, yes, client_auth):
-    """Delete an artifact.
+def artifact_delete(ctx, artifact_ids, notebook_id, yes, client_auth):
+    """Delete one or more artifacts.
 
-    ARTIFACT_ID can be a full UUID or a partial prefix (e.g., 'abc' matches 'abc123...').
+    Each ARTIFACT_ID can be a full UUID or a partial prefix (e.g., 'abc' matches
+    'abc123...'). Multiple artifacts are deleted a few at a time; failures are
+    reported per artifact.
+
+    \b
+    Examples:
+      notebooklm artifact delete abc123
+      notebooklm artifact delete abc123 def456 -y
     """
     nb_id = require_notebook(notebook_id)
 
     async def _run():
+        from ..client import NotebookLMClient
+
         async with NotebookLMClient(client_auth) as client:
             nb_id_resolved = await resolve_notebook_id(client, nb_id)
-            resolved_id = await resolve_artifact_id(client, nb_id_resolved, artifact_id)
+            resolved_ids = await resolve_artifact_ids(client, nb_id_resolved, artifact_ids)
+            resolved_ids = list(dict.fromkeys(resolved_ids))
 
-            if not yes and not click.confirm(f"Delete artifact {resolved_id}?"):
+            if len(resolved_ids) == 1:
+                prompt = f"Delete artifact {resolved_ids[0]}?"
+            else:
+                prompt = f"Delete {len(resolved_ids)} artifacts?"
+            if not confirm_action(prompt, yes):
                 return
 
-            # Check if this is a mind map (stored with notes)
+            # Ask the notes API directly: the artifact list treats a failed
+            # mind-map lookup as "no mind maps", which would send mind-map IDs
+            # to the wrong delete RPC
             mind_maps = await client.notes.list_mind_maps(nb_id_resolved)
-            for mm in mind_maps:
-                if mm[0] == resolved_id:
-                    await client.notes.delete(nb_id_resolved, resolved_id)
-                    console.print(f"[yellow]Cleared mind map:[/yellow] {resolved_id}")
-                    console.print(
-                        "[dim]Note: Mind maps are cleared, not removed. Google may garbage collect them later.[/dim]"
-                    )
-                    return
+            mind_map_ids = {mm[0] for mm in mind_maps if mm}
+            semaphore = asyncio.Semaphore(DELETE_CONCURRENCY)
+
+            async def _delete(art_id: str) -> bool:
+                async with semaphore:
+                    # Mind maps are stored with notes and are cleared instead
+                    if art_id in mind_map_ids:
+                        await client.notes.delete(nb_id_resolved, art_id)
+                        return True
+                    await client.artifacts.delete(nb_id_resolved, art_id)
+                    return False
+
+            results = await asyncio.gather(
+                *(_delete(art_id) for art_id in resolved_ids), return_exceptions=True
+            )
 
-            await client.artifacts.delete(nb_id_resolved, resolved_id)
-            console.print(f"[green]Deleted artifact:[/green] {resolved_id}")
+            table = Table(title="Delete Results")
+            table.add_column("ID", style="cyan", no_wrap=True)
+            table.add_column("Result")
+
+            failed = cleared_mind_map = False
+            for art_id, result in zip(resolved_ids, results, strict=True):
+                if isinstance(result, BaseException):
+                    failed = True
+                    table.add_row(art_id, f"[red]Failed:[/red] {result}")
+                elif result:
+                    cleared_mind_map = True
+                    table.add_row(art_id, "[yellow]Cleared mind map[/yellow]")
+                else:
+                    table.add_row(art_id, "[green]Deleted[/green]")
+
+            console.print(table)
+            if cleared_mind_map:
+                console.print(
+                    "[dim]Note: Mind maps are cleared, not removed. Google may garbage collect them later.[/dim]"
+                )
+            if failed:
+                raise SystemExit(1)
 
     return _run()
 
@@ -275,6 +338,8 @@ def artifact_export(ctx, artifact_id, notebook_id, title, export_type, client_au
     nb_id = require_notebook(notebook_id)
 
     async def _run():
+        from ..client import NotebookLMClient
+
         async with NotebookLMClient(client_auth) as client:
             nb_id_resolved = await resolve_notebook_id(client, nb_id)
             resolved_id = await resolve_artifact_id(client, nb_id_resolved, artifact_id)
@@ -294,7 +359,7 @@ def artifact_export(ctx, artifact_id, notebook_id, title, export_type, client_au
 
 
 @artifact.command("poll")
-@click.argument("task_id")
+@click.argument("task_ids", nargs=-1, required=True)
 @click.option(
     "-n",
     "--notebook",
@@ -303,16 +368,23 @@ def artifact_export(ctx, artifact_id, notebook_id, title, export_type, client_au
     help="Notebook ID (uses current if not set)",
 )
 @with_client
-def artifact_poll(ctx, task_id, notebook_id, client_auth):
-    """Poll generation status."""
+def artifact_poll(ctx, task_ids, notebook_id, client_auth):
+    """Poll generation status of one or more tasks.
+
+    All tasks are checked with a single request. To block until a task
+    finishes, use 'artifact wait'.
+    """
     nb_id = require_notebook(notebook_id)
 
     async def _run():
+        from ..client import NotebookLMClient
+
         async with NotebookLMClient(client_auth) as client:
             nb_id_resolved = await resolve_notebook_id(client, nb_id)
-            status = await client.artifacts.poll_status(nb_id_resolved, task_id)
+            statuses = await client.artifacts.poll_statuses(nb_id_resolved, list(task_ids))
             console.print("[bold cyan]Task Status:[/bold cyan]")
-            console.print(status)
+            for status in statuses.values():
+                console.print(status)
 
     return _run()
 
@@ -336,14 +408,23 @@ def artifact_poll(ctx, task_id, notebook_id, client_auth):
     "--interval",
     default=2,
     type=int,
-    help="Seconds between status checks (default: 2)",
+    help="Initial seconds between status checks (default: 2)",
+)
+@click.option(
+    "--max-interval",
+    default=10,
+    type=int,
+    help="Maximum seconds between status checks as polling backs off (default: 10)",
 )
 @click.option("--json", "json_output", is_flag=True, help="Output as JSON")
 @with_client
-def artifact_wait(ctx, artifact_id, notebook_id, timeout, interval, json_output, client_auth):
+def artifact_wait(
+    ctx, artifact_id, notebook_id, timeout, interval, max_interval, json_output, client_auth
+):
     """Wait for artifact generation to complete.
 
     Blocks until the artifact is completed, failed, or timeout is reached.
+    Polling starts at --interval and doubles up to --max-interval.
     Useful for scripts and LLM agents that need to wait for generation.
 
     \b
@@ -354,6 +435,8 @@ def artifact_wait(ctx, artifact_id, notebook_id, timeout, interval, json_output,
     nb_id = require_notebook(notebook_id)
 
     async def _run():
+        from ..client import NotebookLMClient
+
         async with NotebookLMClient(client_auth) as client:
             nb_id_resolved = await resolve_notebook_id(client, nb_id)
             resolved_id = await resolve_artifact_id(client, nb_id_resolved, artifact_id)
@@ -362,7 +445,8 @@ def artifact_wait(ctx, artifact_id, notebook_id, timeout, interval, json_output,
                 status = await client.artifacts.wait_for_completion(
                     nb_id_resolved,
                     resolved_id,
-                    poll_interval=float(interval),
+                    initial_interval=float(interval),
+                    max_interval=float(max(interval, max_interval)),
                     timeout=float(timeout),
                 )
 
@@ -416,6 +500,8 @@ def artifact_suggestions(ctx, notebook_id, json_output, client_auth):
     nb_id = require_notebook(notebook_id)
 
     async def _run():
+        from ..client import NotebookLMClient
+
         async with NotebookLMClient(client_auth) as client:
             nb_id_resolved = await resolve_notebook_id(client, nb_id)
             suggestions = await client.artifacts.suggest_reports(nb_id_resolved)
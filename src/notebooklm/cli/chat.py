@@ -6,17 +6,16 @@ Commands:
     history    Get conversation history or clear local cache
 """
 
+import asyncio
 import logging
 
 import click
 from rich.table import Table
 
-from ..client import NotebookLMClient
-from ..types import ChatMode
+from ..types import ChatGoal, ChatMode, ChatResponseLength
 from .helpers import (
     console,
-    get_current_conversation,
-    get_current_notebook,
+    get_context,
     json_output_response,
     require_notebook,
     resolve_notebook_id,
@@ -27,6 +26,21 @@ from .helpers import (
 
 logger = logging.getLogger(__name__)
 
+# configure --mode / --response-length choices mapped to API enums
+_CHAT_MODES = {
+    "default": ChatMode.DEFAULT,
+    "learning-guide": ChatMode.LEARNING_GUIDE,
+    "concise": ChatMode.CONCISE,
+    "detailed": ChatMode.DETAILED,
+}
+_RESPONSE_LENGTHS = {
+    "default": ChatResponseLength.DEFAULT,
+    "longer": ChatResponseLength.LONGER,
+    "shorter": ChatResponseLength.SHORTER,
+}
+_CHAT_MODE_CHOICE = click.Choice(list(_CHAT_MODES))
+_RESPONSE_LENGTH_CHOICE = click.Choice(list(_RESPONSE_LENGTHS))
+
 
 def _determine_conversation_id(
     *,
@@ -50,13 +64,14 @@ def _determine_conversation_id(
         return explicit_conversation_id
 
     # Check if user switched notebooks via --notebook flag
-    cached_notebook = get_current_notebook()
+    context = get_context()
+    cached_notebook = context.get("notebook_id")
     if explicit_notebook_id and cached_notebook and resolved_notebook_id != cached_notebook:
         if not json_output:
             console.print("[dim]Different notebook specified, starting new conversation...[/dim]")
         return None
 
-    return get_current_conversation()
+    return context.get("conversation_id")
 
 
 async def _get_latest_conversation_from_history(
@@ -85,6 +100,18 @@ async def _get_latest_conversation_from_history(
     return None
 
 
+def _clear_history_cache(ctx, param, value):
+    """Eager --clear callback: finish before with_client loads auth.
+
+    The conversation cache lives in a client's memory, so a fresh CLI process
+    has nothing to drop and no reason to authenticate or build a client.
+    """
+    if not value or ctx.resilient_parsing:
+        return
+    console.print("[green]Local conversation cache cleared[/green]")
+    ctx.exit()
+
+
 def register_chat_commands(cli):
     """Register chat commands on the main CLI group."""
 
@@ -137,6 +164,8 @@ def register_chat_commands(cli):
         nb_id = require_notebook(notebook_id)
 
         async def _run():
+            from ..client import NotebookLMClient
+
             async with NotebookLMClient(client_auth) as client:
                 nb_id_resolved = await resolve_notebook_id(client, nb_id)
                 effective_conv_id = _determine_conversation_id(
@@ -147,13 +176,16 @@ def register_chat_commands(cli):
                     json_output=json_output,
                 )
 
-                # If no conversation ID yet, try to get the most recent one from history
+                # If no conversation ID yet, try to get the most recent one from history.
+                # The history lookup and source ID resolution are independent, so
+                # overlap them instead of paying two sequential round-trips.
                 if effective_conv_id is None and not new_conversation:
-                    effective_conv_id = await _get_latest_conversation_from_history(
-                        client, nb_id_resolved, json_output
+                    effective_conv_id, sources = await asyncio.gather(
+                        _get_latest_conversation_from_history(client, nb_id_resolved, json_output),
+                        resolve_source_ids(client, nb_id_resolved, source_ids),
                     )
-
-                sources = await resolve_source_ids(client, nb_id_resolved, source_ids)
+                else:
+                    sources = await resolve_source_ids(client, nb_id_resolved, source_ids)
                 result = await client.chat.ask(
                     nb_id_resolved, question, source_ids=sources, conversation_id=effective_conv_id
                 )
@@ -192,14 +224,14 @@ def register_chat_commands(cli):
     @click.option(
         "--mode",
         "chat_mode",
-        type=click.Choice(["default", "learning-guide", "concise", "detailed"]),
+        type=_CHAT_MODE_CHOICE,
         default=None,
         help="Predefined chat mode",
     )
     @click.option("--persona", default=None, help="Custom persona prompt (up to 10,000 chars)")
     @click.option(
         "--response-length",
-        type=click.Choice(["default", "longer", "shorter"]),
+        type=_RESPONSE_LENGTH_CHOICE,
         default=None,
         help="Response verbosity",
     )
@@ -223,30 +255,17 @@ def register_chat_commands(cli):
         nb_id = require_notebook(notebook_id)
 
         async def _run():
-            from ..rpc import ChatGoal, ChatResponseLength
+            from ..client import NotebookLMClient
 
             async with NotebookLMClient(client_auth) as client:
                 nb_id_resolved = await resolve_notebook_id(client, nb_id)
                 if chat_mode:
-                    mode_map = {
-                        "default": ChatMode.DEFAULT,
-                        "learning-guide": ChatMode.LEARNING_GUIDE,
-                        "concise": ChatMode.CONCISE,
-                        "detailed": ChatMode.DETAILED,
-                    }
-                    await client.chat.set_mode(nb_id_resolved, mode_map[chat_mode])
+                    await client.chat.set_mode(nb_id_resolved, _CHAT_MODES[chat_mode])
                     console.print(f"[green]Chat mode set to: {chat_mode}[/green]")
                     return
 
                 goal = ChatGoal.CUSTOM if persona else None
-                length = None
-                if response_length:
-                    length_map = {
-                        "default": ChatResponseLength.DEFAULT,
-                        "longer": ChatResponseLength.LONGER,
-                        "shorter": ChatResponseLength.SHORTER,
-                    }
-                    length = length_map[response_length]
+                length = _RESPONSE_LENGTHS[response_length] if response_length else None
 
                 await client.chat.configure(
                     nb_id_resolved, goal=goal, response_length=length, custom_prompt=persona
@@ -279,9 +298,16 @@ def register_chat_commands(cli):
         help="Notebook ID (uses current if not set)",
     )
     @click.option("--limit", "-l", default=20, help="Number of messages")
-    @click.option("--clear", "clear_cache", is_flag=True, help="Clear local conversation cache")
+    @click.option(
+        "--clear",
+        is_flag=True,
+        is_eager=True,
+        expose_value=False,
+        callback=_clear_history_cache,
+        help="Clear local conversation cache",
+    )
     @with_client
-    def history_cmd(ctx, notebook_id, limit, clear_cache, client_auth):
+    def history_cmd(ctx, notebook_id, limit, client_auth):
         """Get conversation history or clear local cache.
 
         \b
@@ -292,15 +318,9 @@ def register_chat_commands(cli):
         """
 
         async def _run():
-            async with NotebookLMClient(client_auth) as client:
-                if clear_cache:
-                    result = client.chat.clear_cache()
-                    if result:
-                        console.print("[green]Local conversation cache cleared[/green]")
-                    else:
-                        console.print("[yellow]No cache to clear[/yellow]")
-                    return
+            from ..client import NotebookLMClient
 
+            async with NotebookLMClient(client_auth) as client:
                 nb_id = require_notebook(notebook_id)
                 nb_id_resolved = await resolve_notebook_id(client, nb_id)
                 history = await client.chat.get_history(nb_id_resolved, limit=limit)
@@ -12,24 +12,39 @@ Commands:
     flashcards   Download flashcard deck
 """
 
-import json
+import asyncio
+import logging
+import os
+import tempfile
+import time
 from pathlib import Path
 from typing import Any, TypedDict
 
 import click
+from rich.progress import BarColumn, MofNCompleteColumn, Progress, TextColumn
 
 from ..auth import AuthTokens, fetch_tokens, load_auth_from_storage
-from ..client import NotebookLMClient
 from ..types import Artifact, ArtifactType
-from .download_helpers import ArtifactDict, artifact_title_to_filename, select_artifact
+from .download_helpers import (
+    ArtifactDict,
+    artifact_title_to_filename,
+    artifact_titles_to_filenames,
+    select_artifact,
+)
 from .helpers import (
     console,
     handle_error,
+    json_output_response,
     require_notebook,
     resolve_notebook_id,
     run_async,
 )
 
+logger = logging.getLogger(__name__)
+
+# Maximum concurrent downloads for --all
+DOWNLOAD_CONCURRENCY = 4
+
 
 class ArtifactConfig(TypedDict):
     """Configuration for an artifact type."""
@@ -37,28 +52,52 @@ class ArtifactConfig(TypedDict):
     kind: ArtifactType
     extension: str
     default_dir: str
+    method: str  # ArtifactsAPI download method name
 
 
 # Artifact type configurations for download commands
 ARTIFACT_CONFIGS: dict[str, ArtifactConfig] = {
-    "audio": {"kind": ArtifactType.AUDIO, "extension": ".mp3", "default_dir": "./audio"},
-    "video": {"kind": ArtifactType.VIDEO, "extension": ".mp4", "default_dir": "./video"},
-    "report": {"kind": ArtifactType.REPORT, "extension": ".md", "default_dir": "./reports"},
-    "mind-map": {"kind": ArtifactType.MIND_MAP, "extension": ".json", "default_dir": "./mind-maps"},
+    "audio": {
+        "kind": ArtifactType.AUDIO,
+        "extension": ".mp3",
+        "default_dir": "./audio",
+        "method": "download_audio",
+    },
+    "video": {
+        "kind": ArtifactType.VIDEO,
+        "extension": ".mp4",
+        "default_dir": "./video",
+        "method": "download_video",
+    },
+    "report": {
+        "kind": ArtifactType.REPORT,
+        "extension": ".md",
+        "default_dir": "./reports",
+        "method": "download_report",
+    },
+    "mind-map": {
+        "kind": ArtifactType.MIND_MAP,
+        "extension": ".json",
+        "default_dir": "./mind-maps",
+        "method": "download_mind_map",
+    },
     "infographic": {
         "kind": ArtifactType.INFOGRAPHIC,
         "extension": ".png",
         "default_dir": "./infographic",
+        "method": "download_infographic",
     },
     "slide-deck": {
         "kind": ArtifactType.SLIDE_DECK,
         "extension": ".pdf",
         "default_dir": "./slide-decks",
+        "method": "download_slide_deck",
     },
     "data-table": {
         "kind": ArtifactType.DATA_TABLE,
         "extension": ".csv",
         "default_dir": "./data-tables",
+        "method": "download_data_table",
     },
 }
 
@@ -80,12 +119,24 @@ def download():
     pass
 
 
+def _is_case_insensitive(directory: Path) -> bool:
+    """Check whether filenames in directory compare case-insensitively.
+
+    True on the default macOS and Windows filesystems, False on most Linux
+    ones. Probes with a temporary file whose name contains uppercase letters.
+    """
+    with tempfile.NamedTemporaryFile(prefix=".NotebookLM-", dir=directory) as probe:
+        probe_path = Path(probe.name)
+        return (probe_path.parent / probe_path.name.lower()).exists()
+
+
 async def _download_artifacts_generic(
     ctx,
     artifact_type_name: str,
     artifact_kind: ArtifactType,
     file_extension: str,
     default_output_dir: str,
+    download_method: str,
     output_path: str | None,
     notebook: str | None,
     latest: bool,
@@ -110,6 +161,7 @@ async def _download_artifacts_generic(
         artifact_kind: ArtifactType enum value to filter by
         file_extension: File extension (".mp3", ".mp4", ".png", ".pdf")
         default_output_dir: Default output directory for --all flag
+        download_method: Name of the client.artifacts download method
         output_path: User-specified output path
         notebook: Notebook ID
         latest: Download latest artifact
@@ -125,6 +177,8 @@ async def _download_artifacts_generic(
     Returns:
         Result dictionary with operation details
     """
+    from ..client import NotebookLMClient
+
     # Validate conflicting flags
     if force and no_clobber:
         raise click.UsageError("Cannot specify both --force and --no-clobber")
@@ -140,240 +194,253 @@ async def _download_artifacts_generic(
     csrf, session_id = await fetch_tokens(cookies)
     auth = AuthTokens(cookies=cookies, csrf_token=csrf, session_id=session_id)
 
-    async def _download() -> dict[str, Any]:
-        async with NotebookLMClient(auth) as client:
-            nb_id_resolved = await resolve_notebook_id(client, nb_id)
-
-            # Setup download method dispatch
-            download_methods = {
-                "audio": client.artifacts.download_audio,
-                "video": client.artifacts.download_video,
-                "infographic": client.artifacts.download_infographic,
-                "slide-deck": client.artifacts.download_slide_deck,
-                "report": client.artifacts.download_report,
-                "mind-map": client.artifacts.download_mind_map,
-                "data-table": client.artifacts.download_data_table,
-            }
-            download_fn = download_methods.get(artifact_type_name)
-            if not download_fn:
-                raise ValueError(f"Unknown artifact type: {artifact_type_name}")
-
-            # Fetch artifacts
-            all_artifacts = await client.artifacts.list(nb_id_resolved)
+    async with NotebookLMClient(auth) as client:
+        nb_id_resolved = await resolve_notebook_id(client, nb_id)
 
-            # Filter by type and completed status
-            completed_artifacts = [
-                a
-                for a in all_artifacts
-                if isinstance(a, Artifact) and a.kind == artifact_kind and a.is_completed
-            ]
+        download_fn = getattr(client.artifacts, download_method)
 
-            if not completed_artifacts:
-                return {
-                    "error": f"No completed {artifact_type_name} artifacts found",
-                    "suggestion": f"Generate one with: notebooklm generate {artifact_type_name}",
-                }
+        # Fetch artifacts
+        start = time.monotonic()
+        all_artifacts = await client.artifacts.list(nb_id_resolved)
+        logger.debug("Listed %d artifacts (%.3fs)", len(all_artifacts), time.monotonic() - start)
 
-            # Convert to dict format for selection logic
-            type_artifacts: list[ArtifactDict] = [
-                {
-                    "id": a.id,
-                    "title": a.title,
-                    "created_at": int(a.created_at.timestamp()) if a.created_at else 0,
-                }
-                for a in completed_artifacts
-            ]
-
-            # Helper for file conflict resolution
-            def _resolve_conflict(path: Path) -> tuple[Path | None, dict | None]:
-                if not path.exists():
-                    return path, None
-
-                if no_clobber:
-                    return None, {
-                        "status": "skipped",
-                        "reason": "file exists",
-                        "path": str(path),
-                    }
+        # Filter by type and completed status
+        completed_artifacts = [
+            a
+            for a in all_artifacts
+            if isinstance(a, Artifact) and a.kind == artifact_kind and a.is_completed
+        ]
 
-                if not force:
-                    # Auto-rename
-                    counter = 2
-                    base_name = path.stem
-                    parent = path.parent
-                    ext = path.suffix
-                    while path.exists():
-                        path = parent / f"{base_name} ({counter}){ext}"
-                        counter += 1
+        if not completed_artifacts:
+            return {
+                "error": f"No completed {artifact_type_name} artifacts found",
+                "suggestion": f"Generate one with: notebooklm generate {artifact_type_name}",
+            }
 
+        # Convert to dict format for selection logic
+        type_artifacts: list[ArtifactDict] = [
+            {
+                "id": a.id,
+                "title": a.title,
+                "created_at": int(a.created_at.timestamp()) if a.created_at else 0,
+            }
+            for a in completed_artifacts
+        ]
+
+        # Helper for file conflict resolution
+        def _resolve_conflict(
+            path: Path, taken_names: set[str] | None = None, fold_case: bool = False
+        ) -> tuple[Path | None, dict | None]:
+            # ``taken_names`` is a snapshot of the target directory plus the
+            # names earlier items of this run will write (casefolded when the
+            # directory is case-insensitive); without it, ask disk
+            def _taken(p: Path) -> bool:
+                if taken_names is None:
+                    return p.exists()
+                return (p.name.casefold() if fold_case else p.name) in taken_names
+
+            if not _taken(path):
                 return path, None
 
-            # Handle --all flag
-            if download_all:
-                output_dir = Path(output_path) if output_path else Path(default_output_dir)
-
-                if dry_run:
-                    return {
-                        "dry_run": True,
-                        "operation": "download_all",
-                        "count": len(type_artifacts),
-                        "output_dir": str(output_dir),
-                        "artifacts": [
-                            {
-                                "id": a["id"],
-                                "title": a["title"],
-                                "filename": artifact_title_to_filename(
-                                    str(a["title"]),
-                                    file_extension,
-                                    set(),
-                                ),
-                            }
-                            for a in type_artifacts
-                        ],
-                    }
+            if no_clobber:
+                return None, {
+                    "status": "skipped",
+                    "reason": "file exists",
+                    "path": str(path),
+                }
 
-                output_dir.mkdir(parents=True, exist_ok=True)
-
-                results = []
-                existing_names: set[str] = set()
-                total = len(type_artifacts)
-
-                for i, artifact in enumerate(type_artifacts, 1):
-                    # Progress indicator
-                    if not json_output:
-                        console.print(f"[dim]Downloading {i}/{total}:[/dim] {artifact['title']}")
-
-                    # Generate safe name
-                    item_name = artifact_title_to_filename(
-                        str(artifact["title"]),
-                        file_extension,
-                        existing_names,
-                    )
-                    existing_names.add(item_name)
-                    item_path = output_dir / item_name
-
-                    # Resolve conflicts
-                    resolved_path, skip_info = _resolve_conflict(item_path)
-                    if skip_info or resolved_path is None:
-                        results.append(
-                            {
-                                "id": artifact["id"],
-                                "title": artifact["title"],
-                                "filename": item_name,
-                                **(
-                                    skip_info
-                                    or {"status": "skipped", "reason": "conflict resolution failed"}
-                                ),
-                            }
-                        )
-                        continue
+            if not force:
+                # Auto-rename
+                counter = 2
+                base_name = path.stem
+                parent = path.parent
+                ext = path.suffix
+                while _taken(path):
+                    path = parent / f"{base_name} ({counter}){ext}"
+                    counter += 1
 
-                    # Update if auto-renamed
-                    item_path = resolved_path
-                    item_name = item_path.name
+            return path, None
 
-                    # Download
-                    try:
-                        # Download using dispatch
-                        await download_fn(
-                            nb_id_resolved, str(item_path), artifact_id=str(artifact["id"])
-                        )
+        # Handle --all flag
+        if download_all:
+            output_dir = Path(output_path) if output_path else Path(default_output_dir)
 
-                        results.append(
-                            {
-                                "id": artifact["id"],
-                                "title": artifact["title"],
-                                "filename": item_name,
-                                "path": str(item_path),
-                                "status": "downloaded",
-                            }
-                        )
-                    except Exception as e:
-                        results.append(
-                            {
-                                "id": artifact["id"],
-                                "title": artifact["title"],
-                                "filename": item_name,
-                                "status": "failed",
-                                "error": str(e),
-                            }
-                        )
+            filenames = artifact_titles_to_filenames(
+                (str(a["title"]) for a in type_artifacts), file_extension
+            )
 
+            if dry_run:
                 return {
+                    "dry_run": True,
                     "operation": "download_all",
+                    "count": len(type_artifacts),
                     "output_dir": str(output_dir),
-                    "total": total,
-                    "results": results,
+                    "artifacts": [
+                        {"id": a["id"], "title": a["title"], "filename": filename}
+                        for a, filename in zip(type_artifacts, filenames, strict=True)
+                    ],
+                }
+
+            output_dir.mkdir(parents=True, exist_ok=True)
+
+            total = len(type_artifacts)
+            results: list[dict[str, Any] | None] = [None] * total
+            planned: list[tuple[int, ArtifactDict, Path]] = []
+            # One directory scan instead of an exists() call per candidate name.
+            # Names compare the way the filesystem does, matching exists().
+            fold_case = _is_case_insensitive(output_dir)
+            with os.scandir(output_dir) as entries:
+                taken_names = {
+                    entry.name.casefold() if fold_case else entry.name for entry in entries
                 }
 
-            # Single artifact selection
-            try:
-                selected, reason = select_artifact(
-                    type_artifacts,
-                    latest=latest,
-                    earliest=earliest,
-                    name=name,
-                    artifact_id=artifact_id,
+            # Pick every filename up front: conflict resolution depends on
+            # what earlier items will write, which is unsafe to decide
+            # while downloads run concurrently.
+            for i, (artifact, item_name) in enumerate(zip(type_artifacts, filenames, strict=True)):
+                resolved_path, skip_info = _resolve_conflict(
+                    output_dir / item_name, taken_names, fold_case
                 )
-            except ValueError as e:
-                return {"error": str(e)}
-
-            # Determine output path
-            if not output_path:
-                safe_name = artifact_title_to_filename(
-                    str(selected["title"]),
-                    file_extension,
-                    set(),
+                if skip_info or resolved_path is None:
+                    results[i] = {
+                        "id": artifact["id"],
+                        "title": artifact["title"],
+                        "filename": item_name,
+                        **(
+                            skip_info
+                            or {"status": "skipped", "reason": "conflict resolution failed"}
+                        ),
+                    }
+                    continue
+
+                taken_names.add(resolved_path.name.casefold() if fold_case else resolved_path.name)
+                planned.append((i, artifact, resolved_path))
+
+            semaphore = asyncio.Semaphore(DOWNLOAD_CONCURRENCY)
+            # One bar for the whole run: per-item lines would interleave
+            # once downloads overlap
+            progress = Progress(
+                TextColumn("[dim]{task.description}[/dim]"),
+                BarColumn(),
+                MofNCompleteColumn(),
+                console=console,
+                disable=json_output,
+                transient=True,
+            )
+
+            async def _download_one(i: int, artifact: ArtifactDict, item_path: Path) -> None:
+                async with semaphore:
+                    item_start = time.monotonic()
+                    try:
+                        await download_fn(
+                            nb_id_resolved, str(item_path), artifact_id=str(artifact["id"])
+                        )
+                        logger.debug(
+                            "Downloaded %s (%.3fs)", item_path.name, time.monotonic() - item_start
+                        )
+                        results[i] = {
+                            "id": artifact["id"],
+                            "title": artifact["title"],
+                            "filename": item_path.name,
+                            "path": str(item_path),
+                            "status": "downloaded",
+                        }
+                    except Exception as e:
+                        results[i] = {
+                            "id": artifact["id"],
+                            "title": artifact["title"],
+                            "filename": item_path.name,
+                            "status": "failed",
+                            "error": str(e),
+                        }
+                    finally:
+                        progress.advance(task)
+
+            with progress:
+                task = progress.add_task(f"Downloading {artifact_type_name}", total=len(planned))
+                batch_start = time.monotonic()
+                await asyncio.gather(*(_download_one(*item) for item in planned))
+                logger.debug(
+                    "Downloaded %d %s files, %d at a time (%.3fs)",
+                    len(planned),
+                    artifact_type_name,
+                    DOWNLOAD_CONCURRENCY,
+                    time.monotonic() - batch_start,
                 )
-                final_path = Path.cwd() / safe_name
-            else:
-                final_path = Path(output_path)
 
-            # Dry run
-            if dry_run:
-                return {
-                    "dry_run": True,
-                    "operation": "download_single",
-                    "artifact": {
-                        "id": selected["id"],
-                        "title": selected["title"],
-                        "selection_reason": reason,
-                    },
-                    "output_path": str(final_path),
-                }
+            return {
+                "operation": "download_all",
+                "output_dir": str(output_dir),
+                "total": total,
+                "results": [r for r in results if r is not None],
+            }
 
-            # Resolve conflicts
-            resolved_path, skip_error = _resolve_conflict(final_path)
-            if skip_error or resolved_path is None:
-                return {
-                    "error": f"File exists: {final_path}",
-                    "artifact": selected,
-                    "suggestion": "Use --force to overwrite or choose a different path",
-                }
+        # Single artifact selection
+        try:
+            selected, reason = select_artifact(
+                type_artifacts,
+                latest=latest,
+                earliest=earliest,
+                name=name,
+                artifact_id=artifact_id,
+            )
+        except ValueError as e:
+            return {"error": str(e)}
+
+        # Determine output path
+        if not output_path:
+            safe_name = artifact_title_to_filename(
+                str(selected["title"]),
+                file_extension,
+                set(),
+            )
+            final_path = Path.cwd() / safe_name
+        else:
+            final_path = Path(output_path)
+
+        # Dry run
+        if dry_run:
+            return {
+                "dry_run": True,
+                "operation": "download_single",
+                "artifact": {
+                    "id": selected["id"],
+                    "title": selected["title"],
+                    "selection_reason": reason,
+                },
+                "output_path": str(final_path),
+            }
 
-            final_path = resolved_path
+        # Resolve conflicts
+        resolved_path, skip_error = _resolve_conflict(final_path)
+        if skip_error or resolved_path is None:
+            return {
+                "error": f"File exists: {final_path}",
+                "artifact": selected,
+                "suggestion": "Use --force to overwrite or choose a different path",
+            }
 
-            # Download
-            try:
-                # Download using dispatch
-                result_path = await download_fn(
-                    nb_id_resolved, str(final_path), artifact_id=str(selected["id"])
-                )
+        final_path = resolved_path
 
-                return {
-                    "operation": "download_single",
-                    "artifact": {
-                        "id": selected["id"],
-                        "title": selected["title"],
-                        "selection_reason": reason,
-                    },
-                    "output_path": result_path or str(final_path),
-                    "status": "downloaded",
-                }
-            except Exception as e:
-                return {"error": str(e), "artifact": selected}
+        # Download
+        try:
+            # Download using dispatch
+            result_path = await download_fn(
+                nb_id_resolved, str(final_path), artifact_id=str(selected["id"])
+            )
 
-    return await _download()
+            return {
+                "operation": "download_single",
+                "artifact": {
+                    "id": selected["id"],
+                    "title": selected["title"],
+                    "selection_reason": reason,
+                },
+                "output_path": result_path or str(final_path),
+                "status": "downloaded",
+            }
+        except Exception as e:
+            return {"error": str(e), "artifact": selected}
 
 
 def _display_download_result(result: dict, artifact_type: str) -> None:
@@ -390,9 +457,10 @@ def _display_download_result(result: dict, artifact_type: str) -> None:
             console.print(
                 f"[yellow]DRY RUN:[/yellow] Would download {result['count']} {artifact_type} files to: {result['output_dir']}"
             )
-            console.print("\n[bold]Preview:[/bold]")
-            for art in result["artifacts"]:
-                console.print(f"  {art['filename']} <- {art['title']}")
+            console.print(
+                "\n[bold]Preview:[/bold]\n"
+                + "\n".join(f"  {art['filename']} <- {art['title']}" for art in result["artifacts"])
+            )
         else:
             console.print("[yellow]DRY RUN:[/yellow] Would download:")
             console.print(f"  Artifact: {result['artifact']['title']}")
@@ -402,28 +470,35 @@ def _display_download_result(result: dict, artifact_type: str) -> None:
 
     # Download all results
     if result.get("operation") == "download_all":
-        downloaded = [r for r in result["results"] if r.get("status") == "downloaded"]
-        skipped = [r for r in result["results"] if r.get("status") == "skipped"]
-        failed = [r for r in result["results"] if r.get("status") == "failed"]
+        by_status: dict[str, list[dict]] = {"downloaded": [], "skipped": [], "failed": []}
+        for r in result["results"]:
+            by_status.setdefault(r.get("status", ""), []).append(r)
+        downloaded = by_status["downloaded"]
+        skipped = by_status["skipped"]
+        failed = by_status["failed"]
 
         console.print(
             f"[bold]Downloaded {len(downloaded)}/{result['total']} {artifact_type} files to:[/bold] {result['output_dir']}"
         )
 
+        # One print per section rather than per file
         if downloaded:
-            console.print("\n[green]Downloaded:[/green]")
-            for r in downloaded:
-                console.print(f"  {r['filename']} <- {r['title']}")
+            console.print(
+                "\n[green]Downloaded:[/green]\n"
+                + "\n".join(f"  {r['filename']} <- {r['title']}" for r in downloaded)
+            )
 
         if skipped:
-            console.print("\n[yellow]Skipped:[/yellow]")
-            for r in skipped:
-                console.print(f"  {r['filename']} ({r.get('reason', 'unknown')})")
+            console.print(
+                "\n[yellow]Skipped:[/yellow]\n"
+                + "\n".join(f"  {r['filename']} ({r.get('reason', 'unknown')})" for r in skipped)
+            )
 
         if failed:
-            console.print("\n[red]Failed:[/red]")
-            for r in failed:
-                console.print(f"  {r['filename']}: {r.get('error', 'unknown error')}")
+            console.print(
+                "\n[red]Failed:[/red]\n"
+                + "\n".join(f"  {r['filename']}: {r.get('error', 'unknown error')}" for r in failed)
+            )
 
     # Single download
     else:
@@ -580,6 +655,8 @@ def download_infographic(ctx, **kwargs):
 
 
 FORMAT_EXTENSIONS = {"json": ".json", "markdown": ".md", "html": ".html"}
+# Shared by the quiz and flashcards --format options
+_OUTPUT_FORMAT_CHOICE = click.Choice(list(FORMAT_EXTENSIONS))
 
 
 def _run_artifact_download(ctx, artifact_type: str, **kwargs) -> None:
@@ -598,12 +675,13 @@ def _run_artifact_download(ctx, artifact_type: str, **kwargs) -> None:
                 artifact_kind=config["kind"],
                 file_extension=config["extension"],
                 default_output_dir=config["default_dir"],
+                download_method=config["method"],
                 **kwargs,
             )
         )
 
         if json_output:
-            console.print(json.dumps(result, indent=2))
+            json_output_response(result)
             return
 
         _display_download_result(result, artifact_type)
@@ -743,6 +821,8 @@ async def _download_interactive(
     Returns:
         Path to downloaded file.
     """
+    from ..client import NotebookLMClient
+
     nb_id = require_notebook(notebook)
     storage_path = ctx.obj.get("storage_path") if ctx.obj else None
     cookies = load_auth_from_storage(storage_path)
@@ -770,7 +850,7 @@ async def _download_interactive(
 @click.option(
     "--format",
     "output_format",
-    type=click.Choice(["json", "markdown", "html"]),
+    type=_OUTPUT_FORMAT_CHOICE,
     default="json",
     help="Output format",
 )
@@ -800,7 +880,7 @@ def download_quiz_cmd(ctx, output_path, notebook, output_format, artifact_id):
 @click.option(
     "--format",
     "output_format",
-    type=click.Choice(["json", "markdown", "html"]),
+    type=_OUTPUT_FORMAT_CHOICE,
     default="json",
     help="Output format",
 )
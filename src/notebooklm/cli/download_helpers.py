@@ -1,11 +1,15 @@
 """Helper functions for download commands."""
 
 import re
+from collections.abc import Iterable
 from typing import TypedDict
 
 # Reserve space for " (999)" suffix when handling duplicate filenames
 DUPLICATE_SUFFIX_RESERVE = 7
 
+# Characters that are invalid in filenames: / \ : * ? " < > |
+_INVALID_FILENAME_CHARS = re.compile(r'[/\\:*?"<>|]')
+
 
 class ArtifactDict(TypedDict):
     """Artifact structure returned by list_artifacts API."""
@@ -105,8 +109,7 @@ def artifact_title_to_filename(
         Sanitized filename with extension
     """
     # Sanitize: replace invalid chars with underscore
-    # Invalid chars: / \ : * ? " < > |
-    sanitized = re.sub(r'[/\\:*?"<>|]', "_", title)
+    sanitized = _INVALID_FILENAME_CHARS.sub("_", title)
 
     # Remove leading/trailing whitespace and dots
     sanitized = sanitized.strip(". ")
@@ -133,3 +136,26 @@ def artifact_title_to_filename(
         counter += 1
 
     return filename
+
+
+def artifact_titles_to_filenames(titles: Iterable[str], extension: str) -> list[str]:
+    """
+    Convert a batch of artifact titles to unique safe filenames.
+
+    Duplicate titles get (2), (3), etc. suffixes in order, matching what
+    downloading the artifacts one after another would produce.
+
+    Args:
+        titles: Artifact titles, in download order
+        extension: File extension (with leading dot, e.g., ".mp3")
+
+    Returns:
+        Filenames in the same order as titles
+    """
+    seen: set[str] = set()
+    filenames = []
+    for title in titles:
+        filename = artifact_title_to_filename(title, extension, seen)
+        seen.add(filename)
+        filenames.append(filename)
+    return filenames
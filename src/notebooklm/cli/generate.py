@@ -14,11 +14,10 @@ Commands:
 
 import asyncio
 from collections.abc import Awaitable, Callable
-from typing import Any
+from typing import TYPE_CHECKING, Any
 
 import click
 
-from ..client import NotebookLMClient
 from ..types import (
     AudioFormat,
     AudioLength,
@@ -43,15 +42,99 @@ from .helpers import (
     with_client,
 )
 from .language import SUPPORTED_LANGUAGES, get_language
-from .options import json_option, retry_option
+from .options import json_option, retry_option, timeout_option
+
+if TYPE_CHECKING:
+    from ..client import NotebookLMClient
 
 DEFAULT_LANGUAGE = "en"
 
+# Artifact types whose completion also requires a downloadable media URL
+_MEDIA_ARTIFACT_TYPES = frozenset({"audio", "video", "infographic", "slide deck"})
+
 # Retry constants
 RETRY_INITIAL_DELAY = 60.0  # seconds
 RETRY_MAX_DELAY = 300.0  # 5 minutes
 RETRY_BACKOFF_MULTIPLIER = 2.0
 
+# CLI choice -> enum mappings shared by the generate commands
+_AUDIO_FORMAT_MAP = {
+    "deep-dive": AudioFormat.DEEP_DIVE,
+    "brief": AudioFormat.BRIEF,
+    "critique": AudioFormat.CRITIQUE,
+    "debate": AudioFormat.DEBATE,
+}
+_AUDIO_LENGTH_MAP = {
+    "short": AudioLength.SHORT,
+    "default": AudioLength.DEFAULT,
+    "long": AudioLength.LONG,
+}
+_VIDEO_FORMAT_MAP = {"explainer": VideoFormat.EXPLAINER, "brief": VideoFormat.BRIEF}
+_VIDEO_STYLE_MAP = {
+    "auto": VideoStyle.AUTO_SELECT,
+    "classic": VideoStyle.CLASSIC,
+    "whiteboard": VideoStyle.WHITEBOARD,
+    "kawaii": VideoStyle.KAWAII,
+    "anime": VideoStyle.ANIME,
+    "watercolor": VideoStyle.WATERCOLOR,
+    "retro-print": VideoStyle.RETRO_PRINT,
+    "heritage": VideoStyle.HERITAGE,
+    "paper-craft": VideoStyle.PAPER_CRAFT,
+}
+_SLIDE_FORMAT_MAP = {
+    "detailed": SlideDeckFormat.DETAILED_DECK,
+    "presenter": SlideDeckFormat.PRESENTER_SLIDES,
+}
+_SLIDE_LENGTH_MAP = {
+    "default": SlideDeckLength.DEFAULT,
+    "short": SlideDeckLength.SHORT,
+}
+_QUANTITY_MAP = {
+    "fewer": QuizQuantity.FEWER,
+    "standard": QuizQuantity.STANDARD,
+    "more": QuizQuantity.MORE,
+}
+_DIFFICULTY_MAP = {
+    "easy": QuizDifficulty.EASY,
+    "medium": QuizDifficulty.MEDIUM,
+    "hard": QuizDifficulty.HARD,
+}
+_ORIENTATION_MAP = {
+    "landscape": InfographicOrientation.LANDSCAPE,
+    "portrait": InfographicOrientation.PORTRAIT,
+    "square": InfographicOrientation.SQUARE,
+}
+_DETAIL_MAP = {
+    "concise": InfographicDetail.CONCISE,
+    "standard": InfographicDetail.STANDARD,
+    "detailed": InfographicDetail.DETAILED,
+}
+_REPORT_FORMAT_MAP = {
+    "briefing-doc": ReportFormat.BRIEFING_DOC,
+    "study-guide": ReportFormat.STUDY_GUIDE,
+    "blog-post": ReportFormat.BLOG_POST,
+    "custom": ReportFormat.CUSTOM,
+}
+_REPORT_FORMAT_DISPLAY = {
+    "briefing-doc": "briefing document",
+    "study-guide": "study guide",
+    "blog-post": "blog post",
+    "custom": "custom report",
+}
+
+# Choices are shared by every command that offers the option
+_AUDIO_FORMAT_CHOICE = click.Choice(list(_AUDIO_FORMAT_MAP))
+_AUDIO_LENGTH_CHOICE = click.Choice(list(_AUDIO_LENGTH_MAP))
+_VIDEO_FORMAT_CHOICE = click.Choice(list(_VIDEO_FORMAT_MAP))
+_VIDEO_STYLE_CHOICE = click.Choice(list(_VIDEO_STYLE_MAP))
+_SLIDE_FORMAT_CHOICE = click.Choice(list(_SLIDE_FORMAT_MAP))
+_SLIDE_LENGTH_CHOICE = click.Choice(list(_SLIDE_LENGTH_MAP))
+_QUANTITY_CHOICE = click.Choice(list(_QUANTITY_MAP))
+_DIFFICULTY_CHOICE = click.Choice(list(_DIFFICULTY_MAP))
+_ORIENTATION_CHOICE = click.Choice(list(_ORIENTATION_MAP))
+_DETAIL_CHOICE = click.Choice(list(_DETAIL_MAP))
+_REPORT_FORMAT_CHOICE = click.Choice(list(_REPORT_FORMAT_MAP))
+
 
 def calculate_backoff_delay(
     attempt: int,
@@ -140,7 +223,7 @@ def resolve_language(language: str | None) -> str:
 
 
 async def handle_generation_result(
-    client: NotebookLMClient,
+    client: "NotebookLMClient",
     notebook_id: str,
     result: Any,
     artifact_type: str,
@@ -193,24 +276,36 @@ async def handle_generation_result(
             )
         return result
 
-    # Extract task_id from various result formats
-    task_id: str | None = None
+    task_id = _extract_task_id(result)
     status: Any = result
-    if isinstance(result, GenerationStatus):
-        task_id = result.task_id
-        status = result
-    elif isinstance(result, dict):
-        task_id = result.get("artifact_id") or result.get("task_id")
-        status = result
-    elif isinstance(result, list) and len(result) > 0:
-        task_id = result[0] if isinstance(result[0], str) else None
-        status = result
-
-    # Wait for completion if requested
-    if wait and task_id:
+
+    # Wait for completion if requested (unless generation already finished).
+    # Media results always go through wait_for_completion: the generate
+    # response can say "completed" before the media URL is populated, and only
+    # polling applies that readiness check.
+    already_done = isinstance(result, GenerationStatus) and (
+        result.is_failed or (result.is_complete and artifact_type not in _MEDIA_ARTIFACT_TYPES)
+    )
+    if wait and task_id and not already_done:
         if not json_output:
             console.print(f"[yellow]Generating {artifact_type}...[/yellow] Task: {task_id}")
-        status = await client.artifacts.wait_for_completion(notebook_id, task_id, timeout=timeout)
+        try:
+            status = await client.artifacts.wait_for_completion(
+                notebook_id, task_id, timeout=timeout
+            )
+        except TimeoutError:
+            if json_output:
+                json_error_response(
+                    "TIMEOUT",
+                    f"{artifact_type.title()} generation did not finish within {timeout:g}s",
+                    {"task_id": task_id},
+                )
+            else:
+                console.print(
+                    f"[red]Timed out after {timeout:g}s.[/red] "
+                    f"Check later with: notebooklm artifact wait {task_id}"
+                )
+            raise SystemExit(1) from None
 
     # Output status
     _output_generation_status(status, artifact_type, json_output)
@@ -310,18 +405,19 @@ def generate():
 @click.option(
     "--format",
     "audio_format",
-    type=click.Choice(["deep-dive", "brief", "critique", "debate"]),
+    type=_AUDIO_FORMAT_CHOICE,
     default="deep-dive",
 )
 @click.option(
     "--length",
     "audio_length",
-    type=click.Choice(["short", "default", "long"]),
+    type=_AUDIO_LENGTH_CHOICE,
     default="default",
 )
 @click.option("--language", default=None, help="Output language (default: from config or 'en')")
 @click.option("--source", "-s", "source_ids", multiple=True, help="Limit to specific source IDs")
 @click.option("--wait/--no-wait", default=False, help="Wait for completion (default: no-wait)")
+@timeout_option()
 @retry_option
 @json_option
 @with_client
@@ -334,6 +430,7 @@ def generate_audio(
     language,
     source_ids,
     wait,
+    timeout,
     max_retries,
     json_output,
     client_auth,
@@ -350,19 +447,10 @@ def generate_audio(
       notebooklm generate audio -s src_001 -s src_002 "from specific sources"
     """
     nb_id = require_notebook(notebook_id)
-    format_map = {
-        "deep-dive": AudioFormat.DEEP_DIVE,
-        "brief": AudioFormat.BRIEF,
-        "critique": AudioFormat.CRITIQUE,
-        "debate": AudioFormat.DEBATE,
-    }
-    length_map = {
-        "short": AudioLength.SHORT,
-        "default": AudioLength.DEFAULT,
-        "long": AudioLength.LONG,
-    }
 
     async def _run():
+        from ..client import NotebookLMClient
+
         async with NotebookLMClient(client_auth) as client:
             nb_id_resolved = await resolve_notebook_id(client, nb_id)
             sources = await resolve_source_ids(client, nb_id_resolved, source_ids)
@@ -373,13 +461,13 @@ def generate_audio(
                     source_ids=sources,
                     language=resolve_language(language),
                     instructions=description or None,
-                    audio_format=format_map[audio_format],
-                    audio_length=length_map[audio_length],
+                    audio_format=_AUDIO_FORMAT_MAP[audio_format],
+                    audio_length=_AUDIO_LENGTH_MAP[audio_length],
                 )
 
             result = await generate_with_retry(_generate, max_retries, "audio", json_output)
             await handle_generation_result(
-                client, nb_id_resolved, result, "audio", wait, json_output
+                client, nb_id_resolved, result, "audio", wait, json_output, timeout=timeout
             )
 
     return _run()
@@ -397,29 +485,18 @@ def generate_audio(
 @click.option(
     "--format",
     "video_format",
-    type=click.Choice(["explainer", "brief"]),
+    type=_VIDEO_FORMAT_CHOICE,
     default="explainer",
 )
 @click.option(
     "--style",
-    type=click.Choice(
-        [
-            "auto",
-            "classic",
-            "whiteboard",
-            "kawaii",
-            "anime",
-            "watercolor",
-            "retro-print",
-            "heritage",
-            "paper-craft",
-        ]
-    ),
+    type=_VIDEO_STYLE_CHOICE,
     default="auto",
 )
 @click.option("--language", default=None, help="Output language (default: from config or 'en')")
 @click.option("--source", "-s", "source_ids", multiple=True, help="Limit to specific source IDs")
 @click.option("--wait/--no-wait", default=False, help="Wait for completion (default: no-wait)")
+@timeout_option(600.0)
 @retry_option
 @json_option
 @with_client
@@ -432,6 +509,7 @@ def generate_video(
     language,
     source_ids,
     wait,
+    timeout,
     max_retries,
     json_output,
     client_auth,
@@ -448,20 +526,10 @@ def generate_video(
       notebooklm generate video -s src_001 "from specific source"
     """
     nb_id = require_notebook(notebook_id)
-    format_map = {"explainer": VideoFormat.EXPLAINER, "brief": VideoFormat.BRIEF}
-    style_map = {
-        "auto": VideoStyle.AUTO_SELECT,
-        "classic": VideoStyle.CLASSIC,
-        "whiteboard": VideoStyle.WHITEBOARD,
-        "kawaii": VideoStyle.KAWAII,
-        "anime": VideoStyle.ANIME,
-        "watercolor": VideoStyle.WATERCOLOR,
-        "retro-print": VideoStyle.RETRO_PRINT,
-        "heritage": VideoStyle.HERITAGE,
-        "paper-craft": VideoStyle.PAPER_CRAFT,
-    }
 
     async def _run():
+        from ..client import NotebookLMClient
+
         async with NotebookLMClient(client_auth) as client:
             nb_id_resolved = await resolve_notebook_id(client, nb_id)
             sources = await resolve_source_ids(client, nb_id_resolved, source_ids)
@@ -472,13 +540,13 @@ def generate_video(
                     source_ids=sources,
                     language=resolve_language(language),
                     instructions=description or None,
-                    video_format=format_map[video_format],
-                    video_style=style_map[style],
+                    video_format=_VIDEO_FORMAT_MAP[video_format],
+                    video_style=_VIDEO_STYLE_MAP[style],
                 )
 
             result = await generate_with_retry(_generate, max_retries, "video", json_output)
             await handle_generation_result(
-                client, nb_id_resolved, result, "video", wait, json_output, timeout=600.0
+                client, nb_id_resolved, result, "video", wait, json_output, timeout=timeout
             )
 
     return _run()
@@ -496,18 +564,19 @@ def generate_video(
 @click.option(
     "--format",
     "deck_format",
-    type=click.Choice(["detailed", "presenter"]),
+    type=_SLIDE_FORMAT_CHOICE,
     default="detailed",
 )
 @click.option(
     "--length",
     "deck_length",
-    type=click.Choice(["default", "short"]),
+    type=_SLIDE_LENGTH_CHOICE,
     default="default",
 )
 @click.option("--language", default=None, help="Output language (default: from config or 'en')")
 @click.option("--source", "-s", "source_ids", multiple=True, help="Limit to specific source IDs")
 @click.option("--wait/--no-wait", default=False, help="Wait for completion (default: no-wait)")
+@timeout_option()
 @retry_option
 @json_option
 @with_client
@@ -520,6 +589,7 @@ def generate_slide_deck(
     language,
     source_ids,
     wait,
+    timeout,
     max_retries,
     json_output,
     client_auth,
@@ -535,16 +605,10 @@ def generate_slide_deck(
       notebooklm generate slide-deck "executive summary" --format presenter --length short
     """
     nb_id = require_notebook(notebook_id)
-    format_map = {
-        "detailed": SlideDeckFormat.DETAILED_DECK,
-        "presenter": SlideDeckFormat.PRESENTER_SLIDES,
-    }
-    length_map = {
-        "default": SlideDeckLength.DEFAULT,
-        "short": SlideDeckLength.SHORT,
-    }
 
     async def _run():
+        from ..client import NotebookLMClient
+
         async with NotebookLMClient(client_auth) as client:
             nb_id_resolved = await resolve_notebook_id(client, nb_id)
             sources = await resolve_source_ids(client, nb_id_resolved, source_ids)
@@ -555,13 +619,13 @@ def generate_slide_deck(
                     source_ids=sources,
                     language=resolve_language(language),
                     instructions=description or None,
-                    slide_format=format_map[deck_format],
-                    slide_length=length_map[deck_length],
+                    slide_format=_SLIDE_FORMAT_MAP[deck_format],
+                    slide_length=_SLIDE_LENGTH_MAP[deck_length],
                 )
 
             result = await generate_with_retry(_generate, max_retries, "slide deck", json_output)
             await handle_generation_result(
-                client, nb_id_resolved, result, "slide deck", wait, json_output
+                client, nb_id_resolved, result, "slide deck", wait, json_output, timeout=timeout
             )
 
     return _run()
@@ -576,10 +640,11 @@ def generate_slide_deck(
     default=None,
     help="Notebook ID (uses current if not set)",
 )
-@click.option("--quantity", type=click.Choice(["fewer", "standard", "more"]), default="standard")
-@click.option("--difficulty", type=click.Choice(["easy", "medium", "hard"]), default="medium")
+@click.option("--quantity", type=_QUANTITY_CHOICE, default="standard")
+@click.option("--difficulty", type=_DIFFICULTY_CHOICE, default="medium")
 @click.option("--source", "-s", "source_ids", multiple=True, help="Limit to specific source IDs")
 @click.option("--wait/--no-wait", default=False, help="Wait for completion (default: no-wait)")
+@timeout_option()
 @retry_option
 @json_option
 @with_client
@@ -591,6 +656,7 @@ def generate_quiz(
     difficulty,
     source_ids,
     wait,
+    timeout,
     max_retries,
     json_output,
     client_auth,
@@ -606,18 +672,10 @@ def generate_quiz(
       notebooklm generate quiz "test key concepts" --difficulty hard --quantity more
     """
     nb_id = require_notebook(notebook_id)
-    quantity_map = {
-        "fewer": QuizQuantity.FEWER,
-        "standard": QuizQuantity.STANDARD,
-        "more": QuizQuantity.MORE,
-    }
-    difficulty_map = {
-        "easy": QuizDifficulty.EASY,
-        "medium": QuizDifficulty.MEDIUM,
-        "hard": QuizDifficulty.HARD,
-    }
 
     async def _run():
+        from ..client import NotebookLMClient
+
         async with NotebookLMClient(client_auth) as client:
             nb_id_resolved = await resolve_notebook_id(client, nb_id)
             sources = await resolve_source_ids(client, nb_id_resolved, source_ids)
@@ -627,13 +685,13 @@ def generate_quiz(
                     nb_id_resolved,
                     source_ids=sources,
                     instructions=description or None,
-                    quantity=quantity_map[quantity],
-                    difficulty=difficulty_map[difficulty],
+                    quantity=_QUANTITY_MAP[quantity],
+                    difficulty=_DIFFICULTY_MAP[difficulty],
                 )
 
             result = await generate_with_retry(_generate, max_retries, "quiz", json_output)
             await handle_generation_result(
-                client, nb_id_resolved, result, "quiz", wait, json_output
+                client, nb_id_resolved, result, "quiz", wait, json_output, timeout=timeout
             )
 
     return _run()
@@ -648,10 +706,11 @@ def generate_quiz(
     default=None,
     help="Notebook ID (uses current if not set)",
 )
-@click.option("--quantity", type=click.Choice(["fewer", "standard", "more"]), default="standard")
-@click.option("--difficulty", type=click.Choice(["easy", "medium", "hard"]), default="medium")
+@click.option("--quantity", type=_QUANTITY_CHOICE, default="standard")
+@click.option("--difficulty", type=_DIFFICULTY_CHOICE, default="medium")
 @click.option("--source", "-s", "source_ids", multiple=True, help="Limit to specific source IDs")
 @click.option("--wait/--no-wait", default=False, help="Wait for completion (default: no-wait)")
+@timeout_option()
 @retry_option
 @json_option
 @with_client
@@ -663,6 +722,7 @@ def generate_flashcards(
     difficulty,
     source_ids,
     wait,
+    timeout,
     max_retries,
     json_output,
     client_auth,
@@ -678,18 +738,10 @@ def generate_flashcards(
       notebooklm generate flashcards --quantity more --difficulty easy
     """
     nb_id = require_notebook(notebook_id)
-    quantity_map = {
-        "fewer": QuizQuantity.FEWER,
-        "standard": QuizQuantity.STANDARD,
-        "more": QuizQuantity.MORE,
-    }
-    difficulty_map = {
-        "easy": QuizDifficulty.EASY,
-        "medium": QuizDifficulty.MEDIUM,
-        "hard": QuizDifficulty.HARD,
-    }
 
     async def _run():
+        from ..client import NotebookLMClient
+
         async with NotebookLMClient(client_auth) as client:
             nb_id_resolved = await resolve_notebook_id(client, nb_id)
             sources = await resolve_source_ids(client, nb_id_resolved, source_ids)
@@ -699,13 +751,13 @@ def generate_flashcards(
                     nb_id_resolved,
                     source_ids=sources,
                     instructions=description or None,
-                    quantity=quantity_map[quantity],
-                    difficulty=difficulty_map[difficulty],
+                    quantity=_QUANTITY_MAP[quantity],
+                    difficulty=_DIFFICULTY_MAP[difficulty],
                 )
 
             result = await generate_with_retry(_generate, max_retries, "flashcards", json_output)
             await handle_generation_result(
-                client, nb_id_resolved, result, "flashcards", wait, json_output
+                client, nb_id_resolved, result, "flashcards", wait, json_output, timeout=timeout
             )
 
     return _run()
@@ -722,17 +774,18 @@ def generate_flashcards(
 )
 @click.option(
     "--orientation",
-    type=click.Choice(["landscape", "portrait", "square"]),
+    type=_ORIENTATION_CHOICE,
     default="landscape",
 )
 @click.option(
     "--detail",
-    type=click.Choice(["concise", "standard", "detailed"]),
+    type=_DETAIL_CHOICE,
     default="standard",
 )
 @click.option("--language", default=None, help="Output language (default: from config or 'en')")
 @click.option("--source", "-s", "source_ids", multiple=True, help="Limit to specific source IDs")
 @click.option("--wait/--no-wait", default=False, help="Wait for completion (default: no-wait)")
+@timeout_option()
 @retry_option
 @json_option
 @with_client
@@ -745,6 +798,7 @@ def generate_infographic(
     language,
     source_ids,
     wait,
+    timeout,
     max_retries,
     json_output,
     client_auth,
@@ -760,18 +814,10 @@ def generate_infographic(
       notebooklm generate infographic --orientation portrait --detail detailed
     """
     nb_id = require_notebook(notebook_id)
-    orientation_map = {
-        "landscape": InfographicOrientation.LANDSCAPE,
-        "portrait": InfographicOrientation.PORTRAIT,
-        "square": InfographicOrientation.SQUARE,
-    }
-    detail_map = {
-        "concise": InfographicDetail.CONCISE,
-        "standard": InfographicDetail.STANDARD,
-        "detailed": InfographicDetail.DETAILED,
-    }
 
     async def _run():
+        from ..client import NotebookLMClient
+
         async with NotebookLMClient(client_auth) as client:
             nb_id_resolved = await resolve_notebook_id(client, nb_id)
             sources = await resolve_source_ids(client, nb_id_resolved, source_ids)
@@ -782,13 +828,13 @@ def generate_infographic(
                     source_ids=sources,
                     language=resolve_language(language),
                     instructions=description or None,
-                    orientation=orientation_map[orientation],
-                    detail_level=detail_map[detail],
+                    orientation=_ORIENTATION_MAP[orientation],
+                    detail_level=_DETAIL_MAP[detail],
                 )
 
             result = await generate_with_retry(_generate, max_retries, "infographic", json_output)
             await handle_generation_result(
-                client, nb_id_resolved, result, "infographic", wait, json_output
+                client, nb_id_resolved, result, "infographic", wait, json_output, timeout=timeout
             )
 
     return _run()
@@ -806,6 +852,7 @@ def generate_infographic(
 @click.option("--language", default=None, help="Output language (default: from config or 'en')")
 @click.option("--source", "-s", "source_ids", multiple=True, help="Limit to specific source IDs")
 @click.option("--wait/--no-wait", default=False, help="Wait for completion (default: no-wait)")
+@timeout_option()
 @retry_option
 @json_option
 @with_client
@@ -816,6 +863,7 @@ def generate_data_table(
     language,
     source_ids,
     wait,
+    timeout,
     max_retries,
     json_output,
     client_auth,
@@ -833,6 +881,8 @@ def generate_data_table(
     nb_id = require_notebook(notebook_id)
 
     async def _run():
+        from ..client import NotebookLMClient
+
         async with NotebookLMClient(client_auth) as client:
             nb_id_resolved = await resolve_notebook_id(client, nb_id)
             sources = await resolve_source_ids(client, nb_id_resolved, source_ids)
@@ -847,7 +897,7 @@ def generate_data_table(
 
             result = await generate_with_retry(_generate, max_retries, "data table", json_output)
             await handle_generation_result(
-                client, nb_id_resolved, result, "data table", wait, json_output
+                client, nb_id_resolved, result, "data table", wait, json_output, timeout=timeout
             )
 
     return _run()
@@ -873,6 +923,8 @@ def generate_mind_map(ctx, notebook_id, source_ids, json_output, client_auth):
     nb_id = require_notebook(notebook_id)
 
     async def _run():
+        from ..client import NotebookLMClient
+
         async with NotebookLMClient(client_auth) as client:
             nb_id_resolved = await resolve_notebook_id(client, nb_id)
             sources = await resolve_source_ids(client, nb_id_resolved, source_ids)
@@ -922,7 +974,7 @@ def _output_mind_map_result(result: Any, json_output: bool) -> None:
 @click.option(
     "--format",
     "report_format",
-    type=click.Choice(["briefing-doc", "study-guide", "blog-post", "custom"]),
+    type=_REPORT_FORMAT_CHOICE,
     default="briefing-doc",
     help="Report format (default: briefing-doc)",
 )
@@ -936,6 +988,7 @@ def _output_mind_map_result(result: Any, json_output: bool) -> None:
 @click.option("--source", "-s", "source_ids", multiple=True, help="Limit to specific source IDs")
 @click.option("--language", default=None, help="Output language (default: from config or 'en')")
 @click.option("--wait/--no-wait", default=False, help="Wait for completion (default: no-wait)")
+@timeout_option()
 @retry_option
 @json_option
 @with_client
@@ -947,6 +1000,7 @@ def generate_report_cmd(
     source_ids,
     language,
     wait,
+    timeout,
     max_retries,
     json_output,
     client_auth,
@@ -975,22 +1029,12 @@ def generate_report_cmd(
         else:
             custom_prompt = description
 
-    format_map = {
-        "briefing-doc": ReportFormat.BRIEFING_DOC,
-        "study-guide": ReportFormat.STUDY_GUIDE,
-        "blog-post": ReportFormat.BLOG_POST,
-        "custom": ReportFormat.CUSTOM,
-    }
-    report_format_enum = format_map[actual_format]
-
-    format_display = {
-        "briefing-doc": "briefing document",
-        "study-guide": "study guide",
-        "blog-post": "blog post",
-        "custom": "custom report",
-    }[actual_format]
+    report_format_enum = _REPORT_FORMAT_MAP[actual_format]
+    format_display = _REPORT_FORMAT_DISPLAY[actual_format]
 
     async def _run():
+        from ..client import NotebookLMClient
+
         async with NotebookLMClient(client_auth) as client:
             nb_id_resolved = await resolve_notebook_id(client, nb_id)
             sources = await resolve_source_ids(client, nb_id_resolved, source_ids)
@@ -1006,7 +1050,7 @@ def generate_report_cmd(
 
             result = await generate_with_retry(_generate, max_retries, format_display, json_output)
             await handle_generation_result(
-                client, nb_id_resolved, result, format_display, wait, json_output
+                client, nb_id_resolved, result, format_display, wait, json_output, timeout=timeout
             )
 
     return _run()
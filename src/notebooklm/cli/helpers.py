@@ -10,12 +10,14 @@ Provides common functionality for all CLI commands:
 """
 
 import asyncio
+import copy
 import json
 import logging
 import os
+import sys
 import time
 from functools import wraps
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Any
 
 import click
 from rich.console import Console
@@ -30,7 +32,9 @@ from ..paths import get_browser_profile_dir, get_context_path
 from ..types import ArtifactType
 
 if TYPE_CHECKING:
-    from ..types import Artifact
+    from datetime import datetime
+
+    from ..types import Artifact, Source
 
 console = Console()
 logger = logging.getLogger(__name__)
@@ -41,6 +45,9 @@ logger = logging.getLogger(__name__)
 CONTEXT_FILE = get_context_path()
 BROWSER_PROFILE_DIR = get_browser_profile_dir()
 
+# How long notebook metadata cached by `use` stays valid (seconds)
+NOTEBOOK_CACHE_TTL = 600.0
+
 # CLI artifact type name aliases
 _CLI_ARTIFACT_ALIASES = {
     "flashcard": "flashcards",  # CLI uses singular, enum uses plural
@@ -77,7 +84,18 @@ def cli_name_to_artifact_type(name: str) -> ArtifactType | None:
 
 
 def run_async(coro):
-    """Run async coroutine in sync context."""
+    """Run async coroutine in sync context.
+
+    Uses uvloop's event loop when it is installed (the ``fast`` extra),
+    otherwise the default asyncio loop. uvloop is never used on Windows.
+    """
+    if sys.platform != "win32":
+        try:
+            import uvloop
+        except ImportError:
+            pass
+        else:
+            return uvloop.run(coro)
     return asyncio.run(coro)
 
 
@@ -117,21 +135,93 @@ def get_auth_tokens(ctx) -> AuthTokens:
     return AuthTokens(cookies=cookies, csrf_token=csrf, session_id=session_id)
 
 
+async def load_auth_tokens(ctx) -> AuthTokens:
+    """Get AuthTokens from context inside an already running event loop.
+
+    Async counterpart of get_auth_tokens(): the token fetch runs on the
+    caller's loop, so a command can authenticate and do its work with a
+    single event loop instead of starting one just for the token fetch.
+
+    Args:
+        ctx: Click context with optional storage_path in obj
+
+    Returns:
+        AuthTokens ready for client construction
+
+    Raises:
+        FileNotFoundError: If auth storage not found
+    """
+    storage_path = ctx.obj.get("storage_path") if ctx.obj else None
+    cookies = load_auth_from_storage(storage_path)
+    csrf, session_id = await fetch_tokens(cookies)
+    return AuthTokens(cookies=cookies, csrf_token=csrf, session_id=session_id)
+
+
 # =============================================================================
 # CONTEXT MANAGEMENT
 # =============================================================================
 
 
-def get_current_notebook() -> str | None:
-    """Get the current notebook ID from context."""
+# Last parsed context, keyed by (path, mtime_ns, size). A command typically reads
+# the context several times (require_notebook, conversation lookup, ...); the key
+# lets repeat reads skip the JSON parse while still noticing external edits.
+_context_cache: tuple[tuple[str, int, int], dict[str, Any]] | None = None
+
+
+def _invalidate_context_cache() -> None:
+    """Drop the parsed context so the next get_context() re-reads the file."""
+    global _context_cache
+    _context_cache = None
+
+
+def get_context() -> dict[str, Any]:
+    """Read the whole context file in a single pass.
+
+    Repeated calls reuse the parsed data until the file changes on disk.
+
+    Returns:
+        Parsed context dict (a deep copy, so the caller may modify nested
+        values such as notebook_cache entries), or an empty dict if the file
+        is missing or corrupt
+    """
+    global _context_cache
     context_file = get_context_path()
-    if not context_file.exists():
-        return None
     try:
+        st = context_file.stat()
+        key = (str(context_file), st.st_mtime_ns, st.st_size)
+        if _context_cache is not None and _context_cache[0] == key:
+            return copy.deepcopy(_context_cache[1])
         data = json.loads(context_file.read_text(encoding="utf-8"))
-        return data.get("notebook_id")
     except (OSError, json.JSONDecodeError):
+        return {}
+    if not isinstance(data, dict):
+        return {}
+    _context_cache = (key, data)
+    return copy.deepcopy(data)
+
+
+def get_current_notebook() -> str | None:
+    """Get the current notebook ID from context."""
+    return get_context().get("notebook_id")
+
+
+def get_cached_notebook(notebook_id: str) -> dict[str, Any] | None:
+    """Get notebook metadata cached by a previous `use`, if still fresh.
+
+    Args:
+        notebook_id: Full notebook ID (partial IDs never hit the cache)
+
+    Returns:
+        Dict with title, is_owner and created_at, or None on miss/expiry
+    """
+    cache = get_context().get("notebook_cache")
+    entry = cache.get(notebook_id) if isinstance(cache, dict) else None
+    if not isinstance(entry, dict):
+        return None
+    fetched_at = entry.get("fetched_at")
+    if not isinstance(fetched_at, (int, float)) or time.time() - fetched_at >= NOTEBOOK_CACHE_TTL:
         return None
+    return entry
 
 
 def set_current_notebook(
@@ -139,24 +229,23 @@ def set_current_notebook(
     title: str | None = None,
     is_owner: bool | None = None,
     created_at: str | None = None,
+    cache_metadata: bool = False,
 ):
     """Set the current notebook context.
 
     If switching to a different notebook, the cached conversation_id is cleared
     since conversations are notebook-specific.
+
+    With cache_metadata=True, the title/owner/created fields are also stored in
+    the notebook cache so a later `use` of the same notebook can skip the API.
     """
     context_file = get_context_path()
     context_file.parent.mkdir(parents=True, exist_ok=True)
 
-    # Read existing context if available
-    current_context: dict = {}
-    if context_file.exists():
-        try:
-            current_context = json.loads(context_file.read_text(encoding="utf-8"))
-        except (OSError, json.JSONDecodeError):
-            pass  # Start with fresh context if file is corrupt
+    # Read existing context (empty if missing or corrupt)
+    current_context = get_context()
 
-    data: dict[str, str | bool] = {"notebook_id": notebook_id}
+    data: dict[str, Any] = {"notebook_id": notebook_id}
     if title:
         data["title"] = title
     if is_owner is not None:
@@ -168,7 +257,53 @@ def set_current_notebook(
     if current_context.get("notebook_id") == notebook_id and "conversation_id" in current_context:
         data["conversation_id"] = current_context["conversation_id"]
 
+    # Carry over still-fresh cache entries, dropping expired ones
+    now = time.time()
+    cache = current_context.get("notebook_cache")
+    notebook_cache: dict[str, Any] = {}
+    if isinstance(cache, dict):
+        notebook_cache = {
+            nb_id: entry
+            for nb_id, entry in cache.items()
+            if isinstance(entry, dict)
+            and isinstance(entry.get("fetched_at"), (int, float))
+            and now - entry["fetched_at"] < NOTEBOOK_CACHE_TTL
+        }
+    if cache_metadata:
+        notebook_cache[notebook_id] = {
+            "title": title,
+            "is_owner": is_owner,
+            "created_at": created_at,
+            "fetched_at": now,
+        }
+    if notebook_cache:
+        data["notebook_cache"] = notebook_cache
+
     context_file.write_text(json.dumps(data, indent=2, ensure_ascii=False), encoding="utf-8")
+    _invalidate_context_cache()
+
+
+def forget_cached_notebook(notebook_id: str) -> None:
+    """Drop a notebook's cached metadata after it was renamed or deleted.
+
+    The context file is only rewritten when an entry is actually removed.
+    """
+    data = get_context()
+    cache = data.get("notebook_cache")
+    if not isinstance(cache, dict) or notebook_id not in cache:
+        return
+    cache = {nb_id: entry for nb_id, entry in cache.items() if nb_id != notebook_id}
+    if cache:
+        data["notebook_cache"] = cache
+    else:
+        del data["notebook_cache"]
+    try:
+        get_context_path().write_text(
+            json.dumps(data, indent=2, ensure_ascii=False), encoding="utf-8"
+        )
+    except OSError:
+        pass
+    _invalidate_context_cache()
 
 
 def clear_context():
@@ -176,34 +311,36 @@ def clear_context():
     context_file = get_context_path()
     if context_file.exists():
         context_file.unlink()
+    _invalidate_context_cache()
 
 
 def get_current_conversation() -> str | None:
     """Get the current conversation ID from context."""
-    context_file = get_context_path()
-    if not context_file.exists():
-        return None
-    try:
-        data = json.loads(context_file.read_text(encoding="utf-8"))
-        return data.get("conversation_id")
-    except (OSError, json.JSONDecodeError):
-        return None
+    return get_context().get("conversation_id")
 
 
 def set_current_conversation(conversation_id: str | None):
-    """Set or clear the current conversation ID in context."""
-    context_file = get_context_path()
-    if not context_file.exists():
+    """Set or clear the current conversation ID in context.
+
+    The context file is only rewritten when the stored ID actually changes,
+    so follow-up questions in the same conversation cost a single read.
+    """
+    data = get_context()
+    if not data or data.get("conversation_id") == conversation_id:
+        return
+    if conversation_id:
+        data["conversation_id"] = conversation_id
+    elif "conversation_id" in data:
+        del data["conversation_id"]
+    else:
         return
     try:
-        data = json.loads(context_file.read_text(encoding="utf-8"))
-        if conversation_id:
-            data["conversation_id"] = conversation_id
-        elif "conversation_id" in data:
-            del data["conversation_id"]
-        context_file.write_text(json.dumps(data, indent=2, ensure_ascii=False), encoding="utf-8")
-    except (OSError, json.JSONDecodeError):
+        get_context_path().write_text(
+            json.dumps(data, indent=2, ensure_ascii=False), encoding="utf-8"
+        )
+    except OSError:
         pass
+    _invalidate_context_cache()
 
 
 def validate_id(entity_id: str, entity_name: str = "ID") -> str:
@@ -322,6 +459,27 @@ async def resolve_source_id(client, notebook_id: str, partial_id: str) -> str:
     )
 
 
+async def resolve_source(client, notebook_id: str, partial_id: str) -> "Source | None":
+    """Resolve partial source ID and return the matching source.
+
+    The source list is fetched once and used both for ID resolution and for
+    the lookup, instead of resolve_source_id() followed by sources.get(),
+    which would fetch the same list twice.
+    """
+    sources = await client.sources.list(notebook_id)
+
+    async def list_sources():
+        return sources
+
+    resolved_id = await _resolve_partial_id(
+        partial_id,
+        list_fn=list_sources,
+        entity_name="source",
+        list_command="source list",
+    )
+    return next((src for src in sources if src.id == resolved_id), None)
+
+
 async def resolve_artifact_id(client, notebook_id: str, partial_id: str) -> str:
     """Resolve partial artifact ID to full ID."""
     return await _resolve_partial_id(
@@ -332,6 +490,61 @@ async def resolve_artifact_id(client, notebook_id: str, partial_id: str) -> str:
     )
 
 
+async def resolve_artifact(client, notebook_id: str, partial_id: str) -> "Artifact | None":
+    """Resolve partial artifact ID and return the matching artifact.
+
+    Like resolve_source(), this fetches the artifact list once instead of
+    resolve_artifact_id() followed by artifacts.get(), which lists again.
+    """
+    artifacts = await client.artifacts.list(notebook_id)
+
+    async def list_artifacts():
+        return artifacts
+
+    resolved_id = await _resolve_partial_id(
+        partial_id,
+        list_fn=list_artifacts,
+        entity_name="artifact",
+        list_command="artifact list",
+    )
+    return next((art for art in artifacts if art.id == resolved_id), None)
+
+
+async def resolve_artifact_ids(
+    client, notebook_id: str, artifact_ids: tuple[str, ...]
+) -> list[str]:
+    """Resolve multiple partial artifact IDs to full IDs.
+
+    Args:
+        client: NotebookLM client
+        notebook_id: Resolved notebook ID
+        artifact_ids: Tuple of partial artifact IDs from CLI
+
+    Returns:
+        List of resolved artifact IDs, in the order given
+    """
+    # Fetch the artifact list at most once, however many partial IDs need it
+    artifacts: list | None = None
+
+    async def list_artifacts():
+        nonlocal artifacts
+        if artifacts is None:
+            artifacts = await client.artifacts.list(notebook_id)
+        return artifacts
+
+    resolved = []
+    for aid in artifact_ids:
+        resolved.append(
+            await _resolve_partial_id(
+                aid,
+                list_fn=list_artifacts,
+                entity_name="artifact",
+                list_command="artifact list",
+            )
+        )
+    return resolved
+
+
 async def resolve_note_id(client, notebook_id: str, partial_id: str) -> str:
     """Resolve partial note ID to full ID."""
     return await _resolve_partial_id(
@@ -357,12 +570,52 @@ async def resolve_source_ids(
     """
     if not source_ids:
         return None
+
+    # Fetch the source list at most once, however many partial IDs need it
+    sources: list | None = None
+
+    async def list_sources():
+        nonlocal sources
+        if sources is None:
+            sources = await client.sources.list(notebook_id)
+        return sources
+
     resolved = []
     for sid in source_ids:
-        resolved.append(await resolve_source_id(client, notebook_id, sid))
+        resolved.append(
+            await _resolve_partial_id(
+                sid,
+                list_fn=list_sources,
+                entity_name="source",
+                list_command="source list",
+            )
+        )
     return resolved
 
 
+def confirm_action(message: str, yes: bool = False) -> bool:
+    """Ask the user to confirm a destructive action.
+
+    Without a terminal on stdin there is nobody to answer the prompt, so
+    fail fast and point at --yes instead of reading piped input.
+
+    Args:
+        message: Prompt text (e.g., "Delete source abc123?")
+        yes: True if the user passed --yes to skip confirmation
+
+    Returns:
+        True if the action should proceed
+
+    Raises:
+        click.UsageError: If confirmation is needed but stdin is not a TTY
+    """
+    if yes:
+        return True
+    if not sys.stdin.isatty():
+        raise click.UsageError("Confirmation required in non-interactive mode; pass --yes.")
+    return click.confirm(message)
+
+
 # =============================================================================
 # ERROR HANDLING
 # =============================================================================
@@ -422,7 +675,7 @@ def with_client(f):
 
     This decorator eliminates boilerplate from commands that need:
     - Authentication (get AuthTokens from context)
-    - Async execution (run coroutine with asyncio.run)
+    - Async execution (token fetch and command run on one event loop)
     - Error handling (auth errors, general exceptions)
 
     The decorated function stays SYNC (Click doesn't support async) but returns
@@ -434,6 +687,8 @@ def with_client(f):
         @with_client
         def list_notebooks(ctx, json_output, client_auth):
             async def _run():
+                from ..client import NotebookLMClient
+
                 async with NotebookLMClient(client_auth) as client:
                     notebooks = await client.notebooks.list()
                     output_notebooks(notebooks, json_output)
@@ -463,10 +718,13 @@ def with_client(f):
                 logger.debug("CLI command %s: %s (%.3fs)", status, cmd_name, elapsed)
             return elapsed
 
+        # Auth and the command share one event loop (and one run_async call)
+        async def _run_with_auth():
+            auth = await load_auth_tokens(ctx)
+            return await f(ctx, *args, client_auth=auth, **kwargs)
+
         try:
-            auth = get_auth_tokens(ctx)
-            coro = f(ctx, *args, client_auth=auth, **kwargs)
-            result = run_async(coro)
+            result = run_async(_run_with_auth())
             log_result("completed")
             return result
         except FileNotFoundError:
@@ -487,9 +745,31 @@ def with_client(f):
 # =============================================================================
 
 
+def _dumps_json(data: dict) -> str:
+    """Serialize data as indented JSON.
+
+    Uses orjson when it is installed (the ``fast`` extra), otherwise the
+    standard library encoder, whose indent mode runs in pure Python. Both paths
+    emit raw UTF-8 and pass datetimes and dataclasses through ``str``, so the
+    output is the same either way.
+    """
+    try:
+        import orjson
+    except ImportError:
+        return json.dumps(data, indent=2, ensure_ascii=False, default=str)
+    return orjson.dumps(
+        data,
+        default=str,
+        option=orjson.OPT_INDENT_2
+        | orjson.OPT_NON_STR_KEYS
+        | orjson.OPT_PASSTHROUGH_DATETIME
+        | orjson.OPT_PASSTHROUGH_DATACLASS,
+    ).decode()
+
+
 def json_output_response(data: dict) -> None:
     """Print JSON response (no colors for machine parsing)."""
-    click.echo(json.dumps(data, indent=2, default=str))
+    click.echo(_dumps_json(data))
 
 
 def json_error_response(code: str, message: str, extra: dict | None = None) -> None:
@@ -503,7 +783,7 @@ def json_error_response(code: str, message: str, extra: dict | None = None) -> N
     response = {"error": True, "code": code, "message": message}
     if extra:
         response.update(extra)
-    click.echo(json.dumps(response, indent=2))
+    click.echo(_dumps_json(response))
     raise SystemExit(1)
 
 
@@ -535,6 +815,45 @@ def display_research_sources(sources: list[dict], max_display: int = 10) -> None
 # =============================================================================
 
 
+# Display strings for type columns, built once rather than per table row
+_ARTIFACT_TYPE_DISPLAY = {
+    ArtifactType.AUDIO: "🎧 Audio",
+    ArtifactType.VIDEO: "🎬 Video",
+    ArtifactType.QUIZ: "📝 Quiz",
+    ArtifactType.FLASHCARDS: "🃏 Flashcards",
+    ArtifactType.MIND_MAP: "🧠 Mind Map",
+    ArtifactType.INFOGRAPHIC: "🖼️ Infographic",
+    ArtifactType.SLIDE_DECK: "📊 Slide Deck",
+    ArtifactType.DATA_TABLE: "📈 Data Table",
+}
+
+_REPORT_SUBTYPE_DISPLAY = {
+    "briefing_doc": "📋 Briefing Doc",
+    "study_guide": "📚 Study Guide",
+    "blog_post": "✍️ Blog Post",
+    "report": "📄 Report",
+}
+
+_SOURCE_TYPE_DISPLAY = {
+    # From SourceType str enum values (types.py)
+    "google_docs": "📄 Google Docs",
+    "google_slides": "📊 Google Slides",
+    "google_spreadsheet": "📊 Google Sheets",
+    "pdf": "📄 PDF",
+    "pasted_text": "📝 Pasted Text",
+    "docx": "📝 DOCX",
+    "web_page": "🌐 Web Page",
+    "markdown": "📝 Markdown",
+    "youtube": "🎬 YouTube",
+    "media": "🎵 Media",
+    "google_drive_audio": "🎧 Drive Audio",
+    "google_drive_video": "🎬 Drive Video",
+    "image": "🖼️ Image",
+    "csv": "📊 CSV",
+    "unknown": "❓ Unknown",
+}
+
+
 def get_artifact_type_display(artifact: "Artifact") -> str:
     """Get display string for artifact type.
 
@@ -544,33 +863,13 @@ def get_artifact_type_display(artifact: "Artifact") -> str:
     Returns:
         Display string with emoji
     """
-    from notebooklm import ArtifactType
-
     kind = artifact.kind
 
-    # Map ArtifactType enum to display strings
-    display_map = {
-        ArtifactType.AUDIO: "🎧 Audio",
-        ArtifactType.VIDEO: "🎬 Video",
-        ArtifactType.QUIZ: "📝 Quiz",
-        ArtifactType.FLASHCARDS: "🃏 Flashcards",
-        ArtifactType.MIND_MAP: "🧠 Mind Map",
-        ArtifactType.INFOGRAPHIC: "🖼️ Infographic",
-        ArtifactType.SLIDE_DECK: "📊 Slide Deck",
-        ArtifactType.DATA_TABLE: "📈 Data Table",
-    }
-
     # Handle report subtypes specially
     if kind == ArtifactType.REPORT:
-        report_displays = {
-            "briefing_doc": "📋 Briefing Doc",
-            "study_guide": "📚 Study Guide",
-            "blog_post": "✍️ Blog Post",
-            "report": "📄 Report",
-        }
-        return report_displays.get(artifact.report_subtype or "report", "📄 Report")
+        return _REPORT_SUBTYPE_DISPLAY.get(artifact.report_subtype or "report", "📄 Report")
 
-    return display_map.get(kind, f"Unknown ({kind})")
+    return _ARTIFACT_TYPE_DISPLAY.get(kind, f"Unknown ({kind})")
 
 
 def get_source_type_display(source_type: str) -> str:
@@ -584,22 +883,21 @@ def get_source_type_display(source_type: str) -> str:
     """
     # Extract value if it's a SourceType enum, otherwise use as-is
     type_str = source_type.value if hasattr(source_type, "value") else str(source_type)
-    type_map = {
-        # From SourceType str enum values (types.py)
-        "google_docs": "📄 Google Docs",
-        "google_slides": "📊 Google Slides",
-        "google_spreadsheet": "📊 Google Sheets",
-        "pdf": "📄 PDF",
-        "pasted_text": "📝 Pasted Text",
-        "docx": "📝 DOCX",
-        "web_page": "🌐 Web Page",
-        "markdown": "📝 Markdown",
-        "youtube": "🎬 YouTube",
-        "media": "🎵 Media",
-        "google_drive_audio": "🎧 Drive Audio",
-        "google_drive_video": "🎬 Drive Video",
-        "image": "🖼️ Image",
-        "csv": "📊 CSV",
-        "unknown": "❓ Unknown",
-    }
-    return type_map.get(type_str, f"❓ {type_str}")
+    return _SOURCE_TYPE_DISPLAY.get(type_str, f"❓ {type_str}")
+
+
+def format_timestamp(value: "datetime | None") -> str:
+    """Format a timestamp as ``YYYY-MM-DD HH:MM`` for table cells.
+
+    Builds the string from the datetime fields directly; strftime re-parses
+    the format string for every row, which shows up on large source lists.
+
+    Args:
+        value: Timestamp to format, or None
+
+    Returns:
+        Formatted timestamp, or "-" if value is None
+    """
+    if value is None:
+        return "-"
+    return f"{value.year:04d}-{value.month:02d}-{value.day:02d} {value.hour:02d}:{value.minute:02d}"
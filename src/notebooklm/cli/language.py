@@ -12,9 +12,8 @@ import logging
 import click
 from rich.table import Table
 
-from ..client import NotebookLMClient
 from ..paths import get_config_path, get_home_dir
-from .helpers import console, get_auth_tokens, json_output_response, run_async
+from .helpers import console, json_output_response, load_auth_tokens, run_async
 from .options import json_option
 
 logger = logging.getLogger(__name__)
@@ -152,9 +151,11 @@ def _sync_language_to_server(code: str, ctx: click.Context) -> str | None:
         Server's response language, or None on failure.
     """
     try:
-        auth = get_auth_tokens(ctx)
 
         async def _set():
+            from ..client import NotebookLMClient
+
+            auth = await load_auth_tokens(ctx)
             async with NotebookLMClient(auth) as client:
                 return await client.settings.set_output_language(code)
 
@@ -174,9 +175,11 @@ def _get_language_from_server(ctx: click.Context) -> str | None:
         Server's language setting, or None on failure.
     """
     try:
-        auth = get_auth_tokens(ctx)
 
         async def _get():
+            from ..client import NotebookLMClient
+
+            auth = await load_auth_tokens(ctx)
             async with NotebookLMClient(auth) as client:
                 return await client.settings.get_output_language()
 
@@ -12,9 +12,9 @@ Commands:
 import click
 from rich.table import Table
 
-from ..client import NotebookLMClient
 from ..types import Note
 from .helpers import (
+    confirm_action,
     console,
     require_notebook,
     resolve_note_id,
@@ -57,6 +57,8 @@ def note_list(ctx, notebook_id, client_auth):
     nb_id = require_notebook(notebook_id)
 
     async def _run():
+        from ..client import NotebookLMClient
+
         async with NotebookLMClient(client_auth) as client:
             nb_id_resolved = await resolve_notebook_id(client, nb_id)
             notes = await client.notes.list(nb_id_resolved)
@@ -72,12 +74,9 @@ def note_list(ctx, notebook_id, client_auth):
 
             for n in notes:
                 if isinstance(n, Note):
-                    preview = n.content[:50] if n.content else ""
-                    table.add_row(
-                        n.id,
-                        n.title or "Untitled",
-                        preview + "..." if len(n.content or "") > 50 else preview,
-                    )
+                    content = n.content or ""
+                    preview = content[:50] + "..." if len(content) > 50 else content
+                    table.add_row(n.id, n.title or "Untitled", preview)
 
             console.print(table)
 
@@ -107,6 +106,8 @@ def note_create(ctx, content, notebook_id, title, client_auth):
     nb_id = require_notebook(notebook_id)
 
     async def _run():
+        from ..client import NotebookLMClient
+
         async with NotebookLMClient(client_auth) as client:
             nb_id_resolved = await resolve_notebook_id(client, nb_id)
             result = await client.notes.create(nb_id_resolved, title, content)
@@ -138,6 +139,8 @@ def note_get(ctx, note_id, notebook_id, client_auth):
     nb_id = require_notebook(notebook_id)
 
     async def _run():
+        from ..client import NotebookLMClient
+
         async with NotebookLMClient(client_auth) as client:
             nb_id_resolved = await resolve_notebook_id(client, nb_id)
             resolved_id = await resolve_note_id(client, nb_id_resolved, note_id)
@@ -177,6 +180,8 @@ def note_save(ctx, note_id, notebook_id, title, content, client_auth):
     nb_id = require_notebook(notebook_id)
 
     async def _run():
+        from ..client import NotebookLMClient
+
         async with NotebookLMClient(client_auth) as client:
             nb_id_resolved = await resolve_notebook_id(client, nb_id)
             resolved_id = await resolve_note_id(client, nb_id_resolved, note_id)
@@ -205,6 +210,8 @@ def note_rename(ctx, note_id, new_title, notebook_id, client_auth):
     nb_id = require_notebook(notebook_id)
 
     async def _run():
+        from ..client import NotebookLMClient
+
         async with NotebookLMClient(client_auth) as client:
             nb_id_resolved = await resolve_notebook_id(client, nb_id)
             resolved_id = await resolve_note_id(client, nb_id_resolved, note_id)
@@ -241,11 +248,13 @@ def note_delete(ctx, note_id, notebook_id, yes, client_auth):
     nb_id = require_notebook(notebook_id)
 
     async def _run():
+        from ..client import NotebookLMClient
+
         async with NotebookLMClient(client_auth) as client:
             nb_id_resolved = await resolve_notebook_id(client, nb_id)
             resolved_id = await resolve_note_id(client, nb_id_resolved, note_id)
 
-            if not yes and not click.confirm(f"Delete note {resolved_id}?"):
+            if not confirm_action(f"Delete note {resolved_id}?", yes):
                 return
 
             await client.notes.delete(nb_id_resolved, resolved_id)
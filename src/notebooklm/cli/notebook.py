@@ -13,10 +13,11 @@ Note: Sharing commands moved to 'share' command group.
 import click
 from rich.table import Table
 
-from ..client import NotebookLMClient
 from .helpers import (
     clear_context,
+    confirm_action,
     console,
+    forget_cached_notebook,
     get_current_notebook,
     json_output_response,
     require_notebook,
@@ -29,14 +30,35 @@ def register_notebook_commands(cli):
     """Register notebook commands on the main CLI group."""
 
     @cli.command("list")
+    @click.option(
+        "--limit",
+        "-l",
+        type=click.IntRange(min=1),
+        default=None,
+        help="Show at most this many notebooks",
+    )
     @click.option("--json", "json_output", is_flag=True, help="Output as JSON")
     @with_client
-    def list_cmd(ctx, json_output, client_auth):
-        """List all notebooks."""
+    def list_cmd(ctx, limit, json_output, client_auth):
+        """List all notebooks.
+
+        The notebook list arrives in a single response, so on large accounts
+        use --limit to keep the table short.
+        """
 
         async def _run():
+            from ..client import NotebookLMClient
+
             async with NotebookLMClient(client_auth) as client:
-                notebooks = await client.notebooks.list()
+                if json_output:
+                    notebooks = await client.notebooks.list()
+                else:
+                    with console.status("Fetching notebooks..."):
+                        notebooks = await client.notebooks.list()
+
+                total = len(notebooks)
+                if limit is not None:
+                    notebooks = notebooks[:limit]
 
                 if json_output:
                     data = {
@@ -51,18 +73,20 @@ def register_notebook_commands(cli):
                             for i, nb in enumerate(notebooks, 1)
                         ],
                         "count": len(notebooks),
+                        "total": total,
                     }
                     json_output_response(data)
                     return
 
-                table = Table(title="Notebooks")
+                caption = f"Showing {len(notebooks)} of {total}" if len(notebooks) < total else None
+                table = Table(title="Notebooks", caption=caption)
                 table.add_column("ID", style="cyan")
                 table.add_column("Title", style="green")
                 table.add_column("Owner")
                 table.add_column("Created", style="dim")
 
                 for nb in notebooks:
-                    created = nb.created_at.strftime("%Y-%m-%d") if nb.created_at else "-"
+                    created = nb.created_at.date().isoformat() if nb.created_at else "-"
                     owner_status = "Owner" if nb.is_owner else "Shared"
                     table.add_row(nb.id, nb.title, owner_status, created)
 
@@ -78,6 +102,8 @@ def register_notebook_commands(cli):
         """Create a new notebook."""
 
         async def _run():
+            from ..client import NotebookLMClient
+
             async with NotebookLMClient(client_auth) as client:
                 nb = await client.notebooks.create(title)
 
@@ -114,17 +140,20 @@ def register_notebook_commands(cli):
         notebook_id = require_notebook(notebook_id)
 
         async def _run():
+            from ..client import NotebookLMClient
+
             async with NotebookLMClient(client_auth) as client:
                 # Resolve partial ID to full ID
                 resolved_id = await resolve_notebook_id(client, notebook_id)
 
                 # Confirm after resolution so user sees the full ID
-                if not yes and not click.confirm(f"Delete notebook {resolved_id}?"):
+                if not confirm_action(f"Delete notebook {resolved_id}?", yes):
                     return
 
                 success = await client.notebooks.delete(resolved_id)
                 if success:
                     console.print(f"[green]Deleted notebook:[/green] {resolved_id}")
+                    forget_cached_notebook(resolved_id)
                     # Clear context if we deleted the current notebook
                     if get_current_notebook() == resolved_id:
                         clear_context()
@@ -152,9 +181,12 @@ def register_notebook_commands(cli):
         notebook_id = require_notebook(notebook_id)
 
         async def _run():
+            from ..client import NotebookLMClient
+
             async with NotebookLMClient(client_auth) as client:
                 resolved_id = await resolve_notebook_id(client, notebook_id)
                 await client.notebooks.rename(resolved_id, new_title)
+                forget_cached_notebook(resolved_id)
                 console.print(f"[green]Renamed notebook:[/green] {resolved_id}")
                 console.print(f"[bold]New title:[/bold] {new_title}")
 
@@ -183,6 +215,8 @@ def register_notebook_commands(cli):
         notebook_id = require_notebook(notebook_id)
 
         async def _run():
+            from ..client import NotebookLMClient
+
             async with NotebookLMClient(client_auth) as client:
                 resolved_id = await resolve_notebook_id(client, notebook_id)
                 description = await client.notebooks.get_description(resolved_id)
@@ -192,8 +226,13 @@ def register_notebook_commands(cli):
 
                     if topics and description.suggested_topics:
                         console.print("\n[bold cyan]Suggested Topics:[/bold cyan]")
-                        for i, topic in enumerate(description.suggested_topics, 1):
-                            console.print(f"  {i}. {topic.question}")
+                        console.print(
+                            "\n".join(
+                                f"  {i}. {topic.question}"
+                                for i, topic in enumerate(description.suggested_topics, 1)
+                            ),
+                            markup=False,
+                        )
                 else:
                     console.print("[yellow]No summary available[/yellow]")
 
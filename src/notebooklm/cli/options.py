@@ -1,10 +1,26 @@
 """Shared CLI option decorators.
 
 Provides reusable option decorators to reduce boilerplate in commands.
+The underlying click.option decorators are built once at import and applied
+to every command that uses them.
 """
 
 import click
 
+_notebook_option = click.option(
+    "-n",
+    "--notebook",
+    "notebook_id",
+    default=None,
+    help="Notebook ID (uses current if not set). Supports partial IDs.",
+)
+_json_option = click.option(
+    "--json",
+    "json_output",
+    is_flag=True,
+    help="Output as JSON",
+)
+
 
 def notebook_option(f):
     """Add --notebook/-n option for notebook ID.
@@ -12,23 +28,12 @@ def notebook_option(f):
     The option defaults to None, allowing context-based resolution.
     Supports partial ID matching (e.g., 'abc' matches 'abc123...').
     """
-    return click.option(
-        "-n",
-        "--notebook",
-        "notebook_id",
-        default=None,
-        help="Notebook ID (uses current if not set). Supports partial IDs.",
-    )(f)
+    return _notebook_option(f)
 
 
 def json_option(f):
     """Add --json output flag."""
-    return click.option(
-        "--json",
-        "json_output",
-        is_flag=True,
-        help="Output as JSON",
-    )(f)
+    return _json_option(f)
 
 
 def wait_option(f):
@@ -91,6 +96,16 @@ def retry_option(f):
     )(f)
 
 
+def timeout_option(default: float = 300.0):
+    """Add --timeout option bounding how long --wait polls for completion."""
+    return click.option(
+        "--timeout",
+        type=click.FloatRange(min=1.0),
+        default=default,
+        help=f"Seconds to wait with --wait before giving up (default: {default:g})",
+    )
+
+
 # Composite decorators for common patterns
 
 
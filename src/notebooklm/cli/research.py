@@ -9,7 +9,6 @@ import asyncio
 
 import click
 
-from ..client import NotebookLMClient
 from .helpers import (
     console,
     display_research_sources,
@@ -65,6 +64,8 @@ def research_status(ctx, notebook_id, json_output, client_auth):
     nb_id = require_notebook(notebook_id)
 
     async def _run():
+        from ..client import NotebookLMClient
+
         async with NotebookLMClient(client_auth) as client:
             nb_id_resolved = await resolve_notebook_id(client, nb_id)
             status = await client.research.poll(nb_id_resolved)
@@ -136,6 +137,8 @@ def research_wait(ctx, notebook_id, timeout, interval, import_all, json_output,
     nb_id = require_notebook(notebook_id)
 
     async def _run():
+        from ..client import NotebookLMClient
+
         async with NotebookLMClient(client_auth) as client:
             nb_id_resolved = await resolve_notebook_id(client, nb_id)
             max_iterations = max(1, timeout // interval)
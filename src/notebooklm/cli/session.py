@@ -20,20 +20,18 @@ from typing import Any
 import click
 from rich.table import Table
 
-from ..auth import AuthTokens
-from ..client import NotebookLMClient
 from ..paths import (
     get_browser_profile_dir,
-    get_context_path,
     get_path_info,
     get_storage_path,
 )
 from .helpers import (
     clear_context,
     console,
-    get_client,
-    get_current_notebook,
+    get_cached_notebook,
+    get_context,
     json_output_response,
+    load_auth_tokens,
     resolve_notebook_id,
     run_async,
     set_current_notebook,
@@ -116,6 +114,17 @@ def _ensure_chromium_installed() -> None:
         )
 
 
+def _print_notebook_row(notebook_id: str, title: str, owner: str, created: str | None) -> None:
+    """Print the single-row notebook table shown by 'use'."""
+    table = Table()
+    table.add_column("ID", style="cyan")
+    table.add_column("Title", style="green")
+    table.add_column("Owner")
+    table.add_column("Created", style="dim")
+    table.add_row(notebook_id, title, owner, created or "-")
+    console.print(table)
+
+
 def register_session_commands(cli):
     """Register session commands on the main CLI group."""
 
@@ -126,12 +135,24 @@ def register_session_commands(cli):
         default=None,
         help="Where to save storage_state.json (default: $NOTEBOOKLM_HOME/storage_state.json)",
     )
-    def login(storage):
+    @click.option(
+        "--no-profile",
+        "no_profile",
+        is_flag=True,
+        help="Use a throwaway browser context seeded from storage_state.json "
+        "instead of the persistent browser profile",
+    )
+    def login(storage, no_profile):
         """Log in to NotebookLM via browser.
 
         Opens a browser window for Google login. After logging in,
         press ENTER in the terminal to save authentication.
 
+        By default a persistent browser profile is used, which Google is less
+        likely to flag as automated. With --no-profile, nothing is written
+        besides storage_state.json; existing cookies from that file are loaded
+        into the browser so a still-valid session doesn't need a full login.
+
         Note: Cannot be used when NOTEBOOKLM_AUTH_JSON is set (use file-based
         auth or unset the env var first).
         """
@@ -161,25 +182,41 @@ def register_session_commands(cli):
         _ensure_chromium_installed()
 
         storage_path = Path(storage) if storage else get_storage_path()
-        browser_profile = get_browser_profile_dir()
         storage_path.parent.mkdir(parents=True, exist_ok=True, mode=0o700)
-        browser_profile.mkdir(parents=True, exist_ok=True, mode=0o700)
+        browser_args = [
+            "--disable-blink-features=AutomationControlled",
+            "--password-store=basic",  # Avoid macOS keychain encryption for headless compatibility
+        ]
 
         console.print("[yellow]Opening browser for Google login...[/yellow]")
-        console.print(f"[dim]Using persistent profile: {browser_profile}[/dim]")
+        if no_profile:
+            browser_profile = None
+            console.print("[dim]Using temporary browser context (no persistent profile)[/dim]")
+        else:
+            browser_profile = get_browser_profile_dir()
+            browser_profile.mkdir(parents=True, exist_ok=True, mode=0o700)
+            console.print(f"[dim]Using persistent profile: {browser_profile}[/dim]")
 
         # Use context manager to restore ProactorEventLoop for Playwright on Windows
         # (fixes #89: NotImplementedError on Windows Python 3.12)
         with _windows_playwright_event_loop(), sync_playwright() as p:
-            context = p.chromium.launch_persistent_context(
-                user_data_dir=str(browser_profile),
-                headless=False,
-                args=[
-                    "--disable-blink-features=AutomationControlled",
-                    "--password-store=basic",  # Avoid macOS keychain encryption for headless compatibility
-                ],
-                ignore_default_args=["--enable-automation"],
-            )
+            if browser_profile is None:
+                browser = p.chromium.launch(
+                    headless=False,
+                    args=browser_args,
+                    ignore_default_args=["--enable-automation"],
+                )
+                # Reuse saved cookies so an unexpired session skips the login form
+                context = browser.new_context(
+                    storage_state=str(storage_path) if storage_path.exists() else None
+                )
+            else:
+                context = p.chromium.launch_persistent_context(
+                    user_data_dir=str(browser_profile),
+                    headless=False,
+                    args=browser_args,
+                    ignore_default_args=["--enable-automation"],
+                )
 
             page = context.pages[0] if context.pages else context.new_page()
             page.goto("https://notebooklm.google.com/")
@@ -216,17 +253,33 @@ def register_session_commands(cli):
 
         Supports partial IDs - 'notebooklm use abc' matches 'abc123...'
 
+        Notebook details are cached for 10 minutes, so switching back to a
+        recently used notebook by its full ID doesn't hit the network.
+
         \b
         Example:
           notebooklm use nb123
           notebooklm ask "what is this about?"   # Uses nb123
           notebooklm generate video "a fun explainer"  # Uses nb123
         """
+        # Re-using a recently used notebook: skip auth and the API round-trip
+        cached = get_cached_notebook(notebook_id)
+        if cached is not None:
+            set_current_notebook(
+                notebook_id, cached.get("title"), cached.get("is_owner"), cached.get("created_at")
+            )
+            owner_status = "Owner" if cached.get("is_owner") else "Shared"
+            _print_notebook_row(
+                notebook_id, cached.get("title") or "-", owner_status, cached.get("created_at")
+            )
+            return
+
         try:
-            cookies, csrf, session_id = get_client(ctx)
-            auth = AuthTokens(cookies=cookies, csrf_token=csrf, session_id=session_id)
 
             async def _get():
+                from ..client import NotebookLMClient
+
+                auth = await load_auth_tokens(ctx)
                 async with NotebookLMClient(auth) as client:
                     # Resolve partial ID to full ID
                     resolved_id = await resolve_notebook_id(client, notebook_id)
@@ -235,42 +288,23 @@ def register_session_commands(cli):
 
             nb, resolved_id = run_async(_get())
 
-            created_str = nb.created_at.strftime("%Y-%m-%d") if nb.created_at else None
-            set_current_notebook(resolved_id, nb.title, nb.is_owner, created_str)
-
-            table = Table()
-            table.add_column("ID", style="cyan")
-            table.add_column("Title", style="green")
-            table.add_column("Owner")
-            table.add_column("Created", style="dim")
+            created_str = nb.created_at.date().isoformat() if nb.created_at else None
+            set_current_notebook(
+                resolved_id, nb.title, nb.is_owner, created_str, cache_metadata=True
+            )
 
-            created = created_str or "-"
             owner_status = "Owner" if nb.is_owner else "Shared"
-            table.add_row(nb.id, nb.title, owner_status, created)
-
-            console.print(table)
+            _print_notebook_row(nb.id, nb.title, owner_status, created_str)
 
         except FileNotFoundError:
             set_current_notebook(notebook_id)
-            table = Table()
-            table.add_column("ID", style="cyan")
-            table.add_column("Title", style="green")
-            table.add_column("Owner")
-            table.add_column("Created", style="dim")
-            table.add_row(notebook_id, "-", "-", "-")
-            console.print(table)
+            _print_notebook_row(notebook_id, "-", "-", None)
         except click.ClickException:
             # Re-raise click exceptions (from resolve_notebook_id)
             raise
         except Exception as e:
             set_current_notebook(notebook_id)
-            table = Table()
-            table.add_column("ID", style="cyan")
-            table.add_column("Title", style="green")
-            table.add_column("Owner")
-            table.add_column("Created", style="dim")
-            table.add_row(notebook_id, f"Warning: {str(e)}", "-", "-")
-            console.print(table)
+            _print_notebook_row(notebook_id, f"Warning: {str(e)}", "-", None)
 
     @cli.command("status")
     @click.option("--json", "json_output", is_flag=True, help="Output as JSON")
@@ -281,9 +315,6 @@ def register_session_commands(cli):
         Use --paths to see where configuration files are located
         (useful for debugging NOTEBOOKLM_HOME).
         """
-        context_file = get_context_path()
-        notebook_id = get_current_notebook()
-
         # Handle --paths flag
         if show_paths:
             path_info = get_path_info()
@@ -310,77 +341,48 @@ def register_session_commands(cli):
             console.print(table)
             return
 
-        if notebook_id:
-            try:
-                data = json.loads(context_file.read_text(encoding="utf-8"))
-                title = data.get("title", "-")
-                is_owner = data.get("is_owner", True)
-                created_at = data.get("created_at", "-")
-                conversation_id = data.get("conversation_id")
-
-                if json_output:
-                    json_data = {
-                        "has_context": True,
-                        "notebook": {
-                            "id": notebook_id,
-                            "title": title if title != "-" else None,
-                            "is_owner": is_owner,
-                        },
-                        "conversation_id": conversation_id,
-                    }
-                    json_output_response(json_data)
-                    return
-
-                table = Table(title="Current Context")
-                table.add_column("Property", style="dim")
-                table.add_column("Value", style="cyan")
-
-                table.add_row("Notebook ID", notebook_id)
-                table.add_row("Title", str(title))
-                owner_status = "Owner" if is_owner else "Shared"
-                table.add_row("Ownership", owner_status)
-                table.add_row("Created", created_at)
-                if conversation_id:
-                    table.add_row("Conversation", conversation_id)
-                else:
-                    table.add_row("Conversation", "[dim]None (will auto-select on next ask)[/dim]")
-                console.print(table)
-            except (OSError, json.JSONDecodeError):
-                if json_output:
-                    json_data = {
-                        "has_context": True,
-                        "notebook": {
-                            "id": notebook_id,
-                            "title": None,
-                            "is_owner": None,
-                        },
-                        "conversation_id": None,
-                    }
-                    json_output_response(json_data)
-                    return
-
-                table = Table(title="Current Context")
-                table.add_column("Property", style="dim")
-                table.add_column("Value", style="cyan")
-                table.add_row("Notebook ID", notebook_id)
-                table.add_row("Title", "-")
-                table.add_row("Ownership", "-")
-                table.add_row("Created", "-")
-                table.add_row("Conversation", "[dim]None[/dim]")
-                console.print(table)
-        else:
-            if json_output:
-                json_data = {
-                    "has_context": False,
-                    "notebook": None,
-                    "conversation_id": None,
+        # Single read of the context file; empty if missing or corrupt
+        data = get_context()
+        notebook_id = data.get("notebook_id")
+        title = data.get("title")
+        is_owner = data.get("is_owner", True)
+        conversation_id = data.get("conversation_id")
+
+        # JSON output needs no Rich setup, so emit it before building any table
+        if json_output:
+            json_output_response(
+                {
+                    "has_context": bool(notebook_id),
+                    "notebook": (
+                        {"id": notebook_id, "title": title, "is_owner": is_owner}
+                        if notebook_id
+                        else None
+                    ),
+                    "conversation_id": conversation_id if notebook_id else None,
                 }
-                json_output_response(json_data)
-                return
+            )
+            return
 
+        if not notebook_id:
             console.print(
                 "[yellow]No notebook selected. Use 'notebooklm use <id>' to set one.[/yellow]"
             )
+            return
+
+        table = Table(title="Current Context")
+        table.add_column("Property", style="dim")
+        table.add_column("Value", style="cyan")
+
+        table.add_row("Notebook ID", notebook_id)
+        table.add_row("Title", title or "-")
+        owner_status = "Owner" if is_owner else "Shared"
+        table.add_row("Ownership", owner_status)
+        table.add_row("Created", data.get("created_at", "-"))
+        if conversation_id:
+            table.add_row("Conversation", conversation_id)
+        else:
+            table.add_row("Conversation", "[dim]None (will auto-select on next ask)[/dim]")
+        console.print(table)
 
     @cli.command("clear")
     def clear_cmd():
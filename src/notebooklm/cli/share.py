@@ -12,9 +12,9 @@ Commands:
 import click
 from rich.table import Table
 
-from ..client import NotebookLMClient
 from ..types import SharePermission, ShareViewLevel
 from .helpers import (
+    confirm_action,
     console,
     json_output_response,
     require_notebook,
@@ -46,6 +46,10 @@ def _parse_permission(permission: str) -> SharePermission:
     return SharePermission.VIEWER
 
 
+# Shared by the add and update --permission options
+_PERMISSION_CHOICE = click.Choice(["editor", "viewer"], case_sensitive=False)
+
+
 @click.group()
 def share():
     """Notebook sharing commands.
@@ -88,6 +92,8 @@ def share_status(ctx, notebook_id, json_output, client_auth):
     nb_id = require_notebook(notebook_id)
 
     async def _run():
+        from ..client import NotebookLMClient
+
         async with NotebookLMClient(client_auth) as client:
             resolved_id = await resolve_notebook_id(client, nb_id)
             status = await client.sharing.get_status(resolved_id)
@@ -171,6 +177,8 @@ def share_public(ctx, notebook_id, enable, json_output, client_auth):
     nb_id = require_notebook(notebook_id)
 
     async def _run():
+        from ..client import NotebookLMClient
+
         async with NotebookLMClient(client_auth) as client:
             resolved_id = await resolve_notebook_id(client, nb_id)
             status = await client.sharing.set_public(resolved_id, enable)
@@ -224,6 +232,8 @@ def share_view_level(ctx, level, notebook_id, json_output, client_auth):
     )
 
     async def _run():
+        from ..client import NotebookLMClient
+
         async with NotebookLMClient(client_auth) as client:
             resolved_id = await resolve_notebook_id(client, nb_id)
             status = await client.sharing.set_view_level(resolved_id, view_level)
@@ -255,7 +265,7 @@ def share_view_level(ctx, level, notebook_id, json_output, client_auth):
 @click.option(
     "--permission",
     "-p",
-    type=click.Choice(["editor", "viewer"], case_sensitive=False),
+    type=_PERMISSION_CHOICE,
     default="viewer",
     help="Permission level (default: viewer)",
 )
@@ -280,6 +290,8 @@ def share_add(ctx, email, notebook_id, permission, no_notify, message, json_outp
     perm = _parse_permission(permission)
 
     async def _run():
+        from ..client import NotebookLMClient
+
         async with NotebookLMClient(client_auth) as client:
             resolved_id = await resolve_notebook_id(client, nb_id)
             await client.sharing.add_user(
@@ -319,7 +331,7 @@ def share_add(ctx, email, notebook_id, permission, no_notify, message, json_outp
 @click.option(
     "--permission",
     "-p",
-    type=click.Choice(["editor", "viewer"], case_sensitive=False),
+    type=_PERMISSION_CHOICE,
     required=True,
     help="New permission level",
 )
@@ -339,6 +351,8 @@ def share_update(ctx, email, notebook_id, permission, json_output, client_auth):
     perm = _parse_permission(permission)
 
     async def _run():
+        from ..client import NotebookLMClient
+
         async with NotebookLMClient(client_auth) as client:
             resolved_id = await resolve_notebook_id(client, nb_id)
             await client.sharing.update_user(resolved_id, email, perm)
@@ -380,13 +394,14 @@ def share_remove(ctx, email, notebook_id, yes, json_output, client_auth):
     nb_id = require_notebook(notebook_id)
 
     async def _run():
+        from ..client import NotebookLMClient
+
         async with NotebookLMClient(client_auth) as client:
             resolved_id = await resolve_notebook_id(client, nb_id)
 
             # Confirm after resolution so user sees context
-            if not yes and not json_output:
-                if not click.confirm(f"Remove access for {email}?"):
-                    return
+            if not json_output and not confirm_action(f"Remove access for {email}?", yes):
+                return
 
             await client.sharing.remove_user(resolved_id, email)
 
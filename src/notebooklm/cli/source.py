@@ -15,24 +15,54 @@ Commands:
 """
 
 import asyncio
+import contextlib
+import errno
+import os
+import stat
+import time
 from pathlib import Path
 
 import click
 from rich.table import Table
 
 from .._url_utils import is_youtube_url
-from ..client import NotebookLMClient
+from ..rpc import DriveMimeType
 from ..types import source_status_to_str
 from .helpers import (
+    confirm_action,
     console,
     display_research_sources,
+    format_timestamp,
     get_source_type_display,
     json_output_response,
     require_notebook,
     resolve_notebook_id,
+    resolve_source,
     resolve_source_id,
     with_client,
 )
+from .options import json_option, notebook_option
+
+# add-research polling: start fast so quick searches return promptly, then back
+# off to the 5s interval used for long-running deep research
+RESEARCH_POLL_INITIAL_INTERVAL = 0.5
+RESEARCH_POLL_MAX_INTERVAL = 5.0
+RESEARCH_POLL_BACKOFF = 1.5
+RESEARCH_POLL_TIMEOUT = 300.0
+
+# --mime-type choices for add-drive, mapped to the Drive MIME type sent to the API
+_DRIVE_MIME_TYPES = {
+    "google-doc": DriveMimeType.GOOGLE_DOC.value,
+    "google-slides": DriveMimeType.GOOGLE_SLIDES.value,
+    "google-sheets": DriveMimeType.GOOGLE_SHEETS.value,
+    "pdf": DriveMimeType.PDF.value,
+}
+
+# Option types shared by the decorators below, built once at import
+_SOURCE_TYPE_CHOICE = click.Choice(["url", "text", "file", "youtube"])
+_DRIVE_MIME_CHOICE = click.Choice(list(_DRIVE_MIME_TYPES))
+_RESEARCH_SOURCE_CHOICE = click.Choice(["web", "drive"])
+_RESEARCH_MODE_CHOICE = click.Choice(["fast", "deep"])
 
 
 @click.group()
@@ -60,28 +90,38 @@ def source():
 
 
 @source.command("list")
+@notebook_option
 @click.option(
-    "-n",
-    "--notebook",
-    "notebook_id",
+    "--limit",
+    "-l",
+    type=click.IntRange(min=1),
     default=None,
-    help="Notebook ID (uses current if not set)",
+    help="Show at most this many sources",
 )
-@click.option("--json", "json_output", is_flag=True, help="Output as JSON")
+@json_option
 @with_client
-def source_list(ctx, notebook_id, json_output, client_auth):
-    """List all sources in a notebook."""
+def source_list(ctx, notebook_id, limit, json_output, client_auth):
+    """List all sources in a notebook.
+
+    All sources arrive in a single response, so on large notebooks use
+    --limit to keep the table short.
+    """
     nb_id = require_notebook(notebook_id)
 
     async def _run():
+        from ..client import NotebookLMClient
+
         async with NotebookLMClient(client_auth) as client:
             nb_id_resolved = await resolve_notebook_id(client, nb_id)
-            sources = await client.sources.list(nb_id_resolved)
-            nb = None
-            if json_output:
-                nb = await client.notebooks.get(nb_id_resolved)
-
             if json_output:
+                # The title lookup is independent of the source list; fetch both at once
+                sources, nb = await asyncio.gather(
+                    client.sources.list(nb_id_resolved),
+                    client.notebooks.get(nb_id_resolved),
+                )
+                total = len(sources)
+                if limit is not None:
+                    sources = sources[:limit]
                 data = {
                     "notebook_id": nb_id_resolved,
                     "notebook_title": nb.title if nb else None,
@@ -99,11 +139,19 @@ def source_list(ctx, notebook_id, json_output, client_auth):
                         for i, src in enumerate(sources, 1)
                     ],
                     "count": len(sources),
+                    "total": total,
                 }
                 json_output_response(data)
                 return
 
-            table = Table(title=f"Sources in {nb_id_resolved}")
+            with console.status("Fetching sources..."):
+                sources = await client.sources.list(nb_id_resolved)
+            total = len(sources)
+            if limit is not None:
+                sources = sources[:limit]
+
+            caption = f"Showing {len(sources)} of {total}" if len(sources) < total else None
+            table = Table(title=f"Sources in {nb_id_resolved}", caption=caption)
             table.add_column("ID", style="cyan")
             table.add_column("Title", style="green")
             table.add_column("Type")
@@ -112,7 +160,7 @@ def source_list(ctx, notebook_id, json_output, client_auth):
 
             for src in sources:
                 type_display = get_source_type_display(src.kind)
-                created = src.created_at.strftime("%Y-%m-%d %H:%M") if src.created_at else "-"
+                created = format_timestamp(src.created_at)
                 status = source_status_to_str(src.status)
                 table.add_row(src.id, src.title or "-", type_display, created, status)
 
@@ -121,25 +169,47 @@ def source_list(ctx, notebook_id, json_output, client_auth):
     return _run()
 
 
+# stat() errors meaning "not an existing path", as pathlib's exists() treats
+# them, plus ENAMETOOLONG for long inline text; Windows reports invalid
+# names (e.g. text containing '?' or '"') through winerror instead
+_NOT_A_PATH_ERRNOS = frozenset(
+    {errno.ENOENT, errno.ENOTDIR, errno.EBADF, errno.ELOOP, errno.ENAMETOOLONG}
+)
+_NOT_A_PATH_WINERRORS = frozenset({21, 123, 1921})
+
+
+def _stat_if_path(content: str) -> os.stat_result | None:
+    """Stat content if it names an existing path, else None (inline text).
+
+    Raises:
+        click.ClickException: If the path exists but cannot be accessed
+    """
+    try:
+        return os.stat(content)
+    except ValueError:
+        # Embedded null byte and similar: not a path
+        return None
+    except PermissionError as e:
+        raise click.ClickException(f"Cannot access {content}: {e.strerror}") from e
+    except OSError as e:
+        if e.errno in _NOT_A_PATH_ERRNOS or getattr(e, "winerror", None) in _NOT_A_PATH_WINERRORS:
+            return None
+        raise
+
+
 @source.command("add")
 @click.argument("content")
-@click.option(
-    "-n",
-    "--notebook",
-    "notebook_id",
-    default=None,
-    help="Notebook ID (uses current if not set)",
-)
+@notebook_option
 @click.option(
     "--type",
     "source_type",
-    type=click.Choice(["url", "text", "file", "youtube"]),
+    type=_SOURCE_TYPE_CHOICE,
     default=None,
     help="Source type (auto-detected if not specified)",
 )
 @click.option("--title", help="Title for text sources")
 @click.option("--mime-type", help="MIME type for file sources")
-@click.option("--json", "json_output", is_flag=True, help="Output as JSON")
+@json_option
 @with_client
 def source_add(ctx, content, notebook_id, source_type, title, mime_type, json_output, client_auth):
     """Add a source to a notebook.
@@ -147,14 +217,14 @@ def source_add(ctx, content, notebook_id, source_type, title, mime_type, json_ou
     \b
     Source type is auto-detected:
       - URLs (http/https) -> url or youtube
-      - Existing files (.txt, .md) -> text
+      - Existing files -> file (uploaded)
       - Other content -> text (inline)
       - Use --type to override
 
     \b
     Examples:
       source add https://example.com              # URL
-      source add ./doc.md                         # File content as text
+      source add ./doc.md                         # File upload
       source add https://youtube.com/...          # YouTube video
       source add "My notes here"                  # Inline text
       source add "My notes" --title "Research"   # Text with custom title
@@ -163,34 +233,44 @@ def source_add(ctx, content, notebook_id, source_type, title, mime_type, json_ou
 
     # Auto-detect source type if not specified
     detected_type = source_type
-    file_content = None
-    file_title = title
+    text_title = title
 
     if detected_type is None:
         if content.startswith(("http://", "https://")):
             detected_type = "youtube" if is_youtube_url(content) else "url"
-        elif Path(content).exists():
-            file_path = Path(content).resolve()  # Resolve symlinks
-            # Security: Ensure it's a regular file (not a symlink to sensitive file)
-            if not file_path.is_file():
-                raise click.ClickException(f"Not a regular file: {content}")
-            # All files use add_file() for proper type detection
-            detected_type = "file"
         else:
-            detected_type = "text"
-            file_title = title or "Pasted Text"
+            # One stat (following symlinks) answers both "does it exist" and
+            # "is it a regular file".
+            st = _stat_if_path(content)
+            if st is not None:
+                # Security: Ensure it's a regular file (not a directory/device)
+                if not stat.S_ISREG(st.st_mode):
+                    raise click.ClickException(f"Not a regular file: {content}")
+                # All files use add_file() for proper type detection
+                detected_type = "file"
+            else:
+                detected_type = "text"
+                text_title = title or "Pasted Text"
 
     async def _run():
+        from ..client import NotebookLMClient
+
         async with NotebookLMClient(client_auth) as client:
-            nb_id_resolved = await resolve_notebook_id(client, nb_id)
-            if detected_type == "url" or detected_type == "youtube":
-                src = await client.sources.add_url(nb_id_resolved, content)
-            elif detected_type == "text":
-                text_content = file_content if file_content is not None else content
-                text_title = file_title or "Untitled"
-                src = await client.sources.add_text(nb_id_resolved, text_title, text_content)
-            elif detected_type == "file":
-                src = await client.sources.add_file(nb_id_resolved, content, mime_type)
+            status = (
+                contextlib.nullcontext()
+                if json_output
+                else console.status(f"Adding {detected_type} source...")
+            )
+            with status:
+                nb_id_resolved = await resolve_notebook_id(client, nb_id)
+                if detected_type == "url" or detected_type == "youtube":
+                    src = await client.sources.add_url(nb_id_resolved, content)
+                elif detected_type == "text":
+                    src = await client.sources.add_text(
+                        nb_id_resolved, text_title or "Untitled", content
+                    )
+                elif detected_type == "file":
+                    src = await client.sources.add_file(nb_id_resolved, content, mime_type)
 
             if json_output:
                 data = {
@@ -206,21 +286,12 @@ def source_add(ctx, content, notebook_id, source_type, title, mime_type, json_ou
 
             console.print(f"[green]Added source:[/green] {src.id}")
 
-    if not json_output:
-        with console.status(f"Adding {detected_type} source..."):
-            return _run()
     return _run()
 
 
 @source.command("get")
 @click.argument("source_id")
-@click.option(
-    "-n",
-    "--notebook",
-    "notebook_id",
-    default=None,
-    help="Notebook ID (uses current if not set)",
-)
+@notebook_option
 @with_client
 def source_get(ctx, source_id, notebook_id, client_auth):
     """Get source details.
@@ -230,11 +301,12 @@ def source_get(ctx, source_id, notebook_id, client_auth):
     nb_id = require_notebook(notebook_id)
 
     async def _run():
+        from ..client import NotebookLMClient
+
         async with NotebookLMClient(client_auth) as client:
             nb_id_resolved = await resolve_notebook_id(client, nb_id)
-            # Resolve partial ID to full ID
-            resolved_id = await resolve_source_id(client, nb_id_resolved, source_id)
-            src = await client.sources.get(nb_id_resolved, resolved_id)
+            # Resolve partial ID and look up the source from a single list call
+            src = await resolve_source(client, nb_id_resolved, source_id)
             if src:
                 console.print(f"[bold cyan]Source:[/bold cyan] {src.id}")
                 console.print(f"[bold]Title:[/bold] {src.title}")
@@ -242,9 +314,7 @@ def source_get(ctx, source_id, notebook_id, client_auth):
                 if src.url:
                     console.print(f"[bold]URL:[/bold] {src.url}")
                 if src.created_at:
-                    console.print(
-                        f"[bold]Created:[/bold] {src.created_at.strftime('%Y-%m-%d %H:%M')}"
-                    )
+                    console.print(f"[bold]Created:[/bold] {format_timestamp(src.created_at)}")
             else:
                 console.print("[yellow]Source not found[/yellow]")
 
@@ -253,13 +323,7 @@ def source_get(ctx, source_id, notebook_id, client_auth):
 
 @source.command("delete")
 @click.argument("source_id")
-@click.option(
-    "-n",
-    "--notebook",
-    "notebook_id",
-    default=None,
-    help="Notebook ID (uses current if not set)",
-)
+@notebook_option
 @click.option("--yes", "-y", is_flag=True, help="Skip confirmation")
 @with_client
 def source_delete(ctx, source_id, notebook_id, yes, client_auth):
@@ -270,12 +334,14 @@ def source_delete(ctx, source_id, notebook_id, yes, client_auth):
     nb_id = require_notebook(notebook_id)
 
     async def _run():
+        from ..client import NotebookLMClient
+
         async with NotebookLMClient(client_auth) as client:
             nb_id_resolved = await resolve_notebook_id(client, nb_id)
             # Resolve partial ID to full ID
             resolved_id = await resolve_source_id(client, nb_id_resolved, source_id)
 
-            if not yes and not click.confirm(f"Delete source {resolved_id}?"):
+            if not confirm_action(f"Delete source {resolved_id}?", yes):
                 return
 
             success = await client.sources.delete(nb_id_resolved, resolved_id)
@@ -290,13 +356,7 @@ def source_delete(ctx, source_id, notebook_id, yes, client_auth):
 @source.command("rename")
 @click.argument("source_id")
 @click.argument("new_title")
-@click.option(
-    "-n",
-    "--notebook",
-    "notebook_id",
-    default=None,
-    help="Notebook ID (uses current if not set)",
-)
+@notebook_option
 @with_client
 def source_rename(ctx, source_id, new_title, notebook_id, client_auth):
     """Rename a source.
@@ -306,6 +366,8 @@ def source_rename(ctx, source_id, new_title, notebook_id, client_auth):
     nb_id = require_notebook(notebook_id)
 
     async def _run():
+        from ..client import NotebookLMClient
+
         async with NotebookLMClient(client_auth) as client:
             nb_id_resolved = await resolve_notebook_id(client, nb_id)
             # Resolve partial ID to full ID
@@ -319,13 +381,7 @@ def source_rename(ctx, source_id, new_title, notebook_id, client_auth):
 
 @source.command("refresh")
 @click.argument("source_id")
-@click.option(
-    "-n",
-    "--notebook",
-    "notebook_id",
-    default=None,
-    help="Notebook ID (uses current if not set)",
-)
+@notebook_option
 @with_client
 def source_refresh(ctx, source_id, notebook_id, client_auth):
     """Refresh a URL/Drive source.
@@ -335,6 +391,8 @@ def source_refresh(ctx, source_id, notebook_id, client_auth):
     nb_id = require_notebook(notebook_id)
 
     async def _run():
+        from ..client import NotebookLMClient
+
         async with NotebookLMClient(client_auth) as client:
             nb_id_resolved = await resolve_notebook_id(client, nb_id)
             # Resolve partial ID to full ID
@@ -356,34 +414,22 @@ def source_refresh(ctx, source_id, notebook_id, client_auth):
 @source.command("add-drive")
 @click.argument("file_id")
 @click.argument("title")
-@click.option(
-    "-n",
-    "--notebook",
-    "notebook_id",
-    default=None,
-    help="Notebook ID (uses current if not set)",
-)
+@notebook_option
 @click.option(
     "--mime-type",
-    type=click.Choice(["google-doc", "google-slides", "google-sheets", "pdf"]),
+    type=_DRIVE_MIME_CHOICE,
     default="google-doc",
     help="Document type (default: google-doc)",
 )
 @with_client
 def source_add_drive(ctx, file_id, title, notebook_id, mime_type, client_auth):
     """Add a Google Drive document as a source."""
-    from ..rpc import DriveMimeType
-
     nb_id = require_notebook(notebook_id)
-    mime_map = {
-        "google-doc": DriveMimeType.GOOGLE_DOC.value,
-        "google-slides": DriveMimeType.GOOGLE_SLIDES.value,
-        "google-sheets": DriveMimeType.GOOGLE_SHEETS.value,
-        "pdf": DriveMimeType.PDF.value,
-    }
-    mime = mime_map[mime_type]
+    mime = _DRIVE_MIME_TYPES[mime_type]
 
     async def _run():
+        from ..client import NotebookLMClient
+
         async with NotebookLMClient(client_auth) as client:
             nb_id_resolved = await resolve_notebook_id(client, nb_id)
             with console.status("Adding Drive source..."):
@@ -397,23 +443,17 @@ def source_add_drive(ctx, file_id, title, notebook_id, mime_type, client_auth):
 
 @source.command("add-research")
 @click.argument("query")
-@click.option(
-    "-n",
-    "--notebook",
-    "notebook_id",
-    default=None,
-    help="Notebook ID (uses current if not set)",
-)
+@notebook_option
 @click.option(
     "--from",
     "search_source",
-    type=click.Choice(["web", "drive"]),
+    type=_RESEARCH_SOURCE_CHOICE,
     default="web",
     help="Search source (default: web)",
 )
 @click.option(
     "--mode",
-    type=click.Choice(["fast", "deep"]),
+    type=_RESEARCH_MODE_CHOICE,
     default="fast",
     help="Search mode (default: fast)",
 )
@@ -440,6 +480,8 @@ def source_add_research(
     nb_id = require_notebook(notebook_id)
 
     async def _run():
+        from ..client import NotebookLMClient
+
         async with NotebookLMClient(client_auth) as client:
             nb_id_resolved = await resolve_notebook_id(client, nb_id)
             console.print(f"[yellow]Starting {mode} research on {search_source}...[/yellow]")
@@ -459,17 +501,20 @@ def source_add_research(
                 )
                 return
 
-            status = None
-            for _ in range(60):
+            interval = RESEARCH_POLL_INITIAL_INTERVAL
+            deadline = time.monotonic() + RESEARCH_POLL_TIMEOUT
+            while True:
                 status = await client.research.poll(nb_id_resolved)
                 if status.get("status") == "completed":
                     break
                 elif status.get("status") == "no_research":
                     console.print("[red]Research failed to start[/red]")
                     raise SystemExit(1)
-                await asyncio.sleep(5)
-            else:
-                status = {"status": "timeout"}
+                if time.monotonic() >= deadline:
+                    status = {"status": "timeout"}
+                    break
+                await asyncio.sleep(interval)
+                interval = min(interval * RESEARCH_POLL_BACKOFF, RESEARCH_POLL_MAX_INTERVAL)
 
             if status.get("status") == "completed":
                 sources = status.get("sources", [])
@@ -489,14 +534,8 @@ def source_add_research(
 
 @source.command("fulltext")
 @click.argument("source_id")
-@click.option(
-    "-n",
-    "--notebook",
-    "notebook_id",
-    default=None,
-    help="Notebook ID (uses current if not set)",
-)
-@click.option("--json", "json_output", is_flag=True, help="Output as JSON")
+@notebook_option
+@json_option
 @click.option("--output", "-o", type=click.Path(), help="Write content to file")
 @with_client
 def source_fulltext(ctx, source_id, notebook_id, json_output, output, client_auth):
@@ -516,6 +555,8 @@ def source_fulltext(ctx, source_id, notebook_id, json_output, output, client_aut
     nb_id = require_notebook(notebook_id)
 
     async def _run():
+        from ..client import NotebookLMClient
+
         async with NotebookLMClient(client_auth) as client:
             nb_id_resolved = await resolve_notebook_id(client, nb_id)
             resolved_id = await resolve_source_id(client, nb_id_resolved, source_id)
@@ -555,14 +596,8 @@ def source_fulltext(ctx, source_id, notebook_id, json_output, output, client_aut
 
 @source.command("guide")
 @click.argument("source_id")
-@click.option(
-    "-n",
-    "--notebook",
-    "notebook_id",
-    default=None,
-    help="Notebook ID (uses current if not set)",
-)
-@click.option("--json", "json_output", is_flag=True, help="Output as JSON")
+@notebook_option
+@json_option
 @with_client
 def source_guide(ctx, source_id, notebook_id, json_output, client_auth):
     """Get AI-generated source summary and keywords.
@@ -580,6 +615,8 @@ def source_guide(ctx, source_id, notebook_id, json_output, client_auth):
     nb_id = require_notebook(notebook_id)
 
     async def _run():
+        from ..client import NotebookLMClient
+
         async with NotebookLMClient(client_auth) as client:
             nb_id_resolved = await resolve_notebook_id(client, nb_id)
             resolved_id = await resolve_source_id(client, nb_id_resolved, source_id)
@@ -617,13 +654,7 @@ def source_guide(ctx, source_id, notebook_id, json_output, client_auth):
 
 @source.command("stale")
 @click.argument("source_id")
-@click.option(
-    "-n",
-    "--notebook",
-    "notebook_id",
-    default=None,
-    help="Notebook ID (uses current if not set)",
-)
+@notebook_option
 @with_client
 def source_stale(ctx, source_id, notebook_id, client_auth):
     """Check if a URL/Drive source needs refresh.
@@ -640,6 +671,8 @@ def source_stale(ctx, source_id, notebook_id, client_auth):
     nb_id = require_notebook(notebook_id)
 
     async def _run():
+        from ..client import NotebookLMClient
+
         async with NotebookLMClient(client_auth) as client:
             nb_id_resolved = await resolve_notebook_id(client, nb_id)
             resolved_id = await resolve_source_id(client, nb_id_resolved, source_id)
@@ -658,20 +691,14 @@ def source_stale(ctx, source_id, notebook_id, client_auth):
 
 @source.command("wait")
 @click.argument("source_id")
-@click.option(
-    "-n",
-    "--notebook",
-    "notebook_id",
-    default=None,
-    help="Notebook ID (uses current if not set)",
-)
+@notebook_option
 @click.option(
     "--timeout",
     default=120,
     type=int,
     help="Maximum seconds to wait (default: 120)",
 )
-@click.option("--json", "json_output", is_flag=True, help="Output as JSON")
+@json_option
 @with_client
 def source_wait(ctx, source_id, notebook_id, timeout, json_output, client_auth):
     """Wait for a source to finish processing.
@@ -705,6 +732,8 @@ def source_wait(ctx, source_id, notebook_id, timeout, json_output, client_auth):
     nb_id = require_notebook(notebook_id)
 
     async def _run():
+        from ..client import NotebookLMClient
+
         async with NotebookLMClient(client_auth) as client:
             nb_id_resolved = await resolve_notebook_id(client, nb_id)
             resolved_id = await resolve_source_id(client, nb_id_resolved, source_id)
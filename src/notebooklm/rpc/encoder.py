@@ -9,6 +9,10 @@ from .types import RPCMethod
 
 logger = logging.getLogger(__name__)
 
+# Compact JSON encoder (no spaces, matching Chrome), built once. json.dumps()
+# with non-default separators constructs a fresh JSONEncoder on every call.
+_COMPACT_JSON = json.JSONEncoder(separators=(",", ":"))
+
 
 def encode_rpc_request(method: RPCMethod, params: list[Any]) -> list:
     """
@@ -25,7 +29,7 @@ def encode_rpc_request(method: RPCMethod, params: list[Any]) -> list:
         Triple-nested array structure for batchexecute
     """
     # JSON-encode params without spaces (compact format matching Chrome)
-    params_json = json.dumps(params, separators=(",", ":"))
+    params_json = _COMPACT_JSON.encode(params)
     logger.debug("Encoding RPC: method=%s, param_count=%d", method.value, len(params))
 
     # Build inner request: [rpc_id, json_params, null, "generic"]
@@ -52,7 +56,7 @@ def build_request_body(
         Form-encoded body string with trailing &
     """
     # JSON-encode the request (compact, no spaces)
-    f_req = json.dumps(rpc_request, separators=(",", ":"))
+    f_req = _COMPACT_JSON.encode(rpc_request)
 
     # URL encode with safe='' to encode all special characters
     body_parts = [f"f.req={quote(f_req, safe='')}"]
@@ -10,6 +10,7 @@ from notebooklm import NotebookLMClient
 from notebooklm.rpc import AudioFormat, AudioLength, RPCError, RPCMethod, VideoFormat, VideoStyle
 from notebooklm.types import (
     ArtifactNotReadyError,
+    ArtifactType,
 )
 
 
@@ -298,6 +299,26 @@ class TestArtifactsAPI:
 
         assert isinstance(artifacts, list)
 
+    @pytest.mark.asyncio
+    async def test_list_mind_maps_only_skips_studio_listing(
+        self,
+        auth_tokens,
+        httpx_mock: HTTPXMock,
+        build_rpc_response,
+    ):
+        """Test filtering to mind maps only calls GET_NOTES_AND_MIND_MAPS."""
+        response = build_rpc_response(
+            RPCMethod.GET_NOTES_AND_MIND_MAPS,
+            [[["mm_001", ["mm_001", '{"name":"Mind Map 1","children":[]}', None, None, "MM1"]]]],
+        )
+        httpx_mock.add_response(content=response.encode())
+
+        async with NotebookLMClient(auth_tokens) as client:
+            artifacts = await client.artifacts.list("nb_123", artifact_type=ArtifactType.MIND_MAP)
+
+        assert [a.id for a in artifacts] == ["mm_001"]
+        assert len(httpx_mock.get_requests()) == 1
+
     @pytest.mark.asyncio
     async def test_rename_artifact(
         self,
@@ -804,6 +825,8 @@ class TestArtifactErrorPaths:
         httpx_mock: HTTPXMock,
     ):
         """Test RPC error handling for HTTP 500."""
+        # LIST_ARTIFACTS and GET_NOTES_AND_MIND_MAPS are sent together
+        httpx_mock.add_response(status_code=500)
         httpx_mock.add_response(status_code=500)
 
         async with NotebookLMClient(auth_tokens) as client:
@@ -174,7 +174,7 @@ def get_cli_module(module_path: str):
 
 
 def patch_client_for_module(module_path: str):
-    """Create a context manager that patches NotebookLMClient in the given module.
+    """Create a context manager that patches NotebookLMClient for the given module.
 
     Args:
         module_path: The module name within notebooklm.cli (e.g., "source", "artifact")
@@ -189,89 +189,31 @@ def patch_client_for_module(module_path: str):
             # ... run test
 
     Note:
-        Uses importlib to get the actual module, not the click group that shadows
-        the module name in cli/__init__.py. This is required for Python 3.10
-        compatibility where mock.patch's string path resolution gets the wrong object.
+        CLI modules import NotebookLMClient inside their command coroutines (to
+        keep the client off the CLI startup path), so there is no module-level
+        name to patch; the class is patched at its source, notebooklm.client.
+        module_path is still imported so a typo fails loudly.
     """
     import importlib
 
-    module = importlib.import_module(f"notebooklm.cli.{module_path}")
-    return patch.object(module, "NotebookLMClient")
-
-
-class MultiMockProxy:
-    """Proxy that forwards attribute access to all underlying mocks.
-
-    When you set return_value on this proxy, it propagates to all mocks.
-    Other attribute access is delegated to the primary mock.
-    """
-
-    def __init__(self, mocks):
-        object.__setattr__(self, "_mocks", mocks)
-        object.__setattr__(self, "_primary", mocks[0])
-
-    def __getattr__(self, name):
-        return getattr(self._primary, name)
-
-    def __setattr__(self, name, value):
-        if name == "return_value":
-            # Propagate return_value to all mocks
-            for m in self._mocks:
-                m.return_value = value
-        else:
-            setattr(self._primary, name, value)
-
-
-class MultiPatcher:
-    """Context manager that patches NotebookLMClient in multiple CLI modules.
-
-    After refactoring, commands are spread across multiple modules, so we need
-    to patch NotebookLMClient in all of them.
-
-    Uses importlib to get the actual module objects, bypassing shadowed names
-    in cli/__init__.py where click groups share names with modules.
-    """
-
-    def __init__(self):
-        import importlib
-
-        # Get actual module objects to avoid Python 3.10 shadowing issues
-        # where cli/__init__.py exports click groups with same names as modules
-        notebook_mod = importlib.import_module("notebooklm.cli.notebook")
-        chat_mod = importlib.import_module("notebooklm.cli.chat")
-        session_mod = importlib.import_module("notebooklm.cli.session")
-        share_mod = importlib.import_module("notebooklm.cli.share")
-
-        self.patches = [
-            patch.object(notebook_mod, "NotebookLMClient"),
-            patch.object(chat_mod, "NotebookLMClient"),
-            patch.object(session_mod, "NotebookLMClient"),
-            patch.object(share_mod, "NotebookLMClient"),
-        ]
-        self.mocks = []
-
-    def __enter__(self):
-        # Start all patches and collect mocks
-        self.mocks = [p.__enter__() for p in self.patches]
-        # Return a proxy that propagates return_value to all mocks
-        return MultiMockProxy(self.mocks)
-
-    def __exit__(self, *args):
-        for p in reversed(self.patches):
-            p.__exit__(*args)
+    importlib.import_module(f"notebooklm.cli.{module_path}")
+    return patch.object(importlib.import_module("notebooklm.client"), "NotebookLMClient")
 
 
 def patch_main_cli_client():
-    """Create a context manager that patches NotebookLMClient in CLI command modules.
+    """Create a context manager that patches NotebookLMClient for top-level commands.
 
-    After refactoring, top-level commands are in separate modules:
+    Top-level commands live in separate modules:
     - notebook.py: list, create, delete, rename, summary
     - chat.py: ask, configure, history
     - session.py: use
     - share.py: status, public, view-level, add, update, remove
 
+    All of them import the client lazily from notebooklm.client, so a single
+    patch there covers every module.
+
     Returns:
-        A context manager that patches NotebookLMClient in all relevant modules
+        A patch context manager for NotebookLMClient
 
     Example:
         with patch_main_cli_client() as mock_cls:
@@ -279,7 +221,7 @@ def patch_main_cli_client():
             mock_cls.return_value = mock_client
             # ... run test
     """
-    return MultiPatcher()
+    return patch("notebooklm.client.NotebookLMClient")
 
 
 @pytest.fixture
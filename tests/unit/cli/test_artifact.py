@@ -1,5 +1,6 @@
 """Tests for artifact CLI commands."""
 
+import asyncio
 import json
 from datetime import datetime
 from unittest.mock import AsyncMock, MagicMock, patch
@@ -7,8 +8,9 @@ from unittest.mock import AsyncMock, MagicMock, patch
 import pytest
 from click.testing import CliRunner
 
+from notebooklm.exceptions import RPCError
 from notebooklm.notebooklm_cli import cli
-from notebooklm.types import Artifact
+from notebooklm.types import Artifact, GenerationStatus
 
 from .conftest import create_mock_client, patch_client_for_module
 
@@ -132,6 +134,33 @@ class TestArtifactGet:
             assert "Test Artifact" in result.output
             assert "art_123" in result.output
 
+    def test_artifact_get_partial_id_lists_once(self, runner, mock_auth):
+        with patch_client_for_module("artifact") as mock_client_cls:
+            mock_client = create_mock_client()
+            mock_client.artifacts.list = AsyncMock(
+                return_value=[
+                    Artifact(
+                        id="art_123",
+                        title="Test Artifact",
+                        _artifact_type=4,
+                        status=3,
+                        created_at=datetime(2024, 1, 1),
+                    ),
+                    Artifact(id="other_456", title="Other", _artifact_type=1, status=3),
+                ]
+            )
+            mock_client.artifacts.get = AsyncMock()
+            mock_client_cls.return_value = mock_client
+
+            with patch("notebooklm.cli.helpers.fetch_tokens", new_callable=AsyncMock) as mock_fetch:
+                mock_fetch.return_value = ("csrf", "session")
+                result = runner.invoke(cli, ["artifact", "get", "art", "-n", "nb_123"])
+
+            assert result.exit_code == 0
+            assert "2024-01-01 00:00" in result.output
+            mock_client.artifacts.list.assert_awaited_once()
+            mock_client.artifacts.get.assert_not_called()
+
     def test_artifact_get_not_found(self, runner, mock_auth):
         with patch_client_for_module("artifact") as mock_client_cls:
             mock_client = create_mock_client()
@@ -199,6 +228,26 @@ class TestArtifactRename:
 
             assert result.exit_code != 0
             assert "Mind maps cannot be renamed" in result.output
+            # artifacts.list already includes mind maps: no separate lookup
+            mock_client.notes.list_mind_maps.assert_not_called()
+
+    def test_artifact_rename_not_found(self, runner, mock_auth):
+        full_id = "art_0123456789abcdefghij"
+        with patch_client_for_module("artifact") as mock_client_cls:
+            mock_client = create_mock_client()
+            mock_client.artifacts.list = AsyncMock(return_value=[])
+            mock_client.artifacts.rename = AsyncMock()
+            mock_client_cls.return_value = mock_client
+
+            with patch("notebooklm.cli.helpers.fetch_tokens", new_callable=AsyncMock) as mock_fetch:
+                mock_fetch.return_value = ("csrf", "session")
+                result = runner.invoke(
+                    cli, ["artifact", "rename", full_id, "New Title", "-n", "nb_123"]
+                )
+
+            assert result.exit_code != 0
+            assert f"Artifact not found: {full_id}" in result.output
+            mock_client.artifacts.rename.assert_not_called()
 
 
 # =============================================================================
@@ -206,6 +255,11 @@ class TestArtifactRename:
 # =============================================================================
 
 
+def _result_row(output: str, art_id: str) -> str:
+    """Return the delete-results table row for an artifact ID."""
+    return next(line for line in output.splitlines() if line.startswith("│ " + art_id))
+
+
 class TestArtifactDelete:
     def test_artifact_delete(self, runner, mock_auth):
         with patch_client_for_module("artifact") as mock_client_cls:
@@ -225,7 +279,7 @@ class TestArtifactDelete:
                 result = runner.invoke(cli, ["artifact", "delete", "art_123", "-n", "nb_123", "-y"])
 
             assert result.exit_code == 0
-            assert "Deleted artifact" in result.output
+            assert "Deleted" in _result_row(result.output, "art_123")
 
     def test_artifact_delete_mind_map_clears(self, runner, mock_auth):
         with patch_client_for_module("artifact") as mock_client_cls:
@@ -249,9 +303,150 @@ class TestArtifactDelete:
                 result = runner.invoke(cli, ["artifact", "delete", "mm_456", "-n", "nb_123", "-y"])
 
             assert result.exit_code == 0
-            assert "Cleared mind map" in result.output
+            assert "Cleared mind map" in _result_row(result.output, "mm_456")
             mock_client.notes.delete.assert_called_once_with("nb_123", "mm_456")
 
+    def test_artifact_delete_multiple(self, runner, mock_auth):
+        with patch_client_for_module("artifact") as mock_client_cls:
+            mock_client = create_mock_client()
+            mock_client.artifacts.list = AsyncMock(
+                return_value=[
+                    Artifact(id="art_123", title="Audio", _artifact_type=1, status=3),
+                    Artifact(id="art_456", title="Report", _artifact_type=2, status=3),
+                    Artifact(id="mm_789", title="Mind Map", _artifact_type=5, status=3),
+                ]
+            )
+            mock_client.notes.list_mind_maps = AsyncMock(
+                return_value=[["mm_789", ["mm_789", "{}", None, None, "Mind Map"]]]
+            )
+            mock_client.artifacts.delete = AsyncMock(return_value=None)
+            mock_client.notes.delete = AsyncMock(return_value=None)
+            mock_client_cls.return_value = mock_client
+
+            with patch("notebooklm.cli.helpers.fetch_tokens", new_callable=AsyncMock) as mock_fetch:
+                mock_fetch.return_value = ("csrf", "session")
+                result = runner.invoke(
+                    cli,
+                    ["artifact", "delete", "art_1", "art_4", "mm", "art_123", "-n", "nb_123", "-y"],
+                )
+
+            assert result.exit_code == 0
+            # One list serves every partial ID; duplicates are deleted once
+            mock_client.artifacts.list.assert_awaited_once()
+            assert mock_client.artifacts.delete.await_count == 2
+            mock_client.notes.delete.assert_awaited_once_with("nb_123", "mm_789")
+            mock_client.notes.list_mind_maps.assert_awaited_once_with("nb_123")
+            assert "Deleted" in _result_row(result.output, "art_123")
+            assert "Deleted" in _result_row(result.output, "art_456")
+            assert "Cleared mind map" in _result_row(result.output, "mm_789")
+
+    def test_artifact_delete_multiple_reports_failures(self, runner, mock_auth):
+        with patch_client_for_module("artifact") as mock_client_cls:
+            mock_client = create_mock_client()
+            mock_client.artifacts.list = AsyncMock(
+                return_value=[
+                    Artifact(id="art_123", title="Audio", _artifact_type=1, status=3),
+                    Artifact(id="art_456", title="Report", _artifact_type=2, status=3),
+                ]
+            )
+            mock_client.notes.list_mind_maps = AsyncMock(return_value=[])
+
+            async def delete(nb_id, art_id):
+                if art_id == "art_456":
+                    raise RuntimeError("server said no")
+
+            mock_client.artifacts.delete = delete
+            mock_client_cls.return_value = mock_client
+
+            with patch("notebooklm.cli.helpers.fetch_tokens", new_callable=AsyncMock) as mock_fetch:
+                mock_fetch.return_value = ("csrf", "session")
+                result = runner.invoke(
+                    cli, ["artifact", "delete", "art_123", "art_456", "-n", "nb_123", "-y"]
+                )
+
+            assert result.exit_code == 1
+            assert "Deleted" in _result_row(result.output, "art_123")
+            assert "Failed: server said no" in _result_row(result.output, "art_456")
+
+    def test_artifact_delete_fails_when_mind_map_lookup_fails(self, runner, mock_auth):
+        with patch_client_for_module("artifact") as mock_client_cls:
+            mock_client = create_mock_client()
+            mock_client.artifacts.list = AsyncMock(
+                return_value=[
+                    Artifact(id="art_123", title="Audio", _artifact_type=1, status=3),
+                    Artifact(id="mm_456", title="Mind Map", _artifact_type=5, status=3),
+                ]
+            )
+            mock_client.notes.list_mind_maps = AsyncMock(side_effect=RPCError("notes down"))
+            mock_client.artifacts.delete = AsyncMock(return_value=None)
+            mock_client.notes.delete = AsyncMock(return_value=None)
+            mock_client_cls.return_value = mock_client
+
+            with patch("notebooklm.cli.helpers.fetch_tokens", new_callable=AsyncMock) as mock_fetch:
+                mock_fetch.return_value = ("csrf", "session")
+                result = runner.invoke(
+                    cli, ["artifact", "delete", "art_123", "mm_456", "-n", "nb_123", "-y"]
+                )
+
+            # Without the mind-map IDs no delete can be routed safely
+            assert result.exit_code != 0
+            mock_client.artifacts.delete.assert_not_called()
+            mock_client.notes.delete.assert_not_called()
+
+    def test_artifact_delete_declined_skips_listing_full_ids(self, runner, mock_auth):
+        full_id = "art_0123456789abcdefghij"
+        with patch_client_for_module("artifact") as mock_client_cls:
+            mock_client = create_mock_client()
+            mock_client.artifacts.list = AsyncMock(return_value=[])
+            mock_client.notes.list_mind_maps = AsyncMock(return_value=[])
+            mock_client.artifacts.delete = AsyncMock(return_value=None)
+            mock_client_cls.return_value = mock_client
+
+            with (
+                patch("notebooklm.cli.helpers.fetch_tokens", new_callable=AsyncMock) as mock_fetch,
+                patch("notebooklm.cli.artifact.confirm_action", return_value=False),
+            ):
+                mock_fetch.return_value = ("csrf", "session")
+                result = runner.invoke(cli, ["artifact", "delete", full_id, "-n", "nb_123"])
+
+            assert result.exit_code == 0
+            mock_client.artifacts.list.assert_not_called()
+            mock_client.notes.list_mind_maps.assert_not_called()
+            mock_client.artifacts.delete.assert_not_called()
+
+    def test_artifact_delete_bounds_concurrency(self, runner, mock_auth):
+        from notebooklm.cli.artifact import DELETE_CONCURRENCY
+
+        artifacts = [
+            Artifact(id=f"art_{i:02d}", title=f"Report {i}", _artifact_type=2, status=3)
+            for i in range(DELETE_CONCURRENCY * 2)
+        ]
+        in_flight = peak = 0
+
+        async def delete(nb_id, art_id):
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+
+        with patch_client_for_module("artifact") as mock_client_cls:
+            mock_client = create_mock_client()
+            mock_client.artifacts.list = AsyncMock(return_value=artifacts)
+            mock_client.notes.list_mind_maps = AsyncMock(return_value=[])
+            mock_client.artifacts.delete = delete
+            mock_client_cls.return_value = mock_client
+
+            with patch("notebooklm.cli.helpers.fetch_tokens", new_callable=AsyncMock) as mock_fetch:
+                mock_fetch.return_value = ("csrf", "session")
+                result = runner.invoke(
+                    cli,
+                    ["artifact", "delete", *(a.id for a in artifacts), "-n", "nb_123", "-y"],
+                )
+
+        assert result.exit_code == 0
+        assert 1 < peak <= DELETE_CONCURRENCY
+
 
 # =============================================================================
 # ARTIFACT EXPORT TESTS
@@ -357,8 +552,8 @@ class TestArtifactPoll:
     def test_artifact_poll(self, runner, mock_auth):
         with patch_client_for_module("artifact") as mock_client_cls:
             mock_client = create_mock_client()
-            mock_client.artifacts.poll_status = AsyncMock(
-                return_value={"status": "completed", "artifact_id": "art_123"}
+            mock_client.artifacts.poll_statuses = AsyncMock(
+                return_value={"task_123": GenerationStatus(task_id="task_123", status="completed")}
             )
             mock_client_cls.return_value = mock_client
 
@@ -369,6 +564,30 @@ class TestArtifactPoll:
             assert result.exit_code == 0
             assert "Task Status" in result.output
 
+    def test_artifact_poll_multiple_tasks_in_one_call(self, runner, mock_auth):
+        with patch_client_for_module("artifact") as mock_client_cls:
+            mock_client = create_mock_client()
+            mock_client.artifacts.poll_statuses = AsyncMock(
+                return_value={
+                    "task_1": GenerationStatus(task_id="task_1", status="completed"),
+                    "task_2": GenerationStatus(task_id="task_2", status="in_progress"),
+                }
+            )
+            mock_client_cls.return_value = mock_client
+
+            with patch("notebooklm.cli.helpers.fetch_tokens", new_callable=AsyncMock) as mock_fetch:
+                mock_fetch.return_value = ("csrf", "session")
+                result = runner.invoke(
+                    cli, ["artifact", "poll", "task_1", "task_2", "-n", "nb_123"]
+                )
+
+            assert result.exit_code == 0
+            mock_client.artifacts.poll_statuses.assert_awaited_once_with(
+                "nb_123", ["task_1", "task_2"]
+            )
+            assert "task_1" in result.output
+            assert "in_progress" in result.output
+
 
 # =============================================================================
 # ARTIFACT WAIT TESTS
@@ -398,6 +617,41 @@ class TestArtifactWait:
             assert result.exit_code == 0
             assert "Artifact completed" in result.output
 
+    def test_artifact_wait_passes_backoff_intervals(self, runner, mock_auth):
+        """--interval/--max-interval map onto the client's exponential backoff."""
+        with patch_client_for_module("artifact") as mock_client_cls:
+            mock_client = create_mock_client()
+            mock_client.artifacts.list = AsyncMock(
+                return_value=[Artifact(id="art_123", title="Test", _artifact_type=1, status=3)]
+            )
+            mock_client.artifacts.wait_for_completion = AsyncMock(
+                return_value=MagicMock(status="completed", url=None, error=None)
+            )
+            mock_client_cls.return_value = mock_client
+
+            with patch("notebooklm.cli.helpers.fetch_tokens", new_callable=AsyncMock) as mock_fetch:
+                mock_fetch.return_value = ("csrf", "session")
+                result = runner.invoke(
+                    cli,
+                    [
+                        "artifact",
+                        "wait",
+                        "art_123",
+                        "-n",
+                        "nb_123",
+                        "--interval",
+                        "5",
+                        "--max-interval",
+                        "60",
+                    ],
+                )
+
+            assert result.exit_code == 0
+            kwargs = mock_client.artifacts.wait_for_completion.call_args.kwargs
+            assert kwargs["initial_interval"] == 5.0
+            assert kwargs["max_interval"] == 60.0
+            assert "poll_interval" not in kwargs
+
     def test_artifact_wait_failed(self, runner, mock_auth):
         """Test waiting for artifact that fails generation."""
         with patch_client_for_module("artifact") as mock_client_cls:
@@ -1,5 +1,8 @@
 """Tests for download CLI commands."""
 
+import asyncio
+import json
+import logging
 from datetime import datetime
 from pathlib import Path
 from unittest.mock import AsyncMock, patch
@@ -7,6 +10,13 @@ from unittest.mock import AsyncMock, patch
 import pytest
 from click.testing import CliRunner
 
+from notebooklm._artifacts import ArtifactsAPI
+from notebooklm.cli.download import (
+    ARTIFACT_CONFIGS,
+    DOWNLOAD_CONCURRENCY,
+    _display_download_result,
+    _is_case_insensitive,
+)
 from notebooklm.notebooklm_cli import cli
 from notebooklm.types import Artifact
 
@@ -399,6 +409,10 @@ class TestDownloadCommandsExist:
         assert "OUTPUT_PATH" in result.output
         assert "--notebook" in result.output or "-n" in result.output
 
+    @pytest.mark.parametrize("artifact_type", list(ARTIFACT_CONFIGS))
+    def test_config_method_exists(self, artifact_type):
+        assert callable(getattr(ArtifactsAPI, ARTIFACT_CONFIGS[artifact_type]["method"], None))
+
 
 # =============================================================================
 # FLAG CONFLICT VALIDATION TESTS
@@ -559,6 +573,29 @@ class TestDownloadAll:
         # Directory should NOT be created
         assert not output_dir.exists()
 
+    def test_download_all_dry_run_dedupes_titles(
+        self, runner, mock_auth, mock_fetch_tokens, tmp_path
+    ):
+        """Test --all --dry-run previews the same unique names a real run uses."""
+        with patch_client_for_module("download") as mock_client_cls:
+            mock_client = create_mock_client()
+            mock_client.artifacts.list = AsyncMock(
+                return_value=[
+                    make_artifact("audio_1", "Overview", 1),
+                    make_artifact("audio_2", "Overview", 1),
+                ]
+            )
+            mock_client_cls.return_value = mock_client
+
+            result = runner.invoke(
+                cli,
+                ["download", "audio", "--all", "--dry-run", str(tmp_path), "-n", "nb_123"],
+            )
+
+        assert result.exit_code == 0
+        assert "Overview.mp3 <- Overview" in result.output
+        assert "Overview (2).mp3 <- Overview" in result.output
+
     def test_download_all_with_failures(self, runner, mock_auth, mock_fetch_tokens, tmp_path):
         """Test --all continues on individual artifact failures."""
         with patch_client_for_module("download") as mock_client_cls:
@@ -630,12 +667,207 @@ class TestDownloadAll:
         # Second file should be downloaded
         assert (output_dir / "Second Audio.mp3").exists()
 
+    def test_download_all_runs_downloads_concurrently(
+        self, runner, mock_auth, mock_fetch_tokens, tmp_path
+    ):
+        """Test --all overlaps downloads instead of awaiting them one by one."""
+        with patch_client_for_module("download") as mock_client_cls:
+            mock_client = create_mock_client()
+
+            output_dir = tmp_path / "downloads"
+            in_flight = 0
+            peak = 0
+
+            async def mock_download_audio(notebook_id, output_path, artifact_id=None):
+                nonlocal in_flight, peak
+                in_flight += 1
+                peak = max(peak, in_flight)
+                await asyncio.sleep(0.01)
+                Path(output_path).write_bytes(artifact_id.encode())
+                in_flight -= 1
+                return output_path
+
+            mock_client.artifacts.list = AsyncMock(
+                return_value=[make_artifact(f"audio_{i}", f"Audio {i}", 1) for i in range(6)]
+            )
+            mock_client.artifacts.download_audio = mock_download_audio
+            mock_client_cls.return_value = mock_client
+
+            result = runner.invoke(
+                cli, ["download", "audio", "--all", str(output_dir), "-n", "nb_123"]
+            )
+
+        assert result.exit_code == 0
+        assert 1 < peak <= DOWNLOAD_CONCURRENCY
+        for i in range(6):
+            assert (output_dir / f"Audio {i}.mp3").read_bytes() == f"audio_{i}".encode()
+
+    def test_download_all_json_output_is_parseable(
+        self, runner, mock_auth, mock_fetch_tokens, tmp_path
+    ):
+        """Test --all --json prints valid JSON even for long output paths."""
+        with patch_client_for_module("download") as mock_client_cls:
+            mock_client = create_mock_client()
+
+            output_dir = tmp_path / ("nested-directory-" * 8) / "downloads"
+
+            async def mock_download_audio(notebook_id, output_path, artifact_id=None):
+                Path(output_path).write_bytes(b"fake audio")
+                return output_path
+
+            mock_client.artifacts.list = AsyncMock(
+                return_value=[make_artifact("audio_1", "First Audio", 1)]
+            )
+            mock_client.artifacts.download_audio = mock_download_audio
+            mock_client_cls.return_value = mock_client
+
+            result = runner.invoke(
+                cli, ["download", "audio", "--all", str(output_dir), "-n", "nb_123", "--json"]
+            )
+
+        assert result.exit_code == 0
+        data = json.loads(result.output)
+        assert data["operation"] == "download_all"
+        assert data["results"][0]["path"] == str(output_dir / "First Audio.mp3")
+
+    def test_download_all_logs_phase_timings(
+        self, runner, mock_auth, mock_fetch_tokens, tmp_path, caplog
+    ):
+        """Test --all records list and download timings at DEBUG level."""
+        with patch_client_for_module("download") as mock_client_cls:
+            mock_client = create_mock_client()
+
+            async def mock_download_audio(notebook_id, output_path, artifact_id=None):
+                Path(output_path).write_bytes(b"fake audio")
+                return output_path
+
+            mock_client.artifacts.list = AsyncMock(
+                return_value=[make_artifact("audio_1", "First Audio", 1)]
+            )
+            mock_client.artifacts.download_audio = mock_download_audio
+            mock_client_cls.return_value = mock_client
+
+            with caplog.at_level(logging.DEBUG, logger="notebooklm.cli.download"):
+                result = runner.invoke(
+                    cli, ["download", "audio", "--all", str(tmp_path), "-n", "nb_123", "--json"]
+                )
+
+        assert result.exit_code == 0
+        messages = [r.getMessage() for r in caplog.records]
+        assert any(m.startswith("Listed 1 artifacts (") for m in messages)
+        assert any(m.startswith("Downloaded First Audio.mp3 (") for m in messages)
+        # Timings go to the log, never into the JSON result
+        assert "_timings" not in json.loads(result.output)
+
+    def test_download_all_renames_do_not_collide(
+        self, runner, mock_auth, mock_fetch_tokens, tmp_path
+    ):
+        """Test an auto-renamed file does not clash with a later item's name."""
+        with patch_client_for_module("download") as mock_client_cls:
+            mock_client = create_mock_client()
+
+            output_dir = tmp_path / "downloads"
+            output_dir.mkdir(parents=True)
+            (output_dir / "Audio.mp3").write_bytes(b"existing")
+
+            async def mock_download_audio(notebook_id, output_path, artifact_id=None):
+                Path(output_path).write_bytes(artifact_id.encode())
+                return output_path
+
+            mock_client.artifacts.list = AsyncMock(
+                return_value=[
+                    make_artifact("audio_1", "Audio", 1),
+                    make_artifact("audio_2", "Audio (2)", 1),
+                ]
+            )
+            mock_client.artifacts.download_audio = mock_download_audio
+            mock_client_cls.return_value = mock_client
+
+            result = runner.invoke(
+                cli, ["download", "audio", "--all", str(output_dir), "-n", "nb_123"]
+            )
+
+        assert result.exit_code == 0
+        assert (output_dir / "Audio.mp3").read_bytes() == b"existing"
+        assert (output_dir / "Audio (2).mp3").read_bytes() == b"audio_1"
+        assert (output_dir / "Audio (2) (2).mp3").read_bytes() == b"audio_2"
+
+    @pytest.mark.parametrize("case_insensitive", [False, True])
+    def test_download_all_matches_filesystem_case_rules(
+        self, runner, mock_auth, mock_fetch_tokens, tmp_path, case_insensitive
+    ):
+        """Test names differing only in case collide only on case-insensitive dirs."""
+        with patch_client_for_module("download") as mock_client_cls:
+            mock_client = create_mock_client()
+
+            output_dir = tmp_path / "downloads"
+            output_dir.mkdir(parents=True)
+            (output_dir / "audio.mp3").write_bytes(b"existing")
+
+            async def mock_download_audio(notebook_id, output_path, artifact_id=None):
+                return output_path
+
+            mock_client.artifacts.list = AsyncMock(
+                return_value=[make_artifact("audio_1", "Audio", 1)]
+            )
+            mock_client.artifacts.download_audio = mock_download_audio
+            mock_client_cls.return_value = mock_client
+
+            with patch(
+                "notebooklm.cli.download._is_case_insensitive", return_value=case_insensitive
+            ):
+                result = runner.invoke(
+                    cli,
+                    ["download", "audio", "--all", str(output_dir), "-n", "nb_123", "--json"],
+                )
+
+        assert result.exit_code == 0
+        [item] = json.loads(result.output)["results"]
+        expected = "Audio (2).mp3" if case_insensitive else "Audio.mp3"
+        assert item["path"] == str(output_dir / expected)
+
+    def test_is_case_insensitive_matches_filesystem(self, tmp_path):
+        (tmp_path / "Probe").touch()
+        expected = (tmp_path / "probe").exists()
+        assert _is_case_insensitive(tmp_path) is expected
+        assert list(tmp_path.iterdir()) == [tmp_path / "Probe"]
+
 
 # =============================================================================
 # DOWNLOAD ERROR HANDLING TESTS
 # =============================================================================
 
 
+class TestDisplayDownloadAll:
+    def test_summary_groups_results_by_status(self, capsys):
+        """Each status gets one section listing its files in order."""
+        _display_download_result(
+            {
+                "operation": "download_all",
+                "output_dir": "out",
+                "total": 4,
+                "results": [
+                    {"filename": "a.mp3", "title": "A", "status": "downloaded"},
+                    {
+                        "filename": "b.mp3",
+                        "title": "B",
+                        "status": "skipped",
+                        "reason": "file exists",
+                    },
+                    {"filename": "c.mp3", "title": "C", "status": "failed", "error": "boom"},
+                    {"filename": "d.mp3", "title": "D", "status": "downloaded"},
+                ],
+            },
+            "audio",
+        )
+
+        output = capsys.readouterr().out
+        assert "Downloaded 2/4 audio files to: out" in output
+        assert "Downloaded:\n  a.mp3 <- A\n  d.mp3 <- D\n" in output
+        assert "Skipped:\n  b.mp3 (file exists)\n" in output
+        assert "Failed:\n  c.mp3: boom\n" in output
+
+
 class TestDownloadErrorHandling:
     """Test error handling during downloads."""
 
@@ -104,6 +104,90 @@ class TestGenerateAudio:
             assert result.exit_code == 0
             assert "Audio ready" in result.output or "example.com" in result.output
 
+    def test_generate_audio_wait_passes_timeout(self, runner, mock_auth):
+        with patch_client_for_module("generate") as mock_client_cls:
+            mock_client = create_mock_client()
+            mock_client.artifacts.generate_audio = AsyncMock(
+                return_value={"artifact_id": "audio_123", "status": "processing"}
+            )
+            mock_client.artifacts.wait_for_completion = AsyncMock(
+                return_value=MagicMock(is_complete=True, is_failed=False, url=None)
+            )
+            mock_client_cls.return_value = mock_client
+
+            with patch("notebooklm.cli.helpers.fetch_tokens", new_callable=AsyncMock) as mock_fetch:
+                mock_fetch.return_value = ("csrf", "session")
+                result = runner.invoke(
+                    cli, ["generate", "audio", "--wait", "--timeout", "900", "-n", "nb_123"]
+                )
+
+            assert result.exit_code == 0
+            assert mock_client.artifacts.wait_for_completion.call_args.kwargs["timeout"] == 900.0
+
+    def test_generate_audio_wait_timeout_json(self, runner, mock_auth):
+        with patch_client_for_module("generate") as mock_client_cls:
+            mock_client = create_mock_client()
+            mock_client.artifacts.generate_audio = AsyncMock(
+                return_value={"artifact_id": "audio_123", "status": "processing"}
+            )
+            mock_client.artifacts.wait_for_completion = AsyncMock(
+                side_effect=TimeoutError("Task audio_123 timed out after 5.0s")
+            )
+            mock_client_cls.return_value = mock_client
+
+            with patch("notebooklm.cli.helpers.fetch_tokens", new_callable=AsyncMock) as mock_fetch:
+                mock_fetch.return_value = ("csrf", "session")
+                result = runner.invoke(
+                    cli,
+                    ["generate", "audio", "--wait", "--timeout", "5", "--json", "-n", "nb_123"],
+                )
+
+            assert result.exit_code == 1
+            data = json.loads(result.output)
+            assert data["code"] == "TIMEOUT"
+            assert data["task_id"] == "audio_123"
+
+    def test_generate_audio_wait_polls_when_completed_without_url(self, runner, mock_auth):
+        from notebooklm.types import GenerationStatus
+
+        # Generate responses skip the media readiness check, so "completed"
+        # audio without a URL must still be polled until the URL appears
+        completed = GenerationStatus(task_id="audio_123", status="completed", url=None)
+        ready = GenerationStatus(
+            task_id="audio_123", status="completed", url="https://example.com/audio.mp3"
+        )
+
+        with patch_client_for_module("generate") as mock_client_cls:
+            mock_client = create_mock_client()
+            mock_client.artifacts.generate_audio = AsyncMock(return_value=completed)
+            mock_client.artifacts.wait_for_completion = AsyncMock(return_value=ready)
+            mock_client_cls.return_value = mock_client
+
+            with patch("notebooklm.cli.helpers.fetch_tokens", new_callable=AsyncMock) as mock_fetch:
+                mock_fetch.return_value = ("csrf", "session")
+                result = runner.invoke(cli, ["generate", "audio", "--wait", "-n", "nb_123"])
+
+            assert result.exit_code == 0
+            assert "example.com/audio.mp3" in result.output
+            mock_client.artifacts.wait_for_completion.assert_awaited_once()
+
+    def test_generate_audio_wait_skips_polling_when_already_failed(self, runner, mock_auth):
+        from notebooklm.types import GenerationStatus
+
+        failed = GenerationStatus(task_id="audio_123", status="failed", error="boom")
+
+        with patch_client_for_module("generate") as mock_client_cls:
+            mock_client = create_mock_client()
+            mock_client.artifacts.generate_audio = AsyncMock(return_value=failed)
+            mock_client.artifacts.wait_for_completion = AsyncMock()
+            mock_client_cls.return_value = mock_client
+
+            with patch("notebooklm.cli.helpers.fetch_tokens", new_callable=AsyncMock) as mock_fetch:
+                mock_fetch.return_value = ("csrf", "session")
+                runner.invoke(cli, ["generate", "audio", "--wait", "-n", "nb_123"])
+
+            mock_client.artifacts.wait_for_completion.assert_not_called()
+
     def test_generate_audio_failure(self, runner, mock_auth):
         with patch_client_for_module("generate") as mock_client_cls:
             mock_client = create_mock_client()
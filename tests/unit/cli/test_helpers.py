@@ -1,6 +1,9 @@
 """Tests for CLI helper functions."""
 
+import asyncio
 import json
+from datetime import datetime
+from pathlib import Path
 from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
@@ -9,11 +12,14 @@ from notebooklm import Artifact
 from notebooklm.cli.helpers import (
     clear_context,
     cli_name_to_artifact_type,
+    confirm_action,
+    format_timestamp,
     # Type display helpers
     get_artifact_type_display,
     get_auth_tokens,
     # Auth helpers
     get_client,
+    get_context,
     get_current_conversation,
     # Context helpers
     get_current_notebook,
@@ -169,6 +175,15 @@ class TestGetSourceTypeDisplay:
         assert get_source_type_display("future_type") == "❓ future_type"
 
 
+class TestFormatTimestamp:
+    def test_matches_strftime(self):
+        value = datetime(2024, 3, 5, 7, 9, 41)
+        assert format_timestamp(value) == value.strftime("%Y-%m-%d %H:%M")
+
+    def test_none(self):
+        assert format_timestamp(None) == "-"
+
+
 class TestCliNameToArtifactType:
     def test_audio(self):
         assert cli_name_to_artifact_type("audio") == ArtifactType.AUDIO
@@ -228,6 +243,24 @@ class TestJsonOutputResponse:
         assert data["nested"]["key"] == "value"
         assert data["list"] == [1, 2, 3]
 
+    def test_stdlib_fallback_matches_orjson(self, capsys):
+        pytest.importorskip("orjson")
+        data = {
+            "created_at": datetime(2024, 1, 15, 10, 30),
+            "title": "Café 日本",
+            "nested": {"list": [1, 2.5, None, True], "empty": {}},
+        }
+
+        json_output_response(data)
+        fast = capsys.readouterr().out
+        with patch.dict("sys.modules", {"orjson": None}):
+            json_output_response(data)
+        fallback = capsys.readouterr().out
+
+        assert fallback == fast
+        assert "Café 日本" in fast
+        assert json.loads(fast)["created_at"] == "2024-01-15 10:30:00"
+
 
 class TestJsonErrorResponse:
     def test_outputs_error_json_and_exits(self, capsys):
@@ -242,6 +275,15 @@ class TestJsonErrorResponse:
         assert data["code"] == "TEST_ERROR"
         assert data["message"] == "Test error message"
 
+    def test_extra_fields_use_shared_serializer(self, capsys):
+        created = datetime(2024, 1, 15, 10, 30)
+
+        with pytest.raises(SystemExit):
+            json_error_response("TEST_ERROR", "Test error message", {"at": created})
+
+        data = json.loads(capsys.readouterr().out)
+        assert data["at"] == str(created)
+
 
 # =============================================================================
 # CONTEXT MANAGEMENT TESTS
@@ -275,6 +317,41 @@ class TestContextManagement:
             assert data["is_owner"] is True
             assert data["created_at"] == "2024-01-01T00:00:00"
 
+    def test_get_context_corrupted_file(self, tmp_path):
+        context_file = tmp_path / "context.json"
+        context_file.write_text("{ invalid json }")
+        with patch("notebooklm.cli.helpers.get_context_path", return_value=context_file):
+            assert get_context() == {}
+            assert get_current_notebook() is None
+
+    def test_get_context_parses_once_until_file_changes(self, tmp_path):
+        context_file = tmp_path / "context.json"
+        context_file.write_text('{"notebook_id": "nb_123"}')
+        with (
+            patch("notebooklm.cli.helpers.get_context_path", return_value=context_file),
+            patch("notebooklm.cli.helpers.json.loads", wraps=json.loads) as mock_loads,
+        ):
+            assert require_notebook(None) == "nb_123"
+            assert get_current_notebook() == "nb_123"
+            assert mock_loads.call_count == 1
+
+            # Modifying the returned dict must not leak into later reads
+            get_context()["notebook_id"] = "mutated"
+            assert get_current_notebook() == "nb_123"
+
+            set_current_notebook("nb_456")
+            assert get_current_notebook() == "nb_456"
+            assert mock_loads.call_count == 2
+
+    def test_get_context_nested_mutation_does_not_leak(self, tmp_path):
+        context_file = tmp_path / "context.json"
+        context_file.write_text(
+            json.dumps({"notebook_id": "nb_123", "notebook_cache": {"nb_123": {"title": "T"}}})
+        )
+        with patch("notebooklm.cli.helpers.get_context_path", return_value=context_file):
+            get_context()["notebook_cache"]["nb_123"]["title"] = "mutated"
+            assert get_context()["notebook_cache"]["nb_123"]["title"] == "T"
+
     def test_clear_context(self, tmp_path):
         context_file = tmp_path / "context.json"
         context_file.write_text('{"notebook_id": "test"}')
@@ -312,6 +389,29 @@ class TestContextManagement:
             result = get_current_conversation()
             assert result is None
 
+    def test_set_same_conversation_skips_write(self, tmp_path):
+        context_file = tmp_path / "context.json"
+        context_file.write_text('{"notebook_id": "nb_123", "conversation_id": "conv_456"}')
+        with (
+            patch("notebooklm.cli.helpers.get_context_path", return_value=context_file),
+            patch.object(Path, "write_text") as mock_write,
+        ):
+            set_current_conversation("conv_456")
+            set_current_conversation("conv_456")
+        mock_write.assert_not_called()
+
+    @pytest.mark.parametrize("conversation_id", [None, ""])
+    def test_clear_missing_conversation_is_noop(self, tmp_path, conversation_id):
+        context_file = tmp_path / "context.json"
+        context_file.write_text('{"notebook_id": "nb_123"}')
+        with (
+            patch("notebooklm.cli.helpers.get_context_path", return_value=context_file),
+            patch.object(Path, "write_text") as mock_write,
+        ):
+            set_current_conversation(conversation_id)
+            assert get_current_conversation() is None
+        mock_write.assert_not_called()
+
     def test_get_notebook_invalid_json(self, tmp_path):
         context_file = tmp_path / "context.json"
         context_file.write_text("invalid json")
@@ -417,6 +517,38 @@ class TestWithClientDecorator:
         assert result.exit_code == 0
         assert "Got auth: True" in result.output
 
+    def test_decorator_runs_auth_and_command_on_one_loop(self):
+        """Test that token fetch and the command share a single run_async call"""
+        import click
+        from click.testing import CliRunner
+
+        loops = []
+
+        @click.command()
+        @with_client
+        def test_cmd(ctx, client_auth):
+            async def _run():
+                loops.append(asyncio.get_running_loop())
+
+            return _run()
+
+        async def fake_fetch(cookies):
+            loops.append(asyncio.get_running_loop())
+            return ("csrf", "session")
+
+        runner = CliRunner()
+        with (
+            patch("notebooklm.cli.helpers.load_auth_from_storage", return_value={"SID": "test"}),
+            patch("notebooklm.cli.helpers.fetch_tokens", side_effect=fake_fetch),
+            patch("notebooklm.cli.helpers.run_async", wraps=run_async) as mock_run,
+        ):
+            result = runner.invoke(test_cmd)
+
+        assert result.exit_code == 0
+        assert mock_run.call_count == 1
+        assert len(loops) == 2
+        assert loops[0] is loops[1]
+
     def test_decorator_handles_no_auth(self):
         """Test that @with_client handles missing auth gracefully"""
         import click
@@ -547,3 +679,79 @@ class TestRunAsync:
 
         result = run_async(sample_coro())
         assert result == "result"
+
+    def test_uses_uvloop_when_installed(self):
+        import types
+
+        async def sample_coro():
+            return "fast"
+
+        calls = []
+
+        def fake_run(coro):
+            calls.append(coro)
+            return asyncio.run(coro)
+
+        fake_uvloop = types.ModuleType("uvloop")
+        fake_uvloop.run = fake_run
+        with (
+            patch.dict("sys.modules", {"uvloop": fake_uvloop}),
+            patch("notebooklm.cli.helpers.sys.platform", "linux"),
+        ):
+            assert run_async(sample_coro()) == "fast"
+        assert len(calls) == 1
+
+    def test_falls_back_without_uvloop(self):
+        async def sample_coro():
+            return "default"
+
+        with patch.dict("sys.modules", {"uvloop": None}):
+            assert run_async(sample_coro()) == "default"
+
+    def test_skips_uvloop_on_windows(self):
+        import types
+
+        async def sample_coro():
+            return "windows"
+
+        fake_uvloop = types.ModuleType("uvloop")
+        fake_uvloop.run = MagicMock()
+        with (
+            patch.dict("sys.modules", {"uvloop": fake_uvloop}),
+            patch("notebooklm.cli.helpers.sys.platform", "win32"),
+        ):
+            assert run_async(sample_coro()) == "windows"
+        fake_uvloop.run.assert_not_called()
+
+
+# =============================================================================
+# CONFIRM ACTION TESTS
+# =============================================================================
+
+
+class TestConfirmAction:
+    def test_yes_skips_prompt(self):
+        with patch("notebooklm.cli.helpers.click.confirm") as mock_confirm:
+            assert confirm_action("Delete?", yes=True) is True
+        mock_confirm.assert_not_called()
+
+    def test_non_tty_requires_yes(self):
+        import click
+
+        with (
+            patch("notebooklm.cli.helpers.sys.stdin") as mock_stdin,
+            patch("notebooklm.cli.helpers.click.confirm") as mock_confirm,
+        ):
+            mock_stdin.isatty.return_value = False
+            with pytest.raises(click.UsageError, match="--yes"):
+                confirm_action("Delete?")
+        mock_confirm.assert_not_called()
+
+    def test_tty_prompts(self):
+        with (
+            patch("notebooklm.cli.helpers.sys.stdin") as mock_stdin,
+            patch("notebooklm.cli.helpers.click.confirm", return_value=False) as mock_confirm,
+        ):
+            mock_stdin.isatty.return_value = True
+            assert confirm_action("Delete?") is False
+        mock_confirm.assert_called_once_with("Delete?")
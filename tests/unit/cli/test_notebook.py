@@ -1,6 +1,7 @@
 """Tests for notebook CLI commands (now top-level commands)."""
 
 import json
+import time
 from datetime import datetime
 from pathlib import Path
 from unittest.mock import AsyncMock, MagicMock, patch
@@ -9,7 +10,7 @@ import pytest
 from click.testing import CliRunner
 
 from notebooklm.notebooklm_cli import cli
-from notebooklm.types import AskResult, Notebook
+from notebooklm.types import AskResult, Notebook, Source
 
 from .conftest import create_mock_client, patch_client_for_module, patch_main_cli_client
 
@@ -32,6 +33,21 @@ def mock_auth():
         yield mock
 
 
+def _cached_context(context_file: Path, *notebook_ids: str) -> None:
+    """Write a context file whose notebook cache holds fresh entries."""
+    context_file.write_text(
+        json.dumps(
+            {
+                "notebook_id": "nb_current",
+                "notebook_cache": {
+                    nb_id: {"title": "Old Title", "is_owner": True, "fetched_at": time.time()}
+                    for nb_id in notebook_ids
+                },
+            }
+        )
+    )
+
+
 # =============================================================================
 # NOTEBOOK LIST TESTS
 # =============================================================================
@@ -105,6 +121,31 @@ class TestNotebookList:
             assert data["count"] == 1
             assert data["notebooks"][0]["id"] == "nb_1"
 
+    def test_notebook_list_limit(self, runner, mock_auth):
+        with patch_main_cli_client() as mock_client_cls:
+            mock_client = create_mock_client()
+            mock_client.notebooks.list = AsyncMock(
+                return_value=[
+                    Notebook(id=f"nb_{i}", title=f"Notebook {i}", is_owner=True) for i in range(5)
+                ]
+            )
+            mock_client_cls.return_value = mock_client
+
+            with patch("notebooklm.cli.helpers.fetch_tokens", new_callable=AsyncMock) as mock_fetch:
+                mock_fetch.return_value = ("csrf", "session")
+                result = runner.invoke(cli, ["list", "--limit", "2"])
+                json_result = runner.invoke(cli, ["list", "--limit", "2", "--json"])
+
+            assert result.exit_code == 0
+            assert "Notebook 1" in result.output
+            assert "Notebook 2" not in result.output
+            assert "Showing 2 of 5" in result.output
+
+            data = json.loads(json_result.output)
+            assert [nb["id"] for nb in data["notebooks"]] == ["nb_0", "nb_1"]
+            assert data["count"] == 2
+            assert data["total"] == 5
+
 
 # =============================================================================
 # NOTEBOOK CREATE TESTS
@@ -211,6 +252,30 @@ class TestNotebookDelete:
             assert result.exit_code == 0
             assert "Cleared current notebook context" in result.output
 
+    def test_notebook_delete_evicts_cached_metadata(self, runner, mock_auth, tmp_path):
+        context_file = tmp_path / "context.json"
+        _cached_context(context_file, "nb_to_delete", "nb_current")
+
+        with patch_main_cli_client() as mock_client_cls:
+            mock_client = create_mock_client()
+            mock_client.notebooks.list = AsyncMock(
+                return_value=[Notebook(id="nb_to_delete", title="Test Notebook")]
+            )
+            mock_client.notebooks.delete = AsyncMock(return_value=True)
+            mock_client_cls.return_value = mock_client
+
+            with (
+                patch("notebooklm.cli.helpers.get_context_path", return_value=context_file),
+                patch("notebooklm.cli.helpers.fetch_tokens", new_callable=AsyncMock) as mock_fetch,
+            ):
+                mock_fetch.return_value = ("csrf", "session")
+                result = runner.invoke(cli, ["delete", "-n", "nb_to_delete", "-y"])
+
+        assert result.exit_code == 0
+        data = json.loads(context_file.read_text())
+        assert data["notebook_id"] == "nb_current"
+        assert list(data["notebook_cache"]) == ["nb_current"]
+
     def test_notebook_delete_failure(self, runner, mock_auth):
         with patch_main_cli_client() as mock_client_cls:
             mock_client = create_mock_client()
@@ -267,6 +332,28 @@ class TestNotebookRename:
             assert "Renamed notebook" in result.output
             mock_client.notebooks.rename.assert_called_once_with("nb_123", "New Title")
 
+    def test_notebook_rename_evicts_cached_metadata(self, runner, mock_auth, tmp_path):
+        context_file = tmp_path / "context.json"
+        _cached_context(context_file, "nb_123")
+
+        with patch_main_cli_client() as mock_client_cls:
+            mock_client = create_mock_client()
+            mock_client.notebooks.list = AsyncMock(
+                return_value=[Notebook(id="nb_123", title="Old Title")]
+            )
+            mock_client.notebooks.rename = AsyncMock(return_value=None)
+            mock_client_cls.return_value = mock_client
+
+            with (
+                patch("notebooklm.cli.helpers.get_context_path", return_value=context_file),
+                patch("notebooklm.cli.helpers.fetch_tokens", new_callable=AsyncMock) as mock_fetch,
+            ):
+                mock_fetch.return_value = ("csrf", "session")
+                result = runner.invoke(cli, ["rename", "New Title", "-n", "nb_123"])
+
+        assert result.exit_code == 0
+        assert "notebook_cache" not in json.loads(context_file.read_text())
+
 
 # =============================================================================
 # NOTEBOOK SHARE TESTS (moved to share command group)
@@ -410,6 +497,16 @@ class TestNotebookHistory:
             assert result.exit_code == 0
             assert "cache cleared" in result.output
 
+    def test_notebook_history_clear_skips_auth_and_network(self, runner, mock_auth):
+        with patch_main_cli_client() as mock_client_cls:
+            with patch("notebooklm.cli.helpers.fetch_tokens", new_callable=AsyncMock) as mock_fetch:
+                result = runner.invoke(cli, ["history", "--clear", "-n", "nb_123"])
+
+            assert result.exit_code == 0
+            assert "cache cleared" in result.output
+            mock_fetch.assert_not_called()
+            mock_client_cls.assert_not_called()
+
 
 # =============================================================================
 # NOTEBOOK ASK TESTS
@@ -486,6 +583,45 @@ class TestNotebookAsk:
             assert result.exit_code == 0
             assert "Follow-up answer" in result.output
 
+    def test_notebook_ask_history_and_sources_resolved(self, runner, mock_auth):
+        """Auto-continue looks up history and resolves --source IDs before asking."""
+        with patch_main_cli_client() as mock_client_cls:
+            mock_client = create_mock_client()
+            mock_client.chat.ask = AsyncMock(
+                return_value=AskResult(
+                    answer="Scoped answer",
+                    conversation_id="conv_hist",
+                    is_follow_up=True,
+                    turn_number=2,
+                )
+            )
+            mock_client.chat.get_history = AsyncMock(return_value=[[["conv_hist"]]])
+            mock_client.sources.list = AsyncMock(
+                return_value=[Source(id="src_abc_full_id", title="Doc")]
+            )
+            mock_client_cls.return_value = mock_client
+
+            with (
+                patch(
+                    "notebooklm.cli.helpers.get_context_path",
+                    return_value=Path("/nonexistent/context.json"),
+                ),
+                patch("notebooklm.cli.helpers.fetch_tokens", new_callable=AsyncMock) as mock_fetch,
+            ):
+                mock_fetch.return_value = ("csrf", "session")
+                result = runner.invoke(
+                    cli, ["ask", "-n", "nb_123", "-s", "src_abc", "Scoped question"]
+                )
+
+            assert result.exit_code == 0
+            assert "Scoped answer" in result.output
+            mock_client.chat.ask.assert_awaited_once_with(
+                "nb_123",
+                "Scoped question",
+                source_ids=["src_abc_full_id"],
+                conversation_id="conv_hist",
+            )
+
 
 # =============================================================================
 # NOTEBOOK CONFIGURE TESTS
@@ -564,6 +700,31 @@ class TestSourceAddResearch:
             assert result.exit_code == 0
             assert "Found 1 sources" in result.output
 
+    def test_source_add_research_polls_with_backoff(self, runner, mock_auth):
+        with patch_client_for_module("source") as mock_client_cls:
+            mock_client = create_mock_client()
+            mock_client.research.start = AsyncMock(return_value={"task_id": "task_123"})
+            mock_client.research.poll = AsyncMock(
+                side_effect=[{"status": "in_progress"}] * 8
+                + [{"status": "completed", "sources": []}]
+            )
+            mock_client_cls.return_value = mock_client
+
+            with (
+                patch("notebooklm.cli.helpers.fetch_tokens", new_callable=AsyncMock) as mock_fetch,
+                patch("notebooklm.cli.source.asyncio.sleep", new_callable=AsyncMock) as mock_sleep,
+            ):
+                mock_fetch.return_value = ("csrf", "session")
+                result = runner.invoke(
+                    cli, ["source", "add-research", "AI research", "-n", "nb_123"]
+                )
+
+            assert result.exit_code == 0
+            delays = [c.args[0] for c in mock_sleep.call_args_list]
+            assert delays[0] == 0.5
+            assert delays == sorted(delays)
+            assert max(delays) == 5.0
+
     def test_source_add_research_failed_to_start(self, runner, mock_auth):
         with patch_client_for_module("source") as mock_client_cls:
             mock_client = create_mock_client()
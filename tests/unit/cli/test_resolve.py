@@ -6,7 +6,7 @@ from unittest.mock import AsyncMock, MagicMock, patch
 import click
 import pytest
 
-from notebooklm.cli.helpers import resolve_notebook_id, resolve_source_id
+from notebooklm.cli.helpers import resolve_notebook_id, resolve_source_id, resolve_source_ids
 from notebooklm.types import Notebook, Source
 
 
@@ -327,6 +327,32 @@ class TestResolveSourceId:
         mock_client_with_sources.sources.list.assert_called_once_with("my_notebook_id")
 
 
+class TestResolveSourceIds:
+    """Test resolving several partial source IDs at once."""
+
+    @pytest.mark.asyncio
+    async def test_empty_returns_none(self, mock_client_with_sources):
+        mock_client_with_sources.sources.list = AsyncMock()
+
+        assert await resolve_source_ids(mock_client_with_sources, "nb_123", ()) is None
+        mock_client_with_sources.sources.list.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_lists_sources_once_for_many_prefixes(
+        self, mock_client_with_sources, sample_sources
+    ):
+        """Multiple partial IDs share a single sources.list call."""
+        mock_client_with_sources.sources.list = AsyncMock(return_value=sample_sources)
+
+        with patch("notebooklm.cli.helpers.console"):
+            result = await resolve_source_ids(
+                mock_client_with_sources, "nb_123", ("xyz", "src1", "src9")
+            )
+
+        assert result == ["xyz789uvw456rst123", "src123def456ghi789", "src999zzz888yyy777"]
+        mock_client_with_sources.sources.list.assert_called_once_with("nb_123")
+
+
 class TestResolveSourceIdAmbiguityDisplay:
     """Test the display format of ambiguous match errors."""
 
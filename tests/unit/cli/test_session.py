@@ -2,12 +2,13 @@
 
 import json
 from datetime import datetime
-from unittest.mock import AsyncMock, patch
+from unittest.mock import AsyncMock, MagicMock, patch
 
 import click
 import pytest
 from click.testing import CliRunner
 
+from notebooklm.cli.helpers import get_context
 from notebooklm.notebooklm_cli import cli
 from notebooklm.types import Notebook
 
@@ -36,10 +37,7 @@ def mock_auth():
 def mock_context_file(tmp_path):
     """Provide a temporary context file for testing context commands."""
     context_file = tmp_path / "context.json"
-    with (
-        patch("notebooklm.cli.helpers.get_context_path", return_value=context_file),
-        patch("notebooklm.cli.session.get_context_path", return_value=context_file),
-    ):
+    with patch("notebooklm.cli.helpers.get_context_path", return_value=context_file):
         yield context_file
 
 
@@ -83,6 +81,54 @@ class TestLoginCommand:
         assert result.exit_code == 1
         assert "Cannot run 'login' when NOTEBOOKLM_AUTH_JSON is set" in result.output
 
+    @pytest.mark.parametrize("no_profile", [False, True])
+    def test_login_browser_context_modes(self, runner, tmp_path, no_profile):
+        """Test --no-profile uses a throwaway context instead of the persistent profile."""
+        import sys
+        import types
+
+        storage_file = tmp_path / "storage_state.json"
+        page = MagicMock()
+        page.url = "https://notebooklm.google.com/"
+        context = MagicMock()
+        context.pages = [page]
+        context.storage_state.side_effect = lambda path: storage_file.write_text("{}")
+        chromium = MagicMock()
+        chromium.launch_persistent_context.return_value = context
+        chromium.launch.return_value.new_context.return_value = context
+        playwright = MagicMock()
+        playwright.__enter__.return_value.chromium = chromium
+
+        sync_api = types.ModuleType("playwright.sync_api")
+        sync_api.sync_playwright = lambda: playwright
+        args = ["login", "--storage", str(storage_file)]
+        if no_profile:
+            args.append("--no-profile")
+
+        with (
+            patch.dict(
+                sys.modules,
+                {"playwright": types.ModuleType("playwright"), "playwright.sync_api": sync_api},
+            ),
+            patch("notebooklm.cli.session._ensure_chromium_installed"),
+            patch(
+                "notebooklm.cli.session.get_browser_profile_dir",
+                return_value=tmp_path / "browser_profile",
+            ),
+            patch("builtins.input", return_value=""),
+        ):
+            result = runner.invoke(cli, args)
+
+        assert result.exit_code == 0, result.output
+        assert storage_file.exists()
+        if no_profile:
+            chromium.launch.assert_called_once()
+            chromium.launch_persistent_context.assert_not_called()
+            assert not (tmp_path / "browser_profile").exists()
+        else:
+            chromium.launch_persistent_context.assert_called_once()
+            chromium.launch.assert_not_called()
+
 
 # =============================================================================
 # USE COMMAND TESTS
@@ -187,6 +233,75 @@ class TestUseCommand:
         assert result.exit_code == 0
         assert "Shared" in result.output or "nb_shared" in result.output
 
+    def test_use_caches_notebook_metadata(self, runner, mock_auth, mock_context_file):
+        """Test a repeat 'use' of the same notebook is served from the cache."""
+        with patch_main_cli_client() as mock_client_cls:
+            mock_client = create_mock_client()
+            mock_client.notebooks.get = AsyncMock(
+                return_value=Notebook(
+                    id="nb_cached",
+                    title="Cached Notebook",
+                    created_at=datetime(2024, 1, 15),
+                    is_owner=True,
+                )
+            )
+            mock_client_cls.return_value = mock_client
+
+            with patch("notebooklm.cli.helpers.fetch_tokens", new_callable=AsyncMock) as mock_fetch:
+                mock_fetch.return_value = ("csrf", "session")
+
+                with patch(
+                    "notebooklm.cli.session.resolve_notebook_id", new_callable=AsyncMock
+                ) as mock_resolve:
+                    mock_resolve.return_value = "nb_cached"
+
+                    first = runner.invoke(cli, ["use", "nb_cached"])
+                    second = runner.invoke(cli, ["use", "nb_cached"])
+
+        assert first.exit_code == 0
+        assert second.exit_code == 0
+        assert "Cached Notebook" in second.output
+        assert mock_fetch.await_count == 1
+        assert mock_client.notebooks.get.await_count == 1
+
+        data = json.loads(mock_context_file.read_text())
+        assert data["notebook_id"] == "nb_cached"
+        assert data["title"] == "Cached Notebook"
+        assert data["notebook_cache"]["nb_cached"]["created_at"] == "2024-01-15"
+
+    def test_use_refetches_expired_cache_entry(self, runner, mock_auth, mock_context_file):
+        """Test an expired cache entry falls back to the API."""
+        mock_context_file.write_text(
+            json.dumps(
+                {
+                    "notebook_id": "nb_old",
+                    "notebook_cache": {
+                        "nb_old": {"title": "Stale Title", "is_owner": True, "fetched_at": 0}
+                    },
+                }
+            )
+        )
+        with patch_main_cli_client() as mock_client_cls:
+            mock_client = create_mock_client()
+            mock_client.notebooks.get = AsyncMock(
+                return_value=Notebook(id="nb_old", title="Fresh Title", is_owner=True)
+            )
+            mock_client_cls.return_value = mock_client
+
+            with patch("notebooklm.cli.helpers.fetch_tokens", new_callable=AsyncMock) as mock_fetch:
+                mock_fetch.return_value = ("csrf", "session")
+
+                with patch(
+                    "notebooklm.cli.session.resolve_notebook_id", new_callable=AsyncMock
+                ) as mock_resolve:
+                    mock_resolve.return_value = "nb_old"
+
+                    result = runner.invoke(cli, ["use", "nb_old"])
+
+        assert result.exit_code == 0
+        assert "Fresh Title" in result.output
+        mock_client.notebooks.get.assert_awaited_once()
+
 
 # =============================================================================
 # STATUS COMMAND TESTS
@@ -695,20 +810,27 @@ class TestSessionEdgeCases:
         assert "Multiple notebooks match" in result.output
 
     def test_status_corrupted_json_with_json_flag(self, runner, mock_context_file):
-        """Test status --json handles corrupted context file gracefully."""
-        # Write invalid JSON but with notebook_id in helpers
+        """Test status --json treats a corrupted context file as no context."""
         mock_context_file.write_text("{ invalid json }")
 
-        # Mock get_current_notebook to return an ID (simulating partial read)
-        with patch("notebooklm.cli.session.get_current_notebook") as mock_get_nb:
-            mock_get_nb.return_value = "nb_corrupted"
+        result = runner.invoke(cli, ["status", "--json"])
 
+        assert result.exit_code == 0
+        output_data = json.loads(result.output)
+        assert output_data["has_context"] is False
+        assert output_data["notebook"] is None
+
+    def test_status_reads_context_file_once(self, runner, mock_context_file):
+        """Test status parses the context file a single time."""
+        mock_context_file.write_text(
+            json.dumps({"notebook_id": "nb_once", "title": "Once", "conversation_id": "conv_1"})
+        )
+
+        with patch("notebooklm.cli.session.get_context", wraps=get_context) as mock_get_context:
             result = runner.invoke(cli, ["status", "--json"])
 
         assert result.exit_code == 0
         output_data = json.loads(result.output)
-        assert output_data["has_context"] is True
-        assert output_data["notebook"]["id"] == "nb_corrupted"
-        # Title and is_owner should be None due to JSONDecodeError
-        assert output_data["notebook"]["title"] is None
-        assert output_data["notebook"]["is_owner"] is None
+        assert output_data["notebook"]["id"] == "nb_once"
+        assert output_data["conversation_id"] == "conv_1"
+        mock_get_context.assert_called_once()
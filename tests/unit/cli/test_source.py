@@ -54,6 +54,32 @@ class TestSourceList:
             assert result.exit_code == 0
             assert "Source One" in result.output or "src_1" in result.output
 
+    def test_source_list_limit(self, runner, mock_auth):
+        with patch_client_for_module("source") as mock_client_cls:
+            mock_client = create_mock_client()
+            mock_client.sources.list = AsyncMock(
+                return_value=[Source(id=f"src_{i}", title=f"Source {i}") for i in range(5)]
+            )
+            mock_client.notebooks.get = AsyncMock(return_value=MagicMock(title="Test Notebook"))
+            mock_client_cls.return_value = mock_client
+
+            with patch("notebooklm.cli.helpers.fetch_tokens", new_callable=AsyncMock) as mock_fetch:
+                mock_fetch.return_value = ("csrf", "session")
+                result = runner.invoke(cli, ["source", "list", "-n", "nb_123", "--limit", "2"])
+                json_result = runner.invoke(
+                    cli, ["source", "list", "-n", "nb_123", "--limit", "2", "--json"]
+                )
+
+            assert result.exit_code == 0
+            assert "Source 1" in result.output
+            assert "Source 2" not in result.output
+            assert "Showing 2 of 5" in result.output
+
+            data = json.loads(json_result.output)
+            assert [src["id"] for src in data["sources"]] == ["src_0", "src_1"]
+            assert data["count"] == 2
+            assert data["total"] == 5
+
     def test_source_list_json_output(self, runner, mock_auth):
         with patch_client_for_module("source") as mock_client_cls:
             mock_client = create_mock_client()
@@ -78,6 +104,7 @@ class TestSourceList:
             assert "sources" in data
             assert data["count"] == 1
             assert data["sources"][0]["id"] == "src_1"
+            assert data["notebook_title"] == "Test Notebook"
 
 
 # =============================================================================
@@ -192,6 +219,66 @@ class TestSourceAdd:
 
             assert result.exit_code == 0
 
+    def test_source_add_autodetects_file(self, runner, mock_auth, tmp_path):
+        test_file = tmp_path / "notes.md"
+        test_file.write_text("# Notes")
+
+        with patch_client_for_module("source") as mock_client_cls:
+            mock_client = create_mock_client()
+            mock_client.sources.add_file = AsyncMock(
+                return_value=Source(id="src_file", title="notes.md")
+            )
+            mock_client_cls.return_value = mock_client
+
+            with patch("notebooklm.cli.helpers.fetch_tokens", new_callable=AsyncMock) as mock_fetch:
+                mock_fetch.return_value = ("csrf", "session")
+                result = runner.invoke(cli, ["source", "add", str(test_file), "-n", "nb_123"])
+                dir_result = runner.invoke(cli, ["source", "add", str(tmp_path), "-n", "nb_123"])
+
+            assert result.exit_code == 0
+            mock_client.sources.add_file.assert_awaited_once()
+            assert dir_result.exit_code == 1
+            assert "Not a regular file" in dir_result.output
+
+    def test_source_add_autodetects_long_inline_text(self, runner, mock_auth):
+        long_text = "word " * 100  # Longer than any filesystem allows for a name
+
+        with patch_client_for_module("source") as mock_client_cls:
+            mock_client = create_mock_client()
+            mock_client.sources.add_text = AsyncMock(
+                return_value=Source(id="src_text", title="Pasted Text")
+            )
+            mock_client_cls.return_value = mock_client
+
+            with patch("notebooklm.cli.helpers.fetch_tokens", new_callable=AsyncMock) as mock_fetch:
+                mock_fetch.return_value = ("csrf", "session")
+                result = runner.invoke(cli, ["source", "add", long_text, "-n", "nb_123"])
+
+            assert result.exit_code == 0
+            mock_client.sources.add_text.assert_awaited_once_with(
+                "nb_123", "Pasted Text", long_text
+            )
+
+    def test_source_add_unreadable_path_is_not_uploaded_as_text(self, runner, mock_auth):
+        with patch_client_for_module("source") as mock_client_cls:
+            mock_client = create_mock_client()
+            mock_client.sources.add_text = AsyncMock()
+            mock_client_cls.return_value = mock_client
+
+            with (
+                patch("notebooklm.cli.helpers.fetch_tokens", new_callable=AsyncMock) as mock_fetch,
+                patch(
+                    "notebooklm.cli.source.os.stat",
+                    side_effect=PermissionError(13, "Permission denied"),
+                ),
+            ):
+                mock_fetch.return_value = ("csrf", "session")
+                result = runner.invoke(cli, ["source", "add", "/secret/doc.md", "-n", "nb_123"])
+
+            assert result.exit_code == 1
+            assert "Cannot access /secret/doc.md: Permission denied" in result.output
+            mock_client.sources.add_text.assert_not_called()
+
     def test_source_add_json_output(self, runner, mock_auth):
         with patch_client_for_module("source") as mock_client_cls:
             mock_client = create_mock_client()
@@ -246,6 +333,27 @@ class TestSourceGet:
             assert "Test Source" in result.output
             assert "src_123" in result.output
 
+    def test_source_get_partial_id_lists_once(self, runner, mock_auth):
+        with patch_client_for_module("source") as mock_client_cls:
+            mock_client = create_mock_client()
+            mock_client.sources.list = AsyncMock(
+                return_value=[
+                    Source(id="src_123", title="Test Source", url="https://example.com"),
+                    Source(id="other_456", title="Other"),
+                ]
+            )
+            mock_client.sources.get = AsyncMock()
+            mock_client_cls.return_value = mock_client
+
+            with patch("notebooklm.cli.helpers.fetch_tokens", new_callable=AsyncMock) as mock_fetch:
+                mock_fetch.return_value = ("csrf", "session")
+                result = runner.invoke(cli, ["source", "get", "src", "-n", "nb_123"])
+
+            assert result.exit_code == 0
+            assert "https://example.com" in result.output
+            mock_client.sources.list.assert_awaited_once()
+            mock_client.sources.get.assert_not_called()
+
     def test_source_get_not_found(self, runner, mock_auth):
         with patch_client_for_module("source") as mock_client_cls:
             mock_client = create_mock_client()
@@ -287,6 +395,26 @@ class TestSourceDelete:
             assert "Deleted source" in result.output
             mock_client.sources.delete.assert_called_once_with("nb_123", "src_123")
 
+    def test_source_delete_non_interactive_requires_yes(self, runner, mock_auth):
+        with patch_client_for_module("source") as mock_client_cls:
+            mock_client = create_mock_client()
+            mock_client.sources.list = AsyncMock(
+                return_value=[Source(id="src_123", title="Test Source")]
+            )
+            mock_client.sources.delete = AsyncMock(return_value=True)
+            mock_client_cls.return_value = mock_client
+
+            with patch("notebooklm.cli.helpers.fetch_tokens", new_callable=AsyncMock) as mock_fetch:
+                mock_fetch.return_value = ("csrf", "session")
+                # CliRunner's stdin is not a TTY, like a piped script
+                result = runner.invoke(
+                    cli, ["source", "delete", "src_123", "-n", "nb_123"], input="y\n"
+                )
+
+            assert result.exit_code == 1
+            assert "--yes" in result.output
+            mock_client.sources.delete.assert_not_called()
+
     def test_source_delete_failure(self, runner, mock_auth):
         with patch_client_for_module("source") as mock_client_cls:
             mock_client = create_mock_client()
@@ -370,8 +370,6 @@ class TestDownloadUrl:
         with tempfile.TemporaryDirectory() as tmpdir:
             output_path = os.path.join(tmpdir, "file.mp4")
 
-            import httpx as real_httpx
-
             # Mock streaming response with aiter_bytes
             content = b"fake video content"
 
@@ -385,19 +383,14 @@ class TestDownloadUrl:
             mock_response.__aenter__ = AsyncMock(return_value=mock_response)
             mock_response.__aexit__ = AsyncMock(return_value=None)
 
-            mock_client = AsyncMock()
+            mock_client = MagicMock()
             mock_client.stream = MagicMock(return_value=mock_response)
-            mock_client.__aenter__ = AsyncMock(return_value=mock_client)
-            mock_client.__aexit__ = AsyncMock(return_value=None)
+            mock_core.get_download_client = MagicMock(return_value=mock_client)
 
-            mock_cookies = MagicMock()
-            with (
-                patch.object(real_httpx, "AsyncClient", return_value=mock_client),
-                patch("notebooklm._artifacts.load_httpx_cookies", return_value=mock_cookies),
-            ):
-                result = await api._download_url("https://other.example.com/file.mp4", output_path)
+            result = await api._download_url("https://other.example.com/file.mp4", output_path)
 
             assert result == output_path
+            mock_client.stream.assert_called_once_with("GET", "https://other.example.com/file.mp4")
             # Verify file was written with streaming content
             with open(output_path, "rb") as f:
                 assert f.read() == content
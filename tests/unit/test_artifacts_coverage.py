@@ -272,6 +272,26 @@ class TestWaitForCompletion:
         assert result.status == "pending"
         assert result.task_id == "task_123"
 
+    @pytest.mark.asyncio
+    async def test_poll_statuses_uses_one_list_call(self, mock_artifacts_api):
+        """Test poll_statuses checks every task against a single listing."""
+        api, mock_core = mock_artifacts_api
+
+        mock_core.rpc_call.return_value = [
+            [
+                ["task_a", "Report", 2, None, 3],  # REPORT, COMPLETED
+                ["task_b", "Quiz", 4, None, 1],  # QUIZ, PROCESSING
+            ]
+        ]
+
+        result = await api.poll_statuses("nb_123", ["task_b", "missing", "task_a"])
+
+        assert mock_core.rpc_call.await_count == 1
+        assert list(result) == ["task_b", "missing", "task_a"]
+        assert result["task_a"].status == "completed"
+        assert result["task_b"].status == "in_progress"
+        assert result["missing"].status == "pending"
+
 
 # =============================================================================
 # TIER 1: _parse_generation_result tests (lines 1423-1457)
@@ -187,7 +187,7 @@ class TestLoadAuthFromStorage:
 
     def test_raises_if_file_not_found(self, tmp_path):
         """Test raises error if storage file doesn't exist."""
-        with pytest.raises(FileNotFoundError):
+        with pytest.raises(FileNotFoundError, match="notebooklm login"):
             load_auth_from_storage(tmp_path / "nonexistent.json")
 
     def test_raises_if_invalid_json(self, tmp_path):
@@ -70,6 +70,51 @@ class TestClientContextManager:
         # After exiting context
         assert client.is_connected is False
 
+    @pytest.mark.asyncio
+    async def test_connection_kept_alive_between_polls(self, mock_auth):
+        """Idle connections outlive httpx's 5s default so polling reuses them."""
+        from notebooklm._core import CONNECT_RETRIES, KEEPALIVE_EXPIRY, MAX_KEEPALIVE_CONNECTIONS
+
+        with patch(
+            "notebooklm._core.httpx.AsyncHTTPTransport", wraps=httpx.AsyncHTTPTransport
+        ) as mock_transport:
+            async with NotebookLMClient(mock_auth):
+                pass
+
+        kwargs = mock_transport.call_args.kwargs
+        assert kwargs["limits"].keepalive_expiry == KEEPALIVE_EXPIRY
+        assert kwargs["limits"].max_keepalive_connections == MAX_KEEPALIVE_CONNECTIONS
+        assert kwargs["retries"] == CONNECT_RETRIES
+
+    @pytest.mark.asyncio
+    async def test_http2_follows_h2_availability(self, mock_auth):
+        """HTTP/2 is negotiated only when the optional h2 package is installed."""
+        from notebooklm._core import HTTP2_AVAILABLE
+
+        with patch(
+            "notebooklm._core.httpx.AsyncHTTPTransport", wraps=httpx.AsyncHTTPTransport
+        ) as mock_transport:
+            async with NotebookLMClient(mock_auth):
+                pass
+
+        assert mock_transport.call_args.kwargs["http2"] is HTTP2_AVAILABLE
+
+    @pytest.mark.asyncio
+    async def test_download_client_shared_and_closed(self, mock_auth):
+        """Media downloads reuse one client, which is closed with the client."""
+        with patch("notebooklm._core.load_httpx_cookies", return_value=httpx.Cookies()):
+            async with NotebookLMClient(mock_auth) as client:
+                download_client = client._core.get_download_client()
+                assert client._core.get_download_client() is download_client
+
+        assert download_client.is_closed
+        assert client._core._download_client is None
+
+        # A closed core must not create a client nothing would close
+        with pytest.raises(RuntimeError, match="not initialized"):
+            client._core.get_download_client()
+        assert client._core._download_client is None
+
     @pytest.mark.asyncio
     async def test_context_manager_closes_on_exception(self, mock_auth):
         """Test connection is closed even when exception occurs."""
@@ -706,3 +751,74 @@ class TestRpcCallAutoRetry:
         assert refresh_count[0] == 1, (
             f"Refresh should be called exactly once, got {refresh_count[0]}"
         )
+
+
+# =============================================================================
+# PACKAGE EXPORTS
+# =============================================================================
+
+
+class TestLazyPackageExports:
+    def test_public_names_resolve(self):
+        import notebooklm
+
+        for name in notebooklm.__all__:
+            if name == "StudioContentType":
+                continue
+            assert getattr(notebooklm, name) is not None
+
+        assert notebooklm.NotebookLMClient is NotebookLMClient
+        assert notebooklm.AuthTokens is AuthTokens
+        assert "NotebookLMClient" in dir(notebooklm)
+
+    def test_public_name_lists_agree(self):
+        """__all__, _LAZY_MODULES and the TYPE_CHECKING imports stay in sync."""
+        import ast
+        import inspect
+
+        import notebooklm
+
+        # Names imported under `if TYPE_CHECKING:`, keyed to their module
+        type_checking_imports = {}
+        for node in ast.parse(inspect.getsource(notebooklm)).body:
+            if isinstance(node, ast.If) and getattr(node.test, "id", None) == "TYPE_CHECKING":
+                for stmt in node.body:
+                    if isinstance(stmt, ast.ImportFrom):
+                        module = "." * stmt.level + (stmt.module or "")
+                        for alias in stmt.names:
+                            type_checking_imports[alias.name] = module
+
+        assert type_checking_imports == notebooklm._LAZY_MODULES
+        assert len(notebooklm.__all__) == len(set(notebooklm.__all__))
+        assert set(notebooklm.__all__) == set(notebooklm._LAZY_MODULES) | {
+            "__version__",
+            "StudioContentType",
+        }
+
+    def test_unknown_name_raises_attribute_error(self):
+        import notebooklm
+
+        with pytest.raises(AttributeError):
+            _ = notebooklm.DoesNotExist
+
+    def test_submodule_import_skips_client(self):
+        import subprocess
+        import sys
+
+        code = (
+            "import sys, notebooklm.paths; sys.exit(1 if 'notebooklm.client' in sys.modules else 0)"
+        )
+        result = subprocess.run([sys.executable, "-c", code], capture_output=True)
+        assert result.returncode == 0
+
+    def test_cli_import_skips_client(self):
+        import subprocess
+        import sys
+
+        # --help, completion and usage errors never construct a client
+        code = (
+            "import sys, notebooklm.notebooklm_cli; "
+            "sys.exit(1 if 'notebooklm.client' in sys.modules else 0)"
+        )
+        result = subprocess.run([sys.executable, "-c", code], capture_output=True)
+        assert result.returncode == 0
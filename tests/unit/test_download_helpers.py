@@ -2,7 +2,11 @@
 
 import pytest
 
-from notebooklm.cli.download_helpers import artifact_title_to_filename, select_artifact
+from notebooklm.cli.download_helpers import (
+    artifact_title_to_filename,
+    artifact_titles_to_filenames,
+    select_artifact,
+)
 
 
 class TestSelectArtifact:
@@ -187,3 +191,14 @@ class TestArtifactTitleToFilename:
         # Should not exceed filesystem limits
         assert len(result) <= 255
         assert result.endswith(" (2).mp3")
+
+
+class TestArtifactTitlesToFilenames:
+    def test_duplicates_numbered_in_order(self):
+        """Should number repeated titles the way sequential downloads would."""
+        result = artifact_titles_to_filenames(["Intro", "Intro", "Other", "Intro"], ".mp3")
+        assert result == ["Intro.mp3", "Intro (2).mp3", "Other.mp3", "Intro (3).mp3"]
+
+    def test_sanitizes_each_title(self):
+        """Should apply the same sanitization as the single-title helper."""
+        assert artifact_titles_to_filenames(["a/b", "..."], ".pdf") == ["a_b.pdf", "untitled.pdf"]
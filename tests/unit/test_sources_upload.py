@@ -14,6 +14,8 @@ def mock_core():
     core.rpc_call = AsyncMock()
     core.auth = MagicMock()
     core.auth.cookie_header = "SID=test_sid; HSID=test_hsid"
+    # Shared pooled HTTP client used for upload requests
+    core.get_http_client.return_value = AsyncMock()
     return core
 
 
@@ -168,16 +170,10 @@ class TestStartResumableUpload:
         mock_response = MagicMock()
         mock_response.headers = {"x-goog-upload-url": "https://upload.example.com/session123"}
 
-        with patch("httpx.AsyncClient") as mock_client_cls:
-            mock_client = AsyncMock()
-            mock_client.__aenter__.return_value = mock_client
-            mock_client.__aexit__.return_value = None
-            mock_client.post.return_value = mock_response
-            mock_client_cls.return_value = mock_client
+        mock_client = mock_core.get_http_client.return_value
+        mock_client.post.return_value = mock_response
 
-            result = await sources_api._start_resumable_upload(
-                "nb_123", "test.pdf", 1024, "src_456"
-            )
+        result = await sources_api._start_resumable_upload("nb_123", "test.pdf", 1024, "src_456")
 
         assert result == "https://upload.example.com/session123"
 
@@ -187,22 +183,18 @@ class TestStartResumableUpload:
         mock_response = MagicMock()
         mock_response.headers = {"x-goog-upload-url": "https://upload.example.com"}
 
-        with patch("httpx.AsyncClient") as mock_client_cls:
-            mock_client = AsyncMock()
-            mock_client.__aenter__.return_value = mock_client
-            mock_client.__aexit__.return_value = None
-            mock_client.post.return_value = mock_response
-            mock_client_cls.return_value = mock_client
+        mock_client = mock_core.get_http_client.return_value
+        mock_client.post.return_value = mock_response
 
-            await sources_api._start_resumable_upload("nb_123", "test.pdf", 2048, "src_789")
+        await sources_api._start_resumable_upload("nb_123", "test.pdf", 2048, "src_789")
 
-            call_kwargs = mock_client.post.call_args[1]
-            headers = call_kwargs["headers"]
+        call_kwargs = mock_client.post.call_args[1]
+        headers = call_kwargs["headers"]
 
-            assert headers["x-goog-upload-command"] == "start"
-            assert headers["x-goog-upload-header-content-length"] == "2048"
-            assert headers["x-goog-upload-protocol"] == "resumable"
-            assert "Cookie" in headers
+        assert headers["x-goog-upload-command"] == "start"
+        assert headers["x-goog-upload-header-content-length"] == "2048"
+        assert headers["x-goog-upload-protocol"] == "resumable"
+        assert "Cookie" in headers
 
     @pytest.mark.asyncio
     async def test_start_resumable_upload_includes_json_body(self, sources_api, mock_core):
@@ -212,21 +204,17 @@ class TestStartResumableUpload:
         mock_response = MagicMock()
         mock_response.headers = {"x-goog-upload-url": "https://upload.example.com"}
 
-        with patch("httpx.AsyncClient") as mock_client_cls:
-            mock_client = AsyncMock()
-            mock_client.__aenter__.return_value = mock_client
-            mock_client.__aexit__.return_value = None
-            mock_client.post.return_value = mock_response
-            mock_client_cls.return_value = mock_client
+        mock_client = mock_core.get_http_client.return_value
+        mock_client.post.return_value = mock_response
 
-            await sources_api._start_resumable_upload("nb_test", "myfile.pdf", 1000, "src_abc")
+        await sources_api._start_resumable_upload("nb_test", "myfile.pdf", 1000, "src_abc")
 
-            call_kwargs = mock_client.post.call_args[1]
-            body = json.loads(call_kwargs["content"])
+        call_kwargs = mock_client.post.call_args[1]
+        body = json.loads(call_kwargs["content"])
 
-            assert body["PROJECT_ID"] == "nb_test"
-            assert body["SOURCE_NAME"] == "myfile.pdf"
-            assert body["SOURCE_ID"] == "src_abc"
+        assert body["PROJECT_ID"] == "nb_test"
+        assert body["SOURCE_NAME"] == "myfile.pdf"
+        assert body["SOURCE_ID"] == "src_abc"
 
     @pytest.mark.asyncio
     async def test_start_resumable_upload_raises_on_missing_url_header(
@@ -238,32 +226,24 @@ class TestStartResumableUpload:
         mock_response = MagicMock()
         mock_response.headers = {}  # No x-goog-upload-url
 
-        with patch("httpx.AsyncClient") as mock_client_cls:
-            mock_client = AsyncMock()
-            mock_client.__aenter__.return_value = mock_client
-            mock_client.__aexit__.return_value = None
-            mock_client.post.return_value = mock_response
-            mock_client_cls.return_value = mock_client
+        mock_client = mock_core.get_http_client.return_value
+        mock_client.post.return_value = mock_response
 
-            with pytest.raises(SourceAddError, match="Failed to get upload URL"):
-                await sources_api._start_resumable_upload("nb_123", "test.pdf", 1024, "src_456")
+        with pytest.raises(SourceAddError, match="Failed to get upload URL"):
+            await sources_api._start_resumable_upload("nb_123", "test.pdf", 1024, "src_456")
 
     @pytest.mark.asyncio
     async def test_start_resumable_upload_raises_on_http_error(self, sources_api, mock_core):
         """Test that HTTP error raises exception."""
         import httpx
 
-        with patch("httpx.AsyncClient") as mock_client_cls:
-            mock_client = AsyncMock()
-            mock_client.__aenter__.return_value = mock_client
-            mock_client.__aexit__.return_value = None
-            mock_client.post.side_effect = httpx.HTTPStatusError(
-                "Server Error", request=MagicMock(), response=MagicMock()
-            )
-            mock_client_cls.return_value = mock_client
+        mock_client = mock_core.get_http_client.return_value
+        mock_client.post.side_effect = httpx.HTTPStatusError(
+            "Server Error", request=MagicMock(), response=MagicMock()
+        )
 
-            with pytest.raises(httpx.HTTPStatusError):
-                await sources_api._start_resumable_upload("nb_123", "test.pdf", 1024, "src_456")
+        with pytest.raises(httpx.HTTPStatusError):
+            await sources_api._start_resumable_upload("nb_123", "test.pdf", 1024, "src_456")
 
 
 # =============================================================================
@@ -281,19 +261,13 @@ class TestUploadFileStreaming:
         test_file.write_bytes(b"file content here")
         mock_response = MagicMock()
 
-        with patch("httpx.AsyncClient") as mock_client_cls:
-            mock_client = AsyncMock()
-            mock_client.__aenter__.return_value = mock_client
-            mock_client.__aexit__.return_value = None
-            mock_client.post.return_value = mock_response
-            mock_client_cls.return_value = mock_client
+        mock_client = mock_core.get_http_client.return_value
+        mock_client.post.return_value = mock_response
 
-            # Should not raise
-            await sources_api._upload_file_streaming(
-                "https://upload.example.com/session", test_file
-            )
+        # Should not raise
+        await sources_api._upload_file_streaming("https://upload.example.com/session", test_file)
 
-            mock_client.post.assert_called_once()
+        mock_client.post.assert_called_once()
 
     @pytest.mark.asyncio
     async def test_upload_file_streaming_includes_correct_headers(
@@ -304,23 +278,17 @@ class TestUploadFileStreaming:
         test_file.write_bytes(b"content")
         mock_response = MagicMock()
 
-        with patch("httpx.AsyncClient") as mock_client_cls:
-            mock_client = AsyncMock()
-            mock_client.__aenter__.return_value = mock_client
-            mock_client.__aexit__.return_value = None
-            mock_client.post.return_value = mock_response
-            mock_client_cls.return_value = mock_client
+        mock_client = mock_core.get_http_client.return_value
+        mock_client.post.return_value = mock_response
 
-            await sources_api._upload_file_streaming(
-                "https://upload.example.com/session", test_file
-            )
+        await sources_api._upload_file_streaming("https://upload.example.com/session", test_file)
 
-            call_kwargs = mock_client.post.call_args[1]
-            headers = call_kwargs["headers"]
+        call_kwargs = mock_client.post.call_args[1]
+        headers = call_kwargs["headers"]
 
-            assert headers["x-goog-upload-command"] == "upload, finalize"
-            assert headers["x-goog-upload-offset"] == "0"
-            assert "Cookie" in headers
+        assert headers["x-goog-upload-command"] == "upload, finalize"
+        assert headers["x-goog-upload-offset"] == "0"
+        assert "Cookie" in headers
 
     @pytest.mark.asyncio
     async def test_upload_file_streaming_uses_generator(self, sources_api, mock_core, tmp_path):
@@ -330,21 +298,77 @@ class TestUploadFileStreaming:
         test_file.write_bytes(test_content)
         mock_response = MagicMock()
 
-        with patch("httpx.AsyncClient") as mock_client_cls:
-            mock_client = AsyncMock()
-            mock_client.__aenter__.return_value = mock_client
-            mock_client.__aexit__.return_value = None
-            mock_client.post.return_value = mock_response
-            mock_client_cls.return_value = mock_client
+        mock_client = mock_core.get_http_client.return_value
+        mock_client.post.return_value = mock_response
 
+        await sources_api._upload_file_streaming("https://upload.example.com", test_file)
+
+        call_kwargs = mock_client.post.call_args[1]
+        # Content should be a generator, not bytes
+        content = call_kwargs["content"]
+        # Consume the generator to verify it yields the file content
+        chunks = [chunk async for chunk in content]
+        assert b"".join(chunks) == test_content
+
+    @pytest.mark.asyncio
+    async def test_upload_file_streaming_sets_content_length(
+        self, sources_api, mock_core, tmp_path
+    ):
+        """Test that the upload declares the file size instead of chunked encoding."""
+        test_file = tmp_path / "test.txt"
+        test_file.write_bytes(b"x" * 1234)
+
+        mock_client = mock_core.get_http_client.return_value
+        mock_client.post.return_value = MagicMock()
+
+        await sources_api._upload_file_streaming("https://upload.example.com", test_file)
+
+        headers = mock_client.post.call_args[1]["headers"]
+        assert headers["Content-Length"] == "1234"
+
+    @pytest.mark.asyncio
+    async def test_upload_file_streaming_uses_large_chunks_for_big_files(
+        self, sources_api, mock_core, tmp_path
+    ):
+        """Test that files above the threshold are streamed in larger chunks."""
+        from notebooklm import _sources
+
+        test_file = tmp_path / "big.bin"
+        test_file.write_bytes(b"x" * 4096)
+
+        mock_client = mock_core.get_http_client.return_value
+        mock_client.post.return_value = MagicMock()
+        with (
+            patch.object(_sources, "LARGE_UPLOAD_THRESHOLD", 1024),
+            patch.object(_sources, "LARGE_UPLOAD_CHUNK_SIZE", 2048),
+        ):
             await sources_api._upload_file_streaming("https://upload.example.com", test_file)
 
-            call_kwargs = mock_client.post.call_args[1]
-            # Content should be a generator, not bytes
-            content = call_kwargs["content"]
-            # Consume the generator to verify it yields the file content
+            content = mock_client.post.call_args[1]["content"]
             chunks = [chunk async for chunk in content]
-            assert b"".join(chunks) == test_content
+            assert [len(c) for c in chunks] == [2048, 2048]
+
+    @pytest.mark.asyncio
+    async def test_upload_file_streaming_reads_off_event_loop(
+        self, sources_api, mock_core, tmp_path
+    ):
+        """Test that file reads are dispatched to a worker thread."""
+        import asyncio
+
+        test_file = tmp_path / "test.txt"
+        test_file.write_bytes(b"content")
+
+        mock_client = mock_core.get_http_client.return_value
+        mock_client.post.return_value = MagicMock()
+        with patch("asyncio.to_thread", wraps=asyncio.to_thread) as mock_to_thread:
+            await sources_api._upload_file_streaming("https://upload.example.com", test_file)
+
+            content = mock_client.post.call_args[1]["content"]
+            chunks = [chunk async for chunk in content]
+
+        assert b"".join(chunks) == b"content"
+        # open + one read per chunk, no trailing EOF read
+        assert mock_to_thread.call_count == 2
 
     @pytest.mark.asyncio
     async def test_upload_file_streaming_raises_on_http_error(
@@ -356,17 +380,13 @@ class TestUploadFileStreaming:
         test_file = tmp_path / "test.txt"
         test_file.write_bytes(b"content")
 
-        with patch("httpx.AsyncClient") as mock_client_cls:
-            mock_client = AsyncMock()
-            mock_client.__aenter__.return_value = mock_client
-            mock_client.__aexit__.return_value = None
-            mock_client.post.side_effect = httpx.HTTPStatusError(
-                "Upload Failed", request=MagicMock(), response=MagicMock()
-            )
-            mock_client_cls.return_value = mock_client
+        mock_client = mock_core.get_http_client.return_value
+        mock_client.post.side_effect = httpx.HTTPStatusError(
+            "Upload Failed", request=MagicMock(), response=MagicMock()
+        )
 
-            with pytest.raises(httpx.HTTPStatusError):
-                await sources_api._upload_file_streaming("https://upload.example.com", test_file)
+        with pytest.raises(httpx.HTTPStatusError):
+            await sources_api._upload_file_streaming("https://upload.example.com", test_file)
 
 
 # =============================================================================
@@ -393,14 +413,10 @@ class TestAddFile:
 
         mock_upload_response = MagicMock()
 
-        with patch("httpx.AsyncClient") as mock_client_cls:
-            mock_client = AsyncMock()
-            mock_client.__aenter__.return_value = mock_client
-            mock_client.__aexit__.return_value = None
-            mock_client.post.side_effect = [mock_start_response, mock_upload_response]
-            mock_client_cls.return_value = mock_client
+        mock_client = mock_core.get_http_client.return_value
+        mock_client.post.side_effect = [mock_start_response, mock_upload_response]
 
-            result = await sources_api.add_file("nb_123", str(test_file))
+        result = await sources_api.add_file("nb_123", str(test_file))
 
         assert result.id == "src_new_123"
         assert result.title == "test.pdf"
@@ -424,14 +440,10 @@ class TestAddFile:
         mock_start_response.headers = {"x-goog-upload-url": "https://upload.example.com"}
         mock_upload_response = MagicMock()
 
-        with patch("httpx.AsyncClient") as mock_client_cls:
-            mock_client = AsyncMock()
-            mock_client.__aenter__.return_value = mock_client
-            mock_client.__aexit__.return_value = None
-            mock_client.post.side_effect = [mock_start_response, mock_upload_response]
-            mock_client_cls.return_value = mock_client
+        mock_client = mock_core.get_http_client.return_value
+        mock_client.post.side_effect = [mock_start_response, mock_upload_response]
 
-            result = await sources_api.add_file("nb_123", test_file)  # Path object
+        result = await sources_api.add_file("nb_123", test_file)  # Path object
 
         assert result.id == "src_txt"
         assert result.title == "doc.txt"